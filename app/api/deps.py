@@ -0,0 +1,80 @@
+from typing import Optional
+
+from fastapi import Depends, Request
+from tronpy import AsyncTron
+
+from app.core import get_tron_client
+from app.services import TronService, AddressInfoCache, CircuitBreaker, HistoryWriter, WatchlistPoller
+
+
+def get_address_cache(request: Request) -> Optional[AddressInfoCache]:
+    """
+    Зависимость для FastAPI, которая предоставляет общий кеш адресов.
+
+    Args:
+        request: HTTP-запрос
+
+    Returns:
+        Optional[AddressInfoCache]: Кеш адресов или None, если кеширование отключено
+    """
+    return request.app.state.address_cache
+
+
+def get_circuit_breaker(request: Request) -> Optional[CircuitBreaker]:
+    """
+    Зависимость для FastAPI, которая предоставляет общий выключатель запросов к TRON API.
+
+    Args:
+        request: HTTP-запрос
+
+    Returns:
+        Optional[CircuitBreaker]: Выключатель или None, если он отключен
+    """
+    return request.app.state.tron_breaker
+
+
+def get_tron_service(
+        request: Request,
+        client: AsyncTron = Depends(get_tron_client),
+        cache: Optional[AddressInfoCache] = Depends(get_address_cache),
+        breaker: Optional[CircuitBreaker] = Depends(get_circuit_breaker)
+) -> TronService:
+    """
+    Зависимость для FastAPI, которая предоставляет сервис TRON.
+
+    Args:
+        request: HTTP-запрос
+        client: Общий клиент TRON API
+        cache: Общий кеш адресов
+        breaker: Общий выключатель запросов к TRON API
+
+    Returns:
+        TronService: Сервис для работы с TRON API
+    """
+    return TronService(client, cache, breaker=breaker, retry_policy=request.app.state.tron_retry_policy)
+
+
+def get_history_writer(request: Request) -> Optional[HistoryWriter]:
+    """
+    Зависимость для FastAPI, которая предоставляет очередь отложенной записи истории.
+
+    Args:
+        request: HTTP-запрос
+
+    Returns:
+        Optional[HistoryWriter]: Очередь записи или None, если запись синхронная
+    """
+    return request.app.state.history_writer
+
+
+def get_watchlist_poller(request: Request) -> Optional[WatchlistPoller]:
+    """
+    Зависимость для FastAPI, которая предоставляет фоновый опрос списка отслеживания.
+
+    Args:
+        request: HTTP-запрос
+
+    Returns:
+        Optional[WatchlistPoller]: Опрос списка или None, если он отключен
+    """
+    return request.app.state.watchlist_poller
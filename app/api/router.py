@@ -1,7 +1,8 @@
 from fastapi import APIRouter
 
-from .v1 import tron_router
+from .v1 import tron_router, watchlist_router
 
 api_router = APIRouter()
 
-api_router.include_router(tron_router, prefix="/v1/tron", tags=["tron"])
\ No newline at end of file
+api_router.include_router(tron_router, prefix="/v1/tron", tags=["tron"])
+api_router.include_router(watchlist_router, prefix="/v1/watchlist", tags=["watchlist"])
\ No newline at end of file
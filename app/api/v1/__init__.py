@@ -1,3 +1,4 @@
 from .tron import router as tron_router
+from .watchlist import router as watchlist_router
 
-__all__ = ["tron_router"]
\ No newline at end of file
+__all__ = ["tron_router", "watchlist_router"]
\ No newline at end of file
@@ -1,18 +1,41 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import Any
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from tronpy import AsyncTron
+from typing import Any, Dict, Literal, Optional, Union
 
-from app.core.db import get_db
+from app.api.deps import get_tron_service, get_address_cache, get_history_writer, get_circuit_breaker
+from app.core import get_tron_client
+from app.core.db import get_db, get_session_factory
 from app.schemas import (
     AddressRequest,
     TronAddressInfo,
     AddressQueryResponse,
     PaginationParams,
-    PaginatedResponse
+    PaginatedResponse,
+    CursorParams,
+    CursorPaginatedResponse,
+    CacheStats,
+    BatchAddressRequest,
+    BatchAddressResponse,
+    HistoryWriterStats,
+    TronNodePoolStats,
+    CircuitBreakerStats,
+    RateLimiterStats,
+    history_item
+)
+from app.services import (
+    TronService,
+    AddressInfoCache,
+    CircuitBreaker,
+    HistoryWriter,
+    export_history,
+    EXPORT_MEDIA_TYPES
 )
-from app.services import TronService
 from app.repositories import AddressRepository
-from app.utils import log
+from app.config import settings
+from app.utils import log, request_log
 from app.exceptions import (
     BaseAppException,
     TronAPIException,
@@ -25,17 +48,38 @@ from app.exceptions import (
 router = APIRouter()
 
 
+def _history_response(result: Dict[str, Any]) -> ORJSONResponse:
+    """
+    Формирует ответ со страницей истории.
+
+    Элементы строятся напрямую из строк колонок истории и сразу
+    сериализуются orjson, без повторной валидации через response_model
+    (схема ответа остается в документации OpenAPI).
+
+    Args:
+        result: Страница истории из AddressRepository
+
+    Returns:
+        ORJSONResponse: JSON-ответ со страницей истории
+    """
+    return ORJSONResponse({**result, "items": [history_item(row) for row in result["items"]]})
+
+
 @router.post("/address", response_model=TronAddressInfo)
 async def get_address_info(
         request: AddressRequest,
-        db: Session = Depends(get_db)
+        db: AsyncSession = Depends(get_db),
+        tron_service: TronService = Depends(get_tron_service),
+        history_writer: Optional[HistoryWriter] = Depends(get_history_writer)
 ) -> Any:
     """
     Получение информации о TRON-адресе и сохранение запроса в БД.
 
     Args:
         request: Данные запроса с адресом
-        db: Сессия БД
+        db: Асинхронная сессия БД
+        tron_service: Сервис TRON с общим клиентом
+        history_writer: Очередь отложенной записи истории (None - запись сразу)
 
     Returns:
         TronAddressInfo: Информация о адресе
@@ -45,74 +89,347 @@ async def get_address_info(
     """
     try:
         # Получаем информацию о адресе
-        tron_service = TronService()
-        address_info = await tron_service.get_address_info(request.address)
+        address_info = await tron_service.get_cached_address_info(request.address, use_cache=request.use_cache)
 
-        # Сохраняем запрос в БД
-        repository = AddressRepository(db)
-        repository.create(address_info)
+        # Сохраняем запрос в БД (сразу или через очередь отложенной записи)
+        if history_writer is not None:
+            await history_writer.enqueue(address_info)
+        else:
+            repository = AddressRepository(db)
+            await repository.create(address_info)
 
-        log.info(f"Информация о адресе {request.address} успешно получена и сохранена")
+        request_log.info("Информация о адресе {} успешно получена и сохранена", request.address)
         return address_info
     except TronAddressNotFoundException as e:
-        log.warning(f"Адрес не найден: {str(e)}")
+        log.warning("Адрес не найден: {}", e)
         raise e.to_http_exception()
     except TronNetworkException as e:
-        log.error(f"Ошибка сети TRON: {str(e)}")
+        log.error("Ошибка сети TRON: {}", e)
         raise e.to_http_exception()
     except TronAPIException as e:
-        log.error(f"Ошибка TRON API: {str(e)}")
+        log.error("Ошибка TRON API: {}", e)
         raise e.to_http_exception()
     except DatabaseOperationError as e:
-        log.error(f"Ошибка БД при сохранении запроса: {str(e)}")
+        log.error("Ошибка БД при сохранении запроса: {}", e)
         raise e.to_http_exception()
     except BaseAppException as e:
-        log.error(f"Ошибка приложения: {str(e)}")
+        log.error("Ошибка приложения: {}", e)
         raise e.to_http_exception()
     except Exception as e:
-        log.error(f"Неожиданная ошибка при обработке запроса: {str(e)}")
+        log.error("Неожиданная ошибка при обработке запроса: {}", e)
         raise HTTPException(
             status_code=500,
             detail={"message": f"Неожиданная ошибка при получении информации о адресе: {str(e)}"}
         )
 
 
-@router.get("/history", response_model=PaginatedResponse[AddressQueryResponse])
+@router.post("/address/batch", response_model=BatchAddressResponse)
+async def get_address_info_batch(
+        request: BatchAddressRequest,
+        db: AsyncSession = Depends(get_db),
+        tron_service: TronService = Depends(get_tron_service),
+        history_writer: Optional[HistoryWriter] = Depends(get_history_writer)
+) -> Any:
+    """
+    Пакетное получение информации о TRON-адресах и сохранение запросов в БД.
+
+    Ошибка по отдельному адресу попадает в результат и не прерывает пакет.
+    Все успешные запросы сохраняются одной пакетной вставкой.
+
+    Args:
+        request: Данные запроса со списком адресов
+        db: Асинхронная сессия БД
+        tron_service: Сервис TRON с общим клиентом
+        history_writer: Очередь отложенной записи истории (None - запись сразу)
+
+    Returns:
+        BatchAddressResponse: Результаты по каждому адресу
+
+    Raises:
+        HTTPException: При ошибке сохранения результатов
+    """
+    try:
+        results = await tron_service.get_many_address_info(
+            request.addresses,
+            concurrency=settings.BATCH_CONCURRENCY,
+            use_cache=request.use_cache
+        )
+
+        items = []
+        succeeded = []
+        for address, result in zip(request.addresses, results):
+            if isinstance(result, BaseAppException):
+                items.append({
+                    "address": address,
+                    "error": {"message": result.message, "status_code": result.status_code}
+                })
+            else:
+                items.append({"address": address, "data": result})
+                succeeded.append(result)
+
+        # Сохраняем все успешные запросы одной вставкой
+        if history_writer is not None:
+            await history_writer.enqueue_many(succeeded)
+        else:
+            repository = AddressRepository(db)
+            await repository.bulk_create(succeeded)
+
+        request_log.info("Пакетный запрос обработан: {} успешно, {} с ошибкой", len(succeeded), len(items) - len(succeeded))
+        return {
+            "items": items,
+            "succeeded": len(succeeded),
+            "failed": len(items) - len(succeeded)
+        }
+    except DatabaseOperationError as e:
+        log.error("Ошибка БД при сохранении пакета запросов: {}", e)
+        raise e.to_http_exception()
+    except BaseAppException as e:
+        log.error("Ошибка приложения: {}", e)
+        raise e.to_http_exception()
+    except Exception as e:
+        log.error("Неожиданная ошибка при обработке пакетного запроса: {}", e)
+        raise HTTPException(
+            status_code=500,
+            detail={"message": f"Неожиданная ошибка при пакетном получении информации о адресах: {str(e)}"}
+        )
+
+
+@router.get(
+    "/history",
+    response_model=Union[PaginatedResponse[AddressQueryResponse], CursorPaginatedResponse[AddressQueryResponse]]
+)
 async def get_address_history(
         pagination: PaginationParams = Depends(),
-        db: Session = Depends(get_db)
+        cursor: Optional[str] = Query(None, description="Курсор следующей страницы (включает режим cursor)"),
+        mode: Literal["offset", "cursor"] = Query("offset", description="Режим пагинации: offset или cursor"),
+        db: AsyncSession = Depends(get_db)
 ) -> Any:
     """
     Получение истории запросов с пагинацией.
 
+    В режиме offset возвращаются номера страниц и общее количество записей,
+    в режиме cursor - курсор следующей страницы (keyset-пагинация).
+
     Args:
         pagination: Параметры пагинации
-        db: Сессия БД
+        cursor: Курсор следующей страницы
+        mode: Режим пагинации
+        db: Асинхронная сессия БД
 
     Returns:
-        PaginatedResponse: Список записей с пагинацией
+        PaginatedResponse | CursorPaginatedResponse: Список записей с пагинацией
 
     Raises:
         HTTPException: При ошибке получения истории запросов
     """
     try:
         repository = AddressRepository(db)
-        result = repository.get_history(pagination)
 
-        log.info(f"Получена история запросов (страница {pagination.page}, лимит {pagination.limit})")
-        return result
+        if cursor is not None or mode == "cursor":
+            result = await repository.get_history_by_cursor(CursorParams(cursor=cursor, limit=pagination.limit))
+            request_log.info("Получена история запросов по курсору (лимит {})", pagination.limit)
+            return _history_response(result)
+
+        result = await repository.get_history(pagination)
+
+        request_log.info("Получена история запросов (страница {}, лимит {})", pagination.page, pagination.limit)
+        return _history_response(result)
     except InvalidPaginationError as e:
-        log.warning(f"Некорректные параметры пагинации: {str(e)}")
+        log.warning("Некорректные параметры пагинации: {}", e)
         raise e.to_http_exception()
     except DatabaseOperationError as e:
-        log.error(f"Ошибка БД при получении истории: {str(e)}")
+        log.error("Ошибка БД при получении истории: {}", e)
         raise e.to_http_exception()
     except BaseAppException as e:
-        log.error(f"Ошибка приложения: {str(e)}")
+        log.error("Ошибка приложения: {}", e)
         raise e.to_http_exception()
     except Exception as e:
-        log.error(f"Неожиданная ошибка при получении истории запросов: {str(e)}")
+        log.error("Неожиданная ошибка при получении истории запросов: {}", e)
         raise HTTPException(
             status_code=500,
             detail={"message": f"Неожиданная ошибка при получении истории запросов: {str(e)}"}
-        )
\ No newline at end of file
+        )
+
+
+@router.get("/history/export", response_class=StreamingResponse)
+async def export_address_history(
+        export_format: Literal["ndjson", "csv"] = Query("ndjson", alias="format", description="Формат: ndjson или csv"),
+        address: Optional[str] = Query(None, description="TRON-адрес (по умолчанию - все адреса)"),
+        created_from: Optional[datetime] = Query(None, description="Начало периода (включительно)"),
+        created_to: Optional[datetime] = Query(None, description="Конец периода (не включительно)"),
+        session_factory: async_sessionmaker = Depends(get_session_factory)
+) -> StreamingResponse:
+    """
+    Потоковая выгрузка истории запросов в NDJSON или CSV.
+
+    Записи отдаются от старых к новым без пагинации и подсчета количества.
+
+    Args:
+        export_format: Формат выгрузки
+        address: TRON-адрес
+        created_from: Начало периода
+        created_to: Конец периода
+        session_factory: Фабрика асинхронных сессий БД
+
+    Returns:
+        StreamingResponse: Поток строк выгрузки
+
+    Raises:
+        HTTPException: При некорректных параметрах выгрузки
+    """
+    try:
+        # Период проверяем до начала потока, пока еще можно вернуть код ошибки
+        AddressRepository.check_time_range(created_from, created_to)
+    except InvalidPaginationError as e:
+        log.warning("Некорректные параметры выгрузки истории: {}", e)
+        raise e.to_http_exception()
+
+    request_log.info("Начата выгрузка истории запросов ({})", export_format)
+    return StreamingResponse(
+        export_history(
+            session_factory,
+            export_format,
+            address=address,
+            created_from=created_from,
+            created_to=created_to,
+            batch_size=settings.HISTORY_EXPORT_BATCH_SIZE
+        ),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="history.{export_format}"'}
+    )
+
+
+@router.get("/address/{address}/history", response_model=CursorPaginatedResponse[AddressQueryResponse])
+async def get_single_address_history(
+        address: str,
+        params: CursorParams = Depends(),
+        created_from: Optional[datetime] = Query(None, description="Начало периода (включительно)"),
+        created_to: Optional[datetime] = Query(None, description="Конец периода (не включительно)"),
+        db: AsyncSession = Depends(get_db)
+) -> Any:
+    """
+    Получение истории запросов одного TRON-адреса с пагинацией по курсору.
+
+    Args:
+        address: TRON-адрес
+        params: Параметры пагинации по курсору
+        created_from: Начало периода
+        created_to: Конец периода
+        db: Асинхронная сессия БД
+
+    Returns:
+        CursorPaginatedResponse: Записи адреса и курсор следующей страницы
+
+    Raises:
+        HTTPException: При ошибке получения истории адреса
+    """
+    try:
+        repository = AddressRepository(db)
+        result = await repository.get_address_history(address, params, created_from, created_to)
+
+        request_log.info("Получена история адреса {} (лимит {})", address, params.limit)
+        return _history_response(result)
+    except InvalidPaginationError as e:
+        log.warning("Некорректные параметры истории адреса: {}", e)
+        raise e.to_http_exception()
+    except DatabaseOperationError as e:
+        log.error("Ошибка БД при получении истории адреса: {}", e)
+        raise e.to_http_exception()
+    except BaseAppException as e:
+        log.error("Ошибка приложения: {}", e)
+        raise e.to_http_exception()
+    except Exception as e:
+        log.error("Неожиданная ошибка при получении истории адреса: {}", e)
+        raise HTTPException(
+            status_code=500,
+            detail={"message": f"Неожиданная ошибка при получении истории адреса: {str(e)}"}
+        )
+
+
+@router.get("/cache/stats", response_model=CacheStats)
+async def get_cache_stats(
+        cache: Optional[AddressInfoCache] = Depends(get_address_cache)
+) -> Any:
+    """
+    Получение счетчиков кеша информации о адресах.
+
+    Args:
+        cache: Общий кеш адресов
+
+    Returns:
+        CacheStats: Попадания, промахи и вытеснения кеша
+    """
+    if cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **cache.stats()}
+
+
+@router.get("/history/writer/stats", response_model=HistoryWriterStats)
+async def get_history_writer_stats(
+        history_writer: Optional[HistoryWriter] = Depends(get_history_writer)
+) -> Any:
+    """
+    Получение метрик отложенной записи истории запросов.
+
+    Args:
+        history_writer: Очередь отложенной записи истории
+
+    Returns:
+        HistoryWriterStats: Глубина очереди и задержка сброса в БД
+    """
+    if history_writer is None:
+        return {"enabled": False}
+    return {"enabled": True, **history_writer.stats()}
+
+
+@router.get("/nodes/stats", response_model=TronNodePoolStats)
+async def get_tron_nodes_stats(
+        client: AsyncTron = Depends(get_tron_client)
+) -> Any:
+    """
+    Получение состояния пула узлов TRON.
+
+    Args:
+        client: Общий клиент TRON API
+
+    Returns:
+        TronNodePoolStats: Исправность, задержка и счетчики каждого узла
+    """
+    return client.provider.stats()
+
+
+@router.get("/breaker/stats", response_model=CircuitBreakerStats)
+async def get_circuit_breaker_stats(
+        breaker: Optional[CircuitBreaker] = Depends(get_circuit_breaker)
+) -> Any:
+    """
+    Получение состояния автоматического выключателя запросов к TRON API.
+
+    Args:
+        breaker: Общий выключатель запросов к TRON API
+
+    Returns:
+        CircuitBreakerStats: Состояние и счетчики выключателя
+    """
+    if breaker is None:
+        return {"enabled": False}
+    return {"enabled": True, **breaker.stats()}
+
+
+@router.get("/rate-limiter/stats", response_model=RateLimiterStats)
+async def get_rate_limiter_stats(
+        client: AsyncTron = Depends(get_tron_client)
+) -> Any:
+    """
+    Получение метрик ограничителя исходящих запросов к TRON API.
+
+    Args:
+        client: Общий клиент TRON API
+
+    Returns:
+        RateLimiterStats: Квота, очередь и время ожидания токенов
+    """
+    rate_limiter = client.provider.rate_limiter
+    if rate_limiter is None:
+        return {"enabled": False}
+    return {"enabled": True, **rate_limiter.stats()}
@@ -0,0 +1,199 @@
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Any, Optional
+
+from app.api.deps import get_watchlist_poller
+from app.core.db import get_db
+from app.schemas import (
+    PaginationParams,
+    PaginatedResponse,
+    WatchlistAddRequest,
+    WatchedAddressResponse,
+    WatchlistPollerStats
+)
+from app.services import WatchlistPoller
+from app.repositories import WatchlistRepository
+from app.config import settings
+from app.utils import log, request_log
+from app.exceptions import (
+    BaseAppException,
+    DatabaseOperationError,
+    RecordNotFoundError,
+    RecordAlreadyExistsError,
+    WatchlistFullError
+)
+
+router = APIRouter()
+
+
+@router.post("", response_model=WatchedAddressResponse, status_code=status.HTTP_201_CREATED)
+async def add_watched_address(
+        request: WatchlistAddRequest,
+        db: AsyncSession = Depends(get_db)
+) -> Any:
+    """
+    Добавление адреса в список отслеживания.
+
+    Значения адреса заполняются при следующем цикле фонового опроса.
+
+    Args:
+        request: Адрес и метка
+        db: Асинхронная сессия БД
+
+    Returns:
+        WatchedAddressResponse: Добавленный адрес
+
+    Raises:
+        HTTPException: При ошибке добавления адреса
+    """
+    try:
+        record = await WatchlistRepository(db).add(request.address, request.label, settings.WATCHLIST_MAX_SIZE)
+        request_log.info("Адрес {} добавлен в список отслеживания", request.address)
+        return record
+    except (RecordAlreadyExistsError, WatchlistFullError) as e:
+        log.warning("Адрес не добавлен в список отслеживания: {}", e)
+        raise e.to_http_exception()
+    except DatabaseOperationError as e:
+        log.error("Ошибка БД при добавлении адреса в список отслеживания: {}", e)
+        raise e.to_http_exception()
+    except BaseAppException as e:
+        log.error("Ошибка приложения: {}", e)
+        raise e.to_http_exception()
+    except Exception as e:
+        log.error("Неожиданная ошибка при добавлении адреса в список отслеживания: {}", e)
+        raise HTTPException(
+            status_code=500,
+            detail={"message": f"Неожиданная ошибка при добавлении адреса в список отслеживания: {str(e)}"}
+        )
+
+
+@router.get("", response_model=PaginatedResponse[WatchedAddressResponse])
+async def get_watched_addresses(
+        pagination: PaginationParams = Depends(),
+        db: AsyncSession = Depends(get_db)
+) -> Any:
+    """
+    Получение списка отслеживаемых адресов с пагинацией.
+
+    Args:
+        pagination: Параметры пагинации
+        db: Асинхронная сессия БД
+
+    Returns:
+        PaginatedResponse: Отслеживаемые адреса в алфавитном порядке
+
+    Raises:
+        HTTPException: При ошибке получения списка
+    """
+    try:
+        result = await WatchlistRepository(db).get_page(pagination)
+        request_log.info("Получен список отслеживания (страница {}, лимит {})", pagination.page, pagination.limit)
+        return result
+    except DatabaseOperationError as e:
+        log.error("Ошибка БД при получении списка отслеживания: {}", e)
+        raise e.to_http_exception()
+    except BaseAppException as e:
+        log.error("Ошибка приложения: {}", e)
+        raise e.to_http_exception()
+    except Exception as e:
+        log.error("Неожиданная ошибка при получении списка отслеживания: {}", e)
+        raise HTTPException(
+            status_code=500,
+            detail={"message": f"Неожиданная ошибка при получении списка отслеживания: {str(e)}"}
+        )
+
+
+@router.get("/poller/stats", response_model=WatchlistPollerStats)
+async def get_watchlist_poller_stats(
+        poller: Optional[WatchlistPoller] = Depends(get_watchlist_poller)
+) -> Any:
+    """
+    Получение метрик фонового опроса списка отслеживания.
+
+    Args:
+        poller: Фоновый опрос списка
+
+    Returns:
+        WatchlistPollerStats: Счетчики циклов, опрошенных и изменившихся адресов
+    """
+    if poller is None:
+        return {"enabled": False}
+    return {"enabled": True, **poller.stats()}
+
+
+@router.get("/{address}", response_model=WatchedAddressResponse)
+async def get_watched_address(
+        address: str,
+        db: AsyncSession = Depends(get_db)
+) -> Any:
+    """
+    Получение отслеживаемого адреса с последними известными значениями.
+
+    Args:
+        address: TRON-адрес
+        db: Асинхронная сессия БД
+
+    Returns:
+        WatchedAddressResponse: Отслеживаемый адрес
+
+    Raises:
+        HTTPException: Если адрес не отслеживается или при ошибке БД
+    """
+    try:
+        return await WatchlistRepository(db).get_by_address(address)
+    except RecordNotFoundError as e:
+        log.warning("Адрес не найден в списке отслеживания: {}", e)
+        raise e.to_http_exception()
+    except DatabaseOperationError as e:
+        log.error("Ошибка БД при получении отслеживаемого адреса: {}", e)
+        raise e.to_http_exception()
+    except BaseAppException as e:
+        log.error("Ошибка приложения: {}", e)
+        raise e.to_http_exception()
+    except Exception as e:
+        log.error("Неожиданная ошибка при получении отслеживаемого адреса: {}", e)
+        raise HTTPException(
+            status_code=500,
+            detail={"message": f"Неожиданная ошибка при получении отслеживаемого адреса: {str(e)}"}
+        )
+
+
+@router.delete("/{address}", status_code=status.HTTP_204_NO_CONTENT, response_class=Response)
+async def remove_watched_address(
+        address: str,
+        db: AsyncSession = Depends(get_db)
+) -> Response:
+    """
+    Удаление адреса из списка отслеживания.
+
+    Уже сохраненная история адреса не удаляется.
+
+    Args:
+        address: TRON-адрес
+        db: Асинхронная сессия БД
+
+    Returns:
+        Response: Пустой ответ 204
+
+    Raises:
+        HTTPException: Если адрес не отслеживается или при ошибке БД
+    """
+    try:
+        await WatchlistRepository(db).remove(address)
+        request_log.info("Адрес {} удален из списка отслеживания", address)
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+    except RecordNotFoundError as e:
+        log.warning("Адрес не найден в списке отслеживания: {}", e)
+        raise e.to_http_exception()
+    except DatabaseOperationError as e:
+        log.error("Ошибка БД при удалении адреса из списка отслеживания: {}", e)
+        raise e.to_http_exception()
+    except BaseAppException as e:
+        log.error("Ошибка приложения: {}", e)
+        raise e.to_http_exception()
+    except Exception as e:
+        log.error("Неожиданная ошибка при удалении адреса из списка отслеживания: {}", e)
+        raise HTTPException(
+            status_code=500,
+            detail={"message": f"Неожиданная ошибка при удалении адреса из списка отслеживания: {str(e)}"}
+        )
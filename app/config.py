@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import List, Literal, Optional
 
 
 class Settings(BaseSettings):
@@ -14,6 +14,10 @@ class Settings(BaseSettings):
     LOG_LEVEL: str = "INFO"
     LOG_FORMAT: str = "<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green> | <level>{level}</level> | <cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - <level>{message}</level>"
 
+    LOG_MODE: Literal["development", "production"] = "development"
+    LOG_JSON: bool = False
+    LOG_REQUEST_SAMPLE_RATE: float = 1.0
+
     # Настройки базы данных
     POSTGRES_HOST: str = "localhost"
     POSTGRES_PORT: str = "5432"
@@ -21,6 +25,108 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str = "postgres"
     POSTGRES_DB: str = "tron_tracker"
 
+    # Настройки пула соединений с БД (на каждый рабочий процесс)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 5
+    DB_POOL_TIMEOUT: float = 30.0
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+
+    # Настройки сервера приложений (gunicorn, 0 рабочих процессов - по числу ядер CPU)
+    SERVER_HOST: str = "0.0.0.0"
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: int = 0
+    SERVER_MAX_REQUESTS: int = 10000
+    SERVER_MAX_REQUESTS_JITTER: int = 1000
+    SERVER_GRACEFUL_TIMEOUT: int = 30
+    SERVER_TIMEOUT: int = 60
+    SERVER_KEEPALIVE: int = 5
+
+    # Настройки клиента TRON API
+    TRON_NETWORK: str = "mainnet"
+    TRON_API_KEY: Optional[str] = None
+    TRON_POOL_CONNECTIONS: int = 10
+    TRON_POOL_MAXSIZE: int = 100
+    TRON_CONNECT_TIMEOUT: float = 3.0
+    TRON_READ_TIMEOUT: float = 10.0
+
+    # Настройки пула узлов TRON (пустой список - узел по умолчанию для TRON_NETWORK)
+    TRON_NODE_URLS: List[str] = []
+    TRON_NODE_EWMA_ALPHA: float = 0.3
+    TRON_NODE_FAILURE_THRESHOLD: int = 3
+    TRON_NODE_HEALTH_CHECK_INTERVAL: float = 10.0
+    TRON_HEDGE_PERCENTILE: Optional[float] = None
+
+    # Настройки автоматического выключателя и повторов запросов к TRON API
+    TRON_BREAKER_ENABLED: bool = True
+    TRON_BREAKER_FAILURE_THRESHOLD: int = 5
+    TRON_BREAKER_RECOVERY_TIMEOUT: float = 30.0
+    TRON_BREAKER_HALF_OPEN_MAX_CALLS: int = 1
+    TRON_RETRY_ATTEMPTS: int = 3
+    TRON_RETRY_BASE_DELAY: float = 0.1
+    TRON_RETRY_MAX_DELAY: float = 1.0
+    TRON_RETRY_DEADLINE: float = 12.0
+
+    # Настройки ограничения частоты исходящих запросов к TRON API (квота ключа API)
+    TRON_RATE_LIMIT_ENABLED: bool = True
+    TRON_RATE_LIMIT_RPS: float = 15.0
+    TRON_RATE_LIMIT_BURST: int = 15
+    TRON_RATE_LIMIT_MAX_WAITERS: int = 1000
+    TRON_RATE_LIMIT_TIMEOUT: float = 2.0
+
+    # Настройки кеша информации о адресах
+    ADDRESS_CACHE_ENABLED: bool = True
+    ADDRESS_CACHE_MAX_SIZE: int = 10000
+    ADDRESS_CACHE_TTL: float = 5.0
+
+    # Настройки локальной проверки TRON-адресов
+    ADDRESS_VALIDATION_CACHE_SIZE: int = 65536
+
+    # Настройки пакетного запроса адресов
+    BATCH_MAX_ADDRESSES: int = 500
+    BATCH_CONCURRENCY: int = 20
+
+    # Настройки отложенной записи истории запросов
+    HISTORY_WRITE_BEHIND: bool = False
+    HISTORY_QUEUE_MAX_SIZE: int = 10000
+    HISTORY_FLUSH_BATCH_SIZE: int = 500
+    HISTORY_FLUSH_INTERVAL: float = 1.0
+    HISTORY_ENQUEUE_TIMEOUT: float = 1.0
+
+    # Настройки подсчета общего количества записей истории
+    HISTORY_COUNT_STRATEGY: Literal["exact", "cached", "estimated"] = "exact"
+    HISTORY_COUNT_CACHE_TTL: float = 60.0
+    HISTORY_COUNT_ESTIMATE_THRESHOLD: int = 100000
+
+    # Настройки секционирования и срока хранения истории
+    HISTORY_PARTITION_MAINTENANCE: bool = True
+    HISTORY_PARTITIONS_AHEAD: int = 3
+    HISTORY_RETENTION_MONTHS: Optional[int] = None
+    HISTORY_PARTITION_MAINTENANCE_INTERVAL: float = 3600.0
+
+    # Настройки потоковой выгрузки истории
+    HISTORY_EXPORT_BATCH_SIZE: int = 1000
+
+    # Настройки списка отслеживаемых адресов и его фонового опроса
+    WATCHLIST_POLL_ENABLED: bool = True
+    WATCHLIST_POLL_INTERVAL: float = 300.0
+    WATCHLIST_BATCH_SIZE: int = 100
+    WATCHLIST_POLL_CONCURRENCY: int = 10
+    WATCHLIST_MAX_SIZE: int = 10000
+    WATCHLIST_RATE_LIMIT_RPS: float = 5.0
+    WATCHLIST_RATE_LIMIT_BURST: int = 5
+    WATCHLIST_RATE_LIMIT_TIMEOUT: float = 30.0
+
+    # Настройки метрик Prometheus
+    METRICS_ENABLED: bool = True
+
+    # Настройки замеров этапов запроса и профилирования
+    SERVER_TIMING_ENABLED: bool = True
+    PROFILING_SAMPLE_RATE: float = 0.0
+    PROFILING_HEADER_ENABLED: bool = False
+    PROFILING_INTERVAL: float = 0.001
+    PROFILING_DIR: str = "profiles"
+
     @property
     def DATABASE_URI(self) -> str:
         """
@@ -31,6 +137,16 @@ class Settings(BaseSettings):
         """
         return f"postgresql://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
 
+    @property
+    def ASYNC_DATABASE_URI(self) -> str:
+        """
+        Формирует строку подключения к БД для асинхронного драйвера asyncpg.
+
+        Returns:
+            str: URI для асинхронного подключения к базе данных
+        """
+        return f"postgresql+asyncpg://{self.POSTGRES_USER}:{self.POSTGRES_PASSWORD}@{self.POSTGRES_HOST}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
+
     class Config:
         env_file = ".env"
         case_sensitive = True
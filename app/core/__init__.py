@@ -1,3 +1,4 @@
-from .db import Base, get_db
+from .db import Base, get_db, get_session_factory
+from .tron import create_tron_client, close_tron_client, get_tron_client
 
-__all__ = ['Base', 'get_db']
\ No newline at end of file
+__all__ = ['Base', 'get_db', 'get_session_factory', 'create_tron_client', 'close_tron_client', 'get_tron_client']
@@ -1,39 +1,70 @@
-from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
 from sqlalchemy.exc import SQLAlchemyError
-from typing import Generator
+from typing import AsyncGenerator
 
 from app.config import settings
 from app.utils import log
+from app.utils.metrics import DB_OPERATION_DURATION, instrument_pool
+from app.utils.timing import stage
 from app.exceptions import DatabaseError
 
-# Создаем соединение с базой данных
-engine = create_engine(settings.DATABASE_URI)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Создаем асинхронное соединение с базой данных
+# (у каждого рабочего процесса сервера свой пул на DB_POOL_SIZE + DB_MAX_OVERFLOW соединений)
+engine = create_async_engine(
+    settings.ASYNC_DATABASE_URI,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_pre_ping=settings.DB_POOL_PRE_PING
+)
+SessionLocal = async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+# Метрики пула соединений обновляются при выдаче и возврате соединений
+instrument_pool(engine)
 
 # Базовый класс для моделей SQLAlchemy
 Base = declarative_base()
 
 
-def get_db() -> Generator:
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """
-    Зависимость для FastAPI, которая предоставляет сессию БД.
+    Зависимость для FastAPI, которая предоставляет асинхронную сессию БД.
+
+    При любой ошибке транзакция откатывается; в DatabaseError оборачиваются
+    только ошибки SQLAlchemy.
 
     Yields:
-        Session: Сессия SQLAlchemy
+        AsyncSession: Асинхронная сессия SQLAlchemy
+
+    Raises:
+        DatabaseError: При ошибке работы с БД
+    """
+    async with SessionLocal() as db:
+        try:
+            yield db
+            with stage("db_commit", DB_OPERATION_DURATION.labels("commit")):
+                await db.commit()
+        except SQLAlchemyError as e:
+            await db.rollback()
+            log.error("Ошибка при работе с БД: {}", e)
+            raise DatabaseError(f"Ошибка при работе с базой данных: {str(e)}")
+        except Exception:
+            # Исключения обработчика (HTTPException, ошибки приложения) пробрасываются
+            # без изменений, чтобы не превращать ответы 4xx в ошибку 500
+            await db.rollback()
+            raise
+
+
+def get_session_factory() -> async_sessionmaker:
+    """
+    Зависимость для FastAPI, которая предоставляет фабрику асинхронных сессий БД.
+
+    Нужна, когда сессия должна жить дольше обработчика запроса (например,
+    при потоковой выгрузке ответа).
+
+    Returns:
+        async_sessionmaker: Фабрика асинхронных сессий SQLAlchemy
     """
-    db = SessionLocal()
-    try:
-        yield db
-        db.commit()
-    except SQLAlchemyError as e:
-        db.rollback()
-        log.error(f"Ошибка при работе с БД: {str(e)}")
-        raise DatabaseError(f"Ошибка при работе с базой данных: {str(e)}")
-    except Exception as e:
-        db.rollback()
-        log.error(f"Неожиданная ошибка при работе с БД: {str(e)}")
-        raise DatabaseError(f"Неожиданная ошибка при работе с базой данных: {str(e)}")
-    finally:
-        db.close()
\ No newline at end of file
+    return SessionLocal
@@ -0,0 +1,380 @@
+import asyncio
+import math
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
+from urllib.parse import urljoin
+
+import httpx
+from tronpy.providers.async_http import AsyncHTTPProvider
+
+from app.core.rate_limiter import TokenBucket, current_rate_limiter
+from app.exceptions import TronRateLimitException
+from app.utils import log
+
+# Метод, которым проверяется доступность узла
+HEALTH_CHECK_METHOD = "wallet/getnowblock"
+
+# Сколько последних задержек узла хранится для расчета перцентиля
+LATENCY_WINDOW = 100
+
+# Минимум замеров, после которого перцентиль задержки считается достоверным
+MIN_HEDGE_SAMPLES = 20
+
+
+def is_node_error(error: httpx.HTTPError) -> bool:
+    """
+    Проверка, что ошибка вызвана узлом, а не самим запросом.
+
+    Args:
+        error: Ошибка HTTP-клиента
+
+    Returns:
+        bool: True для сетевых ошибок, ответов 5xx и 429
+    """
+    if isinstance(error, httpx.HTTPStatusError):
+        status_code = error.response.status_code
+        return status_code >= 500 or status_code == 429
+    return True
+
+
+class NodeState:
+    """Состояние одного full-node: сглаженная задержка и счетчики ошибок."""
+
+    def __init__(self, endpoint: str):
+        """
+        Инициализация состояния узла.
+
+        Args:
+            endpoint: Базовый URL HTTP API узла
+        """
+        self.endpoint = endpoint if endpoint.endswith("/") else f"{endpoint}/"
+        self.ewma_latency: Optional[float] = None
+        self.latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+        self.consecutive_failures = 0
+        self.requests = 0
+        self.failures = 0
+
+    def record_success(self, latency: float, alpha: float) -> None:
+        """
+        Учет успешного запроса.
+
+        Args:
+            latency: Задержка запроса в секундах
+            alpha: Коэффициент сглаживания EWMA
+        """
+        self.requests += 1
+        self.consecutive_failures = 0
+        self.latencies.append(latency)
+        if self.ewma_latency is None:
+            self.ewma_latency = latency
+        else:
+            self.ewma_latency = alpha * latency + (1 - alpha) * self.ewma_latency
+
+    def record_failure(self) -> None:
+        """Учет неудачного запроса."""
+        self.requests += 1
+        self.failures += 1
+        self.consecutive_failures += 1
+
+    def latency_percentile(self, percentile: float) -> Optional[float]:
+        """
+        Перцентиль последних задержек узла.
+
+        Args:
+            percentile: Перцентиль от 0 до 100
+
+        Returns:
+            Optional[float]: Задержка в секундах или None, если замеров мало
+        """
+        if len(self.latencies) < MIN_HEDGE_SAMPLES:
+            return None
+        ordered = sorted(self.latencies)
+        index = min(len(ordered) - 1, max(0, math.ceil(percentile / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+    def stats(self, healthy: bool) -> Dict[str, Any]:
+        """
+        Метрики узла.
+
+        Args:
+            healthy: Считается ли узел исправным
+
+        Returns:
+            Dict: Состояние, задержка и счетчики узла
+        """
+        return {
+            "endpoint": self.endpoint,
+            "healthy": healthy,
+            "ewma_latency_ms": round(self.ewma_latency * 1000, 3) if self.ewma_latency is not None else None,
+            "requests": self.requests,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures
+        }
+
+
+class NodePoolProvider(AsyncHTTPProvider):
+    """
+    Провайдер tronpy поверх нескольких full-node с выбором самого быстрого узла.
+
+    Запрос уходит на исправный узел с наименьшей сглаженной (EWMA) задержкой,
+    а при сетевой ошибке, ответе 5xx или 429 автоматически повторяется на
+    следующем узле. Узел считается неисправным после failure_threshold ошибок
+    подряд и возвращается в работу после успешной проверки доступности.
+
+    Перед каждым исходящим запросом берется токен общего ограничителя частоты
+    запросов, чтобы не превышать квоту ключа API.
+
+    Если включено хеджирование, при задержке ответа дольше hedge_percentile
+    перцентиля задержек узла параллельно отправляется копия запроса на
+    следующий узел, и используется первый успешный ответ.
+    """
+
+    def __init__(
+            self,
+            endpoints: List[str],
+            client: httpx.AsyncClient,
+            timeout: float,
+            ewma_alpha: float = 0.3,
+            failure_threshold: int = 3,
+            health_check_interval: float = 10.0,
+            hedge_percentile: Optional[float] = None,
+            rate_limiter: Optional[TokenBucket] = None
+    ):
+        """
+        Инициализация пула узлов.
+
+        Args:
+            endpoints: Базовые URL HTTP API узлов
+            client: Общий HTTP-клиент с пулом соединений
+            timeout: Таймаут запроса в секундах
+            ewma_alpha: Коэффициент сглаживания задержки (0-1, больше - быстрее реакция)
+            failure_threshold: Количество ошибок подряд, после которого узел неисправен
+            health_check_interval: Интервал проверки доступности узлов в секундах
+            hedge_percentile: Перцентиль задержки для хеджирования (None - без хеджирования)
+            rate_limiter: Общий ограничитель исходящих запросов (None - без ограничения)
+        """
+        if not endpoints:
+            raise ValueError("Не задан ни один узел TRON")
+        super().__init__(endpoints[0], timeout=timeout, client=client)
+        self.nodes = [NodeState(endpoint) for endpoint in endpoints]
+        self.ewma_alpha = ewma_alpha
+        self.failure_threshold = failure_threshold
+        self.health_check_interval = health_check_interval
+        self.hedge_percentile = hedge_percentile
+        self.rate_limiter = rate_limiter
+        self.hedged_requests = 0
+        self._task: Optional[asyncio.Task] = None
+        self._stop_event = asyncio.Event()
+
+    def is_healthy(self, node: NodeState) -> bool:
+        """
+        Проверка исправности узла.
+
+        Args:
+            node: Состояние узла
+
+        Returns:
+            bool: True, если ошибок подряд меньше порога
+        """
+        return node.consecutive_failures < self.failure_threshold
+
+    def ranked_nodes(self) -> List[NodeState]:
+        """
+        Узлы в порядке выбора для очередного запроса.
+
+        Сначала исправные узлы по возрастанию EWMA-задержки (еще не измеренные
+        узлы идут первыми, чтобы получить замер), затем неисправные - по
+        количеству ошибок подряд.
+
+        Returns:
+            List[NodeState]: Упорядоченные узлы
+        """
+        healthy = [node for node in self.nodes if self.is_healthy(node)]
+        unhealthy = [node for node in self.nodes if not self.is_healthy(node)]
+        healthy.sort(key=lambda node: node.ewma_latency if node.ewma_latency is not None else 0.0)
+        unhealthy.sort(key=lambda node: node.consecutive_failures)
+        return healthy + unhealthy
+
+    async def make_request(self, method: str, params: Any = None) -> dict:
+        """
+        Выполнение запроса к пулу узлов с переключением при ошибках.
+
+        Args:
+            method: Метод HTTP API узла (например, wallet/getaccount)
+            params: Параметры запроса
+
+        Returns:
+            dict: Ответ узла
+
+        Raises:
+            httpx.HTTPError: Если запрос не удался ни на одном узле или узел отклонил сам запрос (4xx)
+            TronRateLimitException: Если запрос не уложился в квоту запросов
+        """
+        if params is None:
+            params = {}
+        candidates = self.ranked_nodes()
+        last_error: Optional[Exception] = None
+
+        index = 0
+        while index < len(candidates):
+            node = candidates[index]
+            hedge_delay = self._hedge_delay(node) if index + 1 < len(candidates) else None
+            try:
+                if hedge_delay is not None:
+                    return await self._hedged_request(node, candidates[index + 1], hedge_delay, method, params)
+                return await self._request(node, method, params)
+            except httpx.HTTPError as e:
+                if not is_node_error(e):
+                    raise
+                last_error = e
+                log.warning("Узел TRON {} не ответил на {}: {}", node.endpoint, method, e)
+            # При хеджировании второй узел уже использован
+            index += 2 if hedge_delay is not None else 1
+
+        raise last_error
+
+    async def _request(self, node: NodeState, method: str, params: Any) -> dict:
+        """
+        Запрос к одному узлу с учетом задержки и ошибок.
+
+        Args:
+            node: Состояние узла
+            method: Метод HTTP API узла
+            params: Параметры запроса
+
+        Returns:
+            dict: Ответ узла
+
+        Raises:
+            httpx.HTTPError: При сетевой ошибке или ответе с ошибкой
+            TronRateLimitException: Если запрос не уложился в квоту запросов
+        """
+        # Квоту расходует каждый исходящий запрос, включая повторы, хеджи и проверки узлов;
+        # фоновые задачи могут расходовать свою квоту (use_rate_limiter)
+        rate_limiter = current_rate_limiter(self.rate_limiter)
+        if rate_limiter is not None:
+            await rate_limiter.acquire()
+
+        started = time.perf_counter()
+        try:
+            resp = await self.client.post(urljoin(node.endpoint, method), json=params)
+            resp.raise_for_status()
+        except httpx.HTTPError as e:
+            if is_node_error(e):
+                node.record_failure()
+            raise
+        node.record_success(time.perf_counter() - started, self.ewma_alpha)
+        return resp.json()
+
+    def _hedge_delay(self, node: NodeState) -> Optional[float]:
+        """
+        Задержка перед отправкой копии запроса на следующий узел.
+
+        Args:
+            node: Основной узел запроса
+
+        Returns:
+            Optional[float]: Задержка в секундах или None, если хеджирование не нужно
+        """
+        if self.hedge_percentile is None:
+            return None
+        return node.latency_percentile(self.hedge_percentile)
+
+    async def _hedged_request(
+            self,
+            primary: NodeState,
+            secondary: NodeState,
+            delay: float,
+            method: str,
+            params: Any
+    ) -> dict:
+        """
+        Запрос с хеджированием: копия на второй узел, если первый отвечает долго.
+
+        Args:
+            primary: Основной узел
+            secondary: Резервный узел
+            delay: Сколько ждать основной узел перед отправкой копии
+            method: Метод HTTP API узла
+            params: Параметры запроса
+
+        Returns:
+            dict: Первый успешный ответ
+
+        Raises:
+            httpx.HTTPError: Если оба запроса завершились ошибкой
+        """
+        first = asyncio.ensure_future(self._request(primary, method, params))
+        done, _ = await asyncio.wait({first}, timeout=delay)
+        if done:
+            if first.exception() is None:
+                return first.result()
+            # Основной узел быстро ответил ошибкой - сразу переключаемся на резервный
+            return await self._request(secondary, method, params)
+
+        self.hedged_requests += 1
+        second = asyncio.ensure_future(self._request(secondary, method, params))
+        pending = {first, second}
+        error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def check_health(self) -> None:
+        """Проверка доступности всех узлов запросом последнего блока."""
+        async def probe(node: NodeState) -> None:
+            try:
+                await self._request(node, HEALTH_CHECK_METHOD, {})
+            except httpx.HTTPError as e:
+                log.warning("Узел TRON {} не прошел проверку доступности: {}", node.endpoint, e)
+            except TronRateLimitException:
+                # Квота занята рабочими запросами - проверка подождет следующего раза
+                pass
+
+        await asyncio.gather(*(probe(node) for node in self.nodes))
+
+    def start(self) -> None:
+        """Запуск фоновой проверки доступности узлов (только для пула из нескольких узлов)."""
+        if len(self.nodes) > 1 and self.health_check_interval > 0:
+            self._stop_event.clear()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Остановка фоновой проверки доступности узлов."""
+        self._stop_event.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+
+    async def _run(self) -> None:
+        """Цикл фоновой задачи: проверка узлов раз в health_check_interval секунд."""
+        while not self._stop_event.is_set():
+            try:
+                await self.check_health()
+            except Exception as e:
+                log.error("Ошибка при проверке доступности узлов TRON: {}", e)
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), self.health_check_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Метрики пула узлов.
+
+        Returns:
+            Dict: Состояние каждого узла и количество хеджированных запросов
+        """
+        return {
+            "hedged_requests": self.hedged_requests,
+            "nodes": [node.stats(self.is_healthy(node)) for node in self.ranked_nodes()]
+        }
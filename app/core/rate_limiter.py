@@ -0,0 +1,172 @@
+import asyncio
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from app.exceptions import TronRateLimitException
+from app.utils.metrics import TRON_RATE_LIMIT_WAIT
+
+
+class TokenBucket:
+    """
+    Ограничитель частоты исходящих запросов по алгоритму token bucket.
+
+    Бакет вмещает capacity токенов и пополняется со скоростью rate токенов в
+    секунду; каждый запрос забирает один токен. Если токенов нет, запрос
+    ждет в очереди (не больше max_waiters запросов) до timeout секунд.
+    Очередь обслуживается по порядку, поэтому всплеск запросов равномерно
+    растягивается во времени, не превышая квоту.
+    """
+
+    def __init__(
+            self,
+            rate: float,
+            capacity: int,
+            max_waiters: int,
+            timeout: float,
+            timer: Callable[[], float] = time.monotonic
+    ):
+        """
+        Инициализация ограничителя.
+
+        Args:
+            rate: Количество запросов в секунду
+            capacity: Максимальный всплеск запросов
+            max_waiters: Максимальное количество запросов в очереди ожидания
+            timeout: Максимальное время ожидания токена в секундах
+            timer: Источник монотонного времени
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.max_waiters = max_waiters
+        self.timeout = timeout
+        self._timer = timer
+        self._tokens = float(capacity)
+        self._updated_at = timer()
+        self._lock = asyncio.Lock()
+        self._waiters = 0
+
+        self.acquired = 0
+        self.rejected = 0
+        self.waited = 0
+        self.wait_time_total = 0.0
+        self.max_wait_time = 0.0
+
+    def _refill(self) -> None:
+        """Пополнение бакета за время, прошедшее с прошлого обращения."""
+        now = self._timer()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self) -> float:
+        """
+        Получение токена на один исходящий запрос.
+
+        Время ожидания записывается в гистограмму tron_rate_limit_wait_seconds.
+
+        Returns:
+            float: Время ожидания токена в секундах
+
+        Raises:
+            TronRateLimitException: Если очередь переполнена или токен не получен за timeout
+        """
+        # Быстрый путь: токен есть и никто не ждет
+        if self._waiters == 0:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                self.acquired += 1
+                TRON_RATE_LIMIT_WAIT.observe(0.0)
+                return 0.0
+
+        if self._waiters >= self.max_waiters:
+            self.rejected += 1
+            raise TronRateLimitException("Очередь запросов к TRON API переполнена")
+
+        started = self._timer()
+        self._waiters += 1
+        # Счетчик уменьшается при любом выходе, в том числе при отмене ожидающего
+        # (дедлайн повторов, отмена хеджированного запроса, разрыв соединения)
+        try:
+            try:
+                await asyncio.wait_for(self._lock.acquire(), self.timeout)
+            except asyncio.TimeoutError:
+                self.rejected += 1
+                raise TronRateLimitException()
+
+            try:
+                self._refill()
+                if self._tokens < 1:
+                    delay = (1 - self._tokens) / self.rate
+                    if self._timer() - started + delay > self.timeout:
+                        self.rejected += 1
+                        raise TronRateLimitException()
+                    await asyncio.sleep(delay)
+                    self._refill()
+                self._tokens -= 1
+            finally:
+                self._lock.release()
+        finally:
+            self._waiters -= 1
+
+        wait_time = self._timer() - started
+        self.acquired += 1
+        self.waited += 1
+        self.wait_time_total += wait_time
+        self.max_wait_time = max(self.max_wait_time, wait_time)
+        TRON_RATE_LIMIT_WAIT.observe(wait_time)
+        return wait_time
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Метрики ограничителя.
+
+        Returns:
+            Dict: Настройки, очередь и время ожидания токенов
+        """
+        return {
+            "rate": self.rate,
+            "capacity": self.capacity,
+            "waiting": self._waiters,
+            "acquired": self.acquired,
+            "rejected": self.rejected,
+            "waited": self.waited,
+            "avg_wait_ms": round(self.wait_time_total / self.waited * 1000, 3) if self.waited else 0.0,
+            "max_wait_ms": round(self.max_wait_time * 1000, 3)
+        }
+
+
+# Ограничитель, заменяющий общий для запросов текущей задачи (и ее подзадач)
+_rate_limiter_override: ContextVar[Optional[TokenBucket]] = ContextVar("rate_limiter_override", default=None)
+
+
+def current_rate_limiter(default: Optional[TokenBucket]) -> Optional[TokenBucket]:
+    """
+    Ограничитель для исходящего запроса текущей задачи.
+
+    Args:
+        default: Общий ограничитель клиента
+
+    Returns:
+        Optional[TokenBucket]: Ограничитель, заданный use_rate_limiter, или общий
+    """
+    return _rate_limiter_override.get() or default
+
+
+@contextmanager
+def use_rate_limiter(rate_limiter: Optional[TokenBucket]) -> Iterator[None]:
+    """
+    Направляет исходящие запросы текущей задачи в отдельный ограничитель.
+
+    Фоновые задачи получают свою квоту и не расходуют квоту запросов
+    пользователей, хотя используют тот же клиент и пул узлов.
+
+    Args:
+        rate_limiter: Отдельный ограничитель (None - общий ограничитель клиента)
+    """
+    token = _rate_limiter_override.set(rate_limiter)
+    try:
+        yield
+    finally:
+        _rate_limiter_override.reset(token)
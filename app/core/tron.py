@@ -0,0 +1,88 @@
+import httpx
+from fastapi import Request
+from tronpy import AsyncTron
+from tronpy.defaults import conf_for_name
+from tronpy.providers.async_http import DEFAULT_API_KEY
+from tronpy.version import VERSION
+
+from app.config import settings
+from app.core.node_pool import NodePoolProvider
+from app.core.rate_limiter import TokenBucket
+from app.utils import log
+
+
+def create_tron_client() -> AsyncTron:
+    """
+    Создает долгоживущий асинхронный клиент TRON API с пулом HTTP-соединений.
+
+    Клиент создается один раз на процесс и переиспользует keep-alive
+    соединения между запросами, не блокируя цикл событий. Запросы
+    распределяются по пулу узлов TRON_NODE_URLS и ограничиваются квотой
+    TRON_RATE_LIMIT_RPS; ключ API передается в заголовке Tron-Pro-Api-Key.
+
+    Returns:
+        AsyncTron: Асинхронный клиент TRON API
+    """
+    headers = {
+        "User-Agent": f"Tronpy/{VERSION}",
+        "Tron-Pro-Api-Key": settings.TRON_API_KEY or DEFAULT_API_KEY,
+    }
+    http_client = httpx.AsyncClient(
+        headers=headers,
+        timeout=httpx.Timeout(settings.TRON_READ_TIMEOUT, connect=settings.TRON_CONNECT_TIMEOUT),
+        limits=httpx.Limits(
+            max_connections=settings.TRON_POOL_MAXSIZE,
+            max_keepalive_connections=settings.TRON_POOL_CONNECTIONS,
+        ),
+    )
+    rate_limiter = (
+        TokenBucket(
+            rate=settings.TRON_RATE_LIMIT_RPS,
+            capacity=settings.TRON_RATE_LIMIT_BURST,
+            max_waiters=settings.TRON_RATE_LIMIT_MAX_WAITERS,
+            timeout=settings.TRON_RATE_LIMIT_TIMEOUT,
+        )
+        if settings.TRON_RATE_LIMIT_ENABLED else None
+    )
+    endpoints = settings.TRON_NODE_URLS or [conf_for_name(settings.TRON_NETWORK)["fullnode"]]
+    provider = NodePoolProvider(
+        endpoints,
+        client=http_client,
+        timeout=settings.TRON_READ_TIMEOUT,
+        ewma_alpha=settings.TRON_NODE_EWMA_ALPHA,
+        failure_threshold=settings.TRON_NODE_FAILURE_THRESHOLD,
+        health_check_interval=settings.TRON_NODE_HEALTH_CHECK_INTERVAL,
+        hedge_percentile=settings.TRON_HEDGE_PERCENTILE,
+        rate_limiter=rate_limiter,
+    )
+
+    log.info(
+        "Создан клиент TRON API (сеть {}, узлов {}, пул {} соединений)",
+        settings.TRON_NETWORK, len(endpoints), settings.TRON_POOL_MAXSIZE
+    )
+    return AsyncTron(provider)
+
+
+async def close_tron_client(client: AsyncTron) -> None:
+    """
+    Останавливает проверку узлов и закрывает пул HTTP-соединений клиента TRON API.
+
+    Args:
+        client: Асинхронный клиент TRON API
+    """
+    await client.provider.stop()
+    await client.close()
+    log.info("Клиент TRON API закрыт")
+
+
+def get_tron_client(request: Request) -> AsyncTron:
+    """
+    Зависимость для FastAPI, которая предоставляет общий клиент TRON API.
+
+    Args:
+        request: HTTP-запрос
+
+    Returns:
+        AsyncTron: Клиент TRON API, созданный при запуске приложения
+    """
+    return request.app.state.tron_client
@@ -1,6 +1,19 @@
 from .base import BaseAppException, NotFoundError, ValidationError, APIError, DatabaseError
-from .repository import RecordNotFoundError, DatabaseOperationError, InvalidPaginationError
-from .tron import TronAPIException, TronAddressNotFoundException, TronNetworkException
+from .repository import (
+    RecordNotFoundError,
+    DatabaseOperationError,
+    InvalidPaginationError,
+    HistoryQueueFullError,
+    RecordAlreadyExistsError,
+    WatchlistFullError
+)
+from .tron import (
+    TronAPIException,
+    TronAddressNotFoundException,
+    TronNetworkException,
+    TronCircuitOpenException,
+    TronRateLimitException
+)
 
 __all__ = [
     "BaseAppException",
@@ -11,7 +24,12 @@ __all__ = [
     "RecordNotFoundError",
     "DatabaseOperationError",
     "InvalidPaginationError",
+    "HistoryQueueFullError",
+    "RecordAlreadyExistsError",
+    "WatchlistFullError",
     "TronAPIException",
     "TronAddressNotFoundException",
-    "TronNetworkException"
+    "TronNetworkException",
+    "TronCircuitOpenException",
+    "TronRateLimitException"
 ]
\ No newline at end of file
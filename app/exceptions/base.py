@@ -1,6 +1,8 @@
 from fastapi import HTTPException, status
 from typing import Optional, Any, Dict
 
+from app.utils.metrics import APP_ERRORS
+
 
 class BaseAppException(Exception):
     """Базовое исключение приложения."""
@@ -34,6 +36,7 @@ class BaseAppException(Exception):
         Returns:
             HTTPException: Исключение для FastAPI
         """
+        APP_ERRORS.labels(type(self).__name__).inc()
         detail = {"message": self.message}
         if self.detail:
             detail["detail"] = self.detail
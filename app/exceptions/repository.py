@@ -20,4 +20,25 @@ class InvalidPaginationError(ValidationError):
     """Исключение для ошибок пагинации."""
 
     status_code = status.HTTP_400_BAD_REQUEST
-    default_message = "Недопустимые параметры пагинации"
\ No newline at end of file
+    default_message = "Недопустимые параметры пагинации"
+
+
+class HistoryQueueFullError(DatabaseError):
+    """Исключение, когда очередь отложенной записи истории переполнена."""
+
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_message = "Очередь записи истории запросов переполнена"
+
+
+class RecordAlreadyExistsError(ValidationError):
+    """Исключение, когда запись с таким ключом уже есть в БД."""
+
+    status_code = status.HTTP_409_CONFLICT
+    default_message = "Запись уже существует"
+
+
+class WatchlistFullError(ValidationError):
+    """Исключение, когда в списке отслеживания нет места для нового адреса."""
+
+    status_code = status.HTTP_409_CONFLICT
+    default_message = "Список отслеживаемых адресов заполнен"
\ No newline at end of file
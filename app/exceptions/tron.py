@@ -20,4 +20,18 @@ class TronNetworkException(TronAPIException):
     """Исключение для ошибок сети при обращении к TRON API."""
 
     status_code = status.HTTP_503_SERVICE_UNAVAILABLE
-    default_message = "Ошибка сети при обращении к TRON API"
\ No newline at end of file
+    default_message = "Ошибка сети при обращении к TRON API"
+
+
+class TronCircuitOpenException(TronNetworkException):
+    """Исключение, когда запросы к TRON API временно остановлены автоматическим выключателем."""
+
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_message = "TRON API временно недоступен, запросы приостановлены"
+
+
+class TronRateLimitException(TronAPIException):
+    """Исключение, когда исходящий запрос к TRON API не уложился в квоту запросов."""
+
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_message = "Превышена квота запросов к TRON API, повторите запрос позже"
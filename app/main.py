@@ -1,16 +1,129 @@
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from .api import api_router
 from .config import settings
+from .core import create_tron_client, close_tron_client
+from .core.db import engine, SessionLocal
+from .core.rate_limiter import TokenBucket
+from .services import (
+    TronService,
+    AddressInfoCache,
+    CircuitBreaker,
+    RetryPolicy,
+    HistoryWriter,
+    PartitionMaintainer,
+    WatchlistPoller
+)
 from .utils import log, setup_logging
-from .middleware import ErrorHandlerMiddleware
+from .utils.metrics import CONTENT_TYPE_LATEST, render_metrics
+from .middleware import (
+    ErrorHandlerMiddleware,
+    MetricsMiddleware,
+    ServerTimingMiddleware,
+    ProfilerMiddleware,
+    register_exception_handlers
+)
 
 # Настройка логирования
 setup_logging()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Менеджер жизненного цикла приложения.
+
+    Обрабатывает события запуска и завершения работы приложения:
+    создает общий клиент TRON API, кеш адресов, выключатель и политику
+    повторов запросов к TRON API, очередь отложенной записи истории,
+    обслуживание секций истории и опрос списка отслеживаемых адресов;
+    при остановке сбрасывает очередь и закрывает пулы соединений.
+    """
+    app.state.tron_client = create_tron_client()
+    # Фоновая проверка доступности узлов TRON (если их несколько)
+    app.state.tron_client.provider.start()
+    app.state.address_cache = (
+        AddressInfoCache(settings.ADDRESS_CACHE_MAX_SIZE, settings.ADDRESS_CACHE_TTL)
+        if settings.ADDRESS_CACHE_ENABLED else None
+    )
+    app.state.tron_breaker = (
+        CircuitBreaker(
+            failure_threshold=settings.TRON_BREAKER_FAILURE_THRESHOLD,
+            recovery_timeout=settings.TRON_BREAKER_RECOVERY_TIMEOUT,
+            half_open_max_calls=settings.TRON_BREAKER_HALF_OPEN_MAX_CALLS
+        )
+        if settings.TRON_BREAKER_ENABLED else None
+    )
+    app.state.tron_retry_policy = RetryPolicy(
+        attempts=settings.TRON_RETRY_ATTEMPTS,
+        base_delay=settings.TRON_RETRY_BASE_DELAY,
+        max_delay=settings.TRON_RETRY_MAX_DELAY,
+        deadline=settings.TRON_RETRY_DEADLINE
+    )
+    app.state.history_writer = None
+    if settings.HISTORY_WRITE_BEHIND:
+        app.state.history_writer = HistoryWriter(
+            SessionLocal,
+            max_size=settings.HISTORY_QUEUE_MAX_SIZE,
+            batch_size=settings.HISTORY_FLUSH_BATCH_SIZE,
+            flush_interval=settings.HISTORY_FLUSH_INTERVAL,
+            enqueue_timeout=settings.HISTORY_ENQUEUE_TIMEOUT
+        )
+        app.state.history_writer.start()
+    app.state.partition_maintainer = None
+    if settings.HISTORY_PARTITION_MAINTENANCE:
+        app.state.partition_maintainer = PartitionMaintainer(
+            SessionLocal,
+            months_ahead=settings.HISTORY_PARTITIONS_AHEAD,
+            retention_months=settings.HISTORY_RETENTION_MONTHS,
+            interval=settings.HISTORY_PARTITION_MAINTENANCE_INTERVAL
+        )
+        app.state.partition_maintainer.start()
+    app.state.watchlist_poller = None
+    if settings.WATCHLIST_POLL_ENABLED:
+        # Опрос идет мимо кеша, но через общие клиент, выключатель и политику повторов
+        app.state.watchlist_poller = WatchlistPoller(
+            SessionLocal,
+            lambda: TronService(
+                app.state.tron_client,
+                None,
+                breaker=app.state.tron_breaker,
+                retry_policy=app.state.tron_retry_policy
+            ),
+            interval=settings.WATCHLIST_POLL_INTERVAL,
+            batch_size=settings.WATCHLIST_BATCH_SIZE,
+            concurrency=settings.WATCHLIST_POLL_CONCURRENCY,
+            # Своя квота, чтобы опрос не вытеснял запросы пользователей
+            rate_limiter=TokenBucket(
+                rate=settings.WATCHLIST_RATE_LIMIT_RPS,
+                capacity=settings.WATCHLIST_RATE_LIMIT_BURST,
+                # На адрес - запросы баланса и ресурсов, каждый может быть продублирован хеджем
+                max_waiters=settings.WATCHLIST_POLL_CONCURRENCY * 4,
+                timeout=settings.WATCHLIST_RATE_LIMIT_TIMEOUT
+            )
+        )
+        app.state.watchlist_poller.start()
+    log.info("Приложение запущено")
+    try:
+        yield
+    finally:
+        if app.state.watchlist_poller is not None:
+            await app.state.watchlist_poller.stop()
+        if app.state.partition_maintainer is not None:
+            await app.state.partition_maintainer.stop()
+        if app.state.history_writer is not None:
+            await app.state.history_writer.stop()
+        await close_tron_client(app.state.tron_client)
+        await engine.dispose()
+        log.info("Приложение остановлено")
+        # Дожидаемся записи сообщений из фоновой очереди логов
+        await log.complete()
+
+
 # Создание экземпляра приложения
 app = FastAPI(
     title=settings.APP_NAME,
@@ -19,7 +132,9 @@ app = FastAPI(
     description="API для получения информации о TRON-адресах",
     docs_url="/api/docs",
     redoc_url="/api/redoc",
-    openapi_url="/api/openapi.json"
+    openapi_url="/api/openapi.json",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # Настройка CORS
@@ -31,23 +146,24 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Добавляем middleware для обработки ошибок
+# Обработчики исключений приложения и ASGI-middleware для необработанных ошибок
+register_exception_handlers(app)
 app.add_middleware(ErrorHandlerMiddleware)
 
-# Подключение роутеров
-app.include_router(api_router, prefix="/api")
+# Метрики запросов (внешний слой, чтобы учитывать и ответы с ошибками)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
 
+# Заголовок Server-Timing с длительностью этапов запроса
+if settings.SERVER_TIMING_ENABLED:
+    app.add_middleware(ServerTimingMiddleware)
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """
-    Менеджер жизненного цикла приложения.
+# Выборочное профилирование запросов (по доле запросов или заголовку X-Profile)
+if settings.PROFILING_SAMPLE_RATE > 0 or settings.PROFILING_HEADER_ENABLED:
+    app.add_middleware(ProfilerMiddleware)
 
-    Обрабатывает события запуска и завершения работы приложения.
-    """
-    log.info("Приложение запущено")
-    yield
-    log.info("Приложение остановлено")
+# Подключение роутеров
+app.include_router(api_router, prefix="/api")
 
 
 @app.get("/health")
@@ -57,4 +173,11 @@ async def health_check():
         "status": "ok",
         "version": settings.APP_VERSION,
         "service": settings.APP_NAME
-    }
\ No newline at end of file
+    }
+
+
+if settings.METRICS_ENABLED:
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics() -> Response:
+        """Метрики приложения в формате Prometheus."""
+        return Response(render_metrics(), media_type=CONTENT_TYPE_LATEST)
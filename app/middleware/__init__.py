@@ -1,3 +1,12 @@
-from .error_handler import ErrorHandlerMiddleware
+from .error_handler import ErrorHandlerMiddleware, register_exception_handlers
+from .metrics import MetricsMiddleware
+from .timing import ServerTimingMiddleware
+from .profiler import ProfilerMiddleware
 
-__all__ = ["ErrorHandlerMiddleware"]
\ No newline at end of file
+__all__ = [
+    "ErrorHandlerMiddleware",
+    "register_exception_handlers",
+    "MetricsMiddleware",
+    "ServerTimingMiddleware",
+    "ProfilerMiddleware"
+]
\ No newline at end of file
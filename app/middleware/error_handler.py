@@ -1,38 +1,109 @@
-from fastapi import Request
+from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.exceptions import BaseAppException
 from app.utils import log
+from app.utils.metrics import APP_ERRORS
 
 
-class ErrorHandlerMiddleware(BaseHTTPMiddleware):
-    """Middleware для перехвата и обработки исключений."""
+def error_response(exc: Exception) -> JSONResponse:
+    """
+    Формирует JSON-ответ для исключения.
 
-    async def dispatch(self, request: Request, call_next):
+    Args:
+        exc: Исключение
+
+    Returns:
+        JSONResponse: Ответ вида {"message": ..., "detail": ...}
+    """
+    APP_ERRORS.labels(type(exc).__name__).inc()
+    if isinstance(exc, BaseAppException):
+        # Обрабатываем кастомные исключения приложения
+        log.error("Обработано исключение: {}: {}", type(exc).__name__, exc)
+        return JSONResponse(
+            status_code=exc.status_code,
+            content={"message": exc.message, "detail": exc.detail if exc.detail else None}
+        )
+
+    # Обрабатываем необработанные исключения
+    log.error("Необработанное исключение: {}: {}", type(exc).__name__, exc)
+    return JSONResponse(
+        status_code=500,
+        content={"message": "Внутренняя ошибка сервера", "detail": str(exc)}
+    )
+
+
+async def app_exception_handler(request: Request, exc: BaseAppException) -> JSONResponse:
+    """
+    Обработчик исключений приложения, зарегистрированный в FastAPI.
+
+    Args:
+        request: HTTP-запрос
+        exc: Исключение приложения
+
+    Returns:
+        JSONResponse: HTTP-ответ с кодом статуса исключения
+    """
+    return error_response(exc)
+
+
+def register_exception_handlers(app: FastAPI) -> None:
+    """
+    Регистрирует обработчики исключений приложения.
+
+    Args:
+        app: Приложение FastAPI
+    """
+    app.add_exception_handler(BaseAppException, app_exception_handler)
+
+
+class ErrorHandlerMiddleware:
+    """
+    ASGI-middleware для перехвата необработанных исключений.
+
+    В отличие от BaseHTTPMiddleware не создает дополнительных задач и
+    потоков памяти на каждый запрос и не буферизует потоковые ответы:
+    запрос передается приложению напрямую, а отслеживается только начало
+    ответа. Если исключение возникло до отправки заголовков, клиент получает
+    JSON-ответ с ошибкой; если ответ уже начат, исключение пробрасывается
+    дальше, так как изменить его уже нельзя.
+    """
+
+    def __init__(self, app: ASGIApp):
         """
-        Перехватывает исключения и возвращает соответствующий ответ.
+        Инициализация middleware.
 
         Args:
-            request: HTTP-запрос
-            call_next: Следующий обработчик
+            app: Следующее ASGI-приложение
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Обрабатывает ASGI-вызов.
 
-        Returns:
-            Response: HTTP-ответ
+        Args:
+            scope: Параметры соединения
+            receive: Получение сообщений от клиента
+            send: Отправка сообщений клиенту
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
         try:
-            return await call_next(request)
-        except BaseAppException as e:
-            # Обрабатываем кастомные исключения приложения
-            log.error(f"Обработано исключение: {type(e).__name__}: {str(e)}")
-            return JSONResponse(
-                status_code=e.status_code,
-                content={"message": e.message, "detail": e.detail if e.detail else None}
-            )
+            await self.app(scope, receive, send_wrapper)
         except Exception as e:
-            # Обрабатываем необработанные исключения
-            log.error(f"Необработанное исключение: {type(e).__name__}: {str(e)}")
-            return JSONResponse(
-                status_code=500,
-                content={"message": "Внутренняя ошибка сервера", "detail": str(e)}
-            )
\ No newline at end of file
+            if response_started:
+                log.error("Исключение после начала ответа: {}: {}", type(e).__name__, e)
+                raise
+            await error_response(e)(scope, receive, send)
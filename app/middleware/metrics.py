@@ -0,0 +1,59 @@
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS_IN_FLIGHT
+
+
+class MetricsMiddleware:
+    """
+    ASGI-middleware для сбора метрик HTTP-запросов.
+
+    Считает запросы в обработке и записывает время ответа в гистограмму по
+    методу, шаблону маршрута (например, /api/v1/tron/address/{address}/history)
+    и коду статуса. Шаблон берется из scope после маршрутизации, поэтому
+    число серий метрики не зависит от значений параметров пути.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """
+        Инициализация middleware.
+
+        Args:
+            app: Следующее ASGI-приложение
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Обрабатывает ASGI-вызов.
+
+        Args:
+            scope: Параметры соединения
+            receive: Получение сообщений от клиента
+            send: Отправка сообщений клиенту
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            route = scope.get("route")
+            HTTP_REQUEST_DURATION.labels(
+                scope["method"],
+                getattr(route, "path", "<unmatched>"),
+                str(status_code)
+            ).observe(time.perf_counter() - started)
@@ -0,0 +1,76 @@
+import asyncio
+import os
+import random
+import re
+import time
+import uuid
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.config import settings
+from app.utils import log
+from app.utils.profiler import SamplingProfiler
+
+PROFILE_HEADER = b"x-profile"
+
+
+class ProfilerMiddleware:
+    """
+    ASGI-middleware для выборочного профилирования запросов.
+
+    Запрос профилируется с вероятностью PROFILING_SAMPLE_RATE или по
+    заголовку X-Profile (если PROFILING_HEADER_ENABLED). Профиль в формате
+    folded stacks сохраняется в PROFILING_DIR. Одновременно профилируется
+    не больше одного запроса.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """
+        Инициализация middleware.
+
+        Args:
+            app: Следующее ASGI-приложение
+        """
+        self.app = app
+        self._running = False
+
+    def _should_profile(self, scope: Scope) -> bool:
+        """
+        Проверка, нужно ли профилировать запрос.
+
+        Args:
+            scope: Параметры соединения
+
+        Returns:
+            bool: True, если запрос попал в выборку или запрошен заголовком
+        """
+        if settings.PROFILING_HEADER_ENABLED and any(name == PROFILE_HEADER for name, _ in scope["headers"]):
+            return True
+        return settings.PROFILING_SAMPLE_RATE > 0 and random.random() < settings.PROFILING_SAMPLE_RATE
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Обрабатывает ASGI-вызов.
+
+        Args:
+            scope: Параметры соединения
+            receive: Получение сообщений от клиента
+            send: Отправка сообщений клиенту
+        """
+        if scope["type"] != "http" or self._running or not self._should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        self._running = True
+        profiler = SamplingProfiler(settings.PROFILING_INTERVAL)
+        profiler.start()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            profiler.stop()
+            self._running = False
+            slug = re.sub(r"[^A-Za-z0-9]+", "_", scope["path"]).strip("_") or "root"
+            name = f"{time.strftime('%Y%m%d-%H%M%S')}-{scope['method']}-{slug}-{uuid.uuid4().hex[:8]}.folded"
+            path = os.path.join(settings.PROFILING_DIR, name)
+            await asyncio.to_thread(profiler.write, path)
+            log.info("Профиль запроса {} {} сохранен: {}", scope['method'], scope['path'], path)
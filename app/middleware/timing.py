@@ -0,0 +1,51 @@
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.utils.timing import format_server_timing, start_stage_timings
+
+
+class ServerTimingMiddleware:
+    """
+    ASGI-middleware, добавляющее заголовок Server-Timing.
+
+    Включает замеры этапов (проверка адреса, запросы к TRON API, запросы,
+    flush и commit БД) для запроса и передает их длительность в миллисекундах
+    вместе с общим временем обработки (app). Заголовок формируется в момент
+    отправки статуса ответа, поэтому в него попадают все этапы до этого
+    момента, включая commit сессии в get_db.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """
+        Инициализация middleware.
+
+        Args:
+            app: Следующее ASGI-приложение
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Обрабатывает ASGI-вызов.
+
+        Args:
+            scope: Параметры соединения
+            receive: Получение сообщений от клиента
+            send: Отправка сообщений клиенту
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = start_stage_timings()
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", format_server_timing(timings, time.perf_counter() - started))
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
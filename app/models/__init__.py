@@ -1,3 +1,4 @@
 from .tron.models import AddressQuery
+from .watchlist.models import WatchedAddress
 
-__all__ = ["AddressQuery"]
\ No newline at end of file
+__all__ = ["AddressQuery", "WatchedAddress"]
\ No newline at end of file
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, String
+from datetime import datetime
+from sqlalchemy import BigInteger, Column, DateTime, Index, Numeric, String
 
 from app.models.base import BaseModel
 
@@ -10,9 +11,32 @@ class AddressQuery(BaseModel):
     Хранит информацию о запрошенных TRON-адресах и их ресурсах, включая
     bandwidth, energy и баланс в TRX. Каждая запись представляет собой
     отдельный запрос к API.
+
+    В PostgreSQL таблица секционирована по месяцам по created_at, поэтому
+    created_at входит в первичный ключ (created_at, id), который также
+    служит индексом для keyset-пагинации истории. История отдельного адреса
+    читается по составному индексу (address, created_at DESC, id DESC).
     """
 
-    address = Column(String, nullable=False, index=True, comment="TRON-адрес, для которого был выполнен запрос")
-    bandwidth = Column(String, nullable=True, comment="Bandwidth адреса (в единицах TRON) на момент запроса")
-    energy = Column(String, nullable=True, comment="Energy адреса (в единицах TRON) на момент запроса")
-    balance = Column(String, nullable=True, comment="Баланс адреса в TRX на момент запроса")
\ No newline at end of file
+    __table_args__ = (
+        # Индекс для выборок по диапазону баланса
+        Index("ix_addressquery_balance", "balance"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
+
+    created_at = Column(DateTime, primary_key=True, default=datetime.utcnow, nullable=False)
+
+    address = Column(String, nullable=False, comment="TRON-адрес, для которого был выполнен запрос")
+    bandwidth = Column(BigInteger, nullable=True, comment="Bandwidth адреса (в единицах TRON) на момент запроса")
+    energy = Column(BigInteger, nullable=True, comment="Energy адреса (в единицах TRON) на момент запроса")
+    balance = Column(Numeric(38, 6), nullable=True, comment="Баланс адреса в TRX на момент запроса")
+
+
+# Индекс для истории отдельного адреса: выборка страницы - это просмотр
+# диапазона индекса без сортировки (заменяет одиночный индекс по address)
+Index(
+    "ix_addressquery_address_created_at",
+    AddressQuery.address,
+    AddressQuery.created_at.desc(),
+    AddressQuery.id.desc()
+)
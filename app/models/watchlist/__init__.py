@@ -0,0 +1,3 @@
+from .models import WatchedAddress
+
+__all__ = ["WatchedAddress"]
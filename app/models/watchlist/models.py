@@ -0,0 +1,21 @@
+from sqlalchemy import BigInteger, Column, DateTime, Numeric, String
+
+from app.models.base import BaseModel
+
+
+class WatchedAddress(BaseModel):
+    """
+    Модель отслеживаемого TRON-адреса.
+
+    Хранит последние известные bandwidth, energy и баланс адреса, чтобы
+    фоновый опрос мог сравнить с ними свежие данные без чтения истории.
+    Новая запись истории (AddressQuery) создается только при изменении
+    хотя бы одного из значений.
+    """
+
+    address = Column(String, nullable=False, unique=True, comment="Отслеживаемый TRON-адрес")
+    label = Column(String, nullable=True, comment="Произвольная метка адреса")
+    bandwidth = Column(BigInteger, nullable=True, comment="Последний известный bandwidth адреса")
+    energy = Column(BigInteger, nullable=True, comment="Последняя известная energy адреса")
+    balance = Column(Numeric(38, 6), nullable=True, comment="Последний известный баланс адреса в TRX")
+    changed_at = Column(DateTime, nullable=True, comment="Время последнего изменения значений адреса")
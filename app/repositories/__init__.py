@@ -1,3 +1,4 @@
 from .tron.repository import AddressRepository
+from .watchlist.repository import WatchlistRepository
 
-__all__ = ["AddressRepository"]
\ No newline at end of file
+__all__ = ["AddressRepository", "WatchlistRepository"]
\ No newline at end of file
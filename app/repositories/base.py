@@ -1,10 +1,13 @@
 from typing import TypeVar, Generic, Type, List, Optional, Dict, Any
-from sqlalchemy.orm import Session
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 
 from app.models.base import BaseModel
 from app.exceptions import RecordNotFoundError, DatabaseOperationError
 from app.utils import log
+from app.utils.metrics import DB_OPERATION_DURATION
+from app.utils.timing import stage
 
 T = TypeVar('T', bound=BaseModel)
 
@@ -12,18 +15,18 @@ T = TypeVar('T', bound=BaseModel)
 class BaseRepository(Generic[T]):
     """Базовый репозиторий для работы с моделями."""
 
-    def __init__(self, db: Session, model: Type[T]):
+    def __init__(self, db: AsyncSession, model: Type[T]):
         """
         Инициализация репозитория.
 
         Args:
-            db: Сессия SQLAlchemy
+            db: Асинхронная сессия SQLAlchemy
             model: Класс модели
         """
         self.db = db
         self.model = model
 
-    def get_by_id(self, id: Any) -> T:
+    async def get_by_id(self, id: Any) -> T:
         """
         Получение записи по ID.
 
@@ -37,15 +40,17 @@ class BaseRepository(Generic[T]):
             RecordNotFoundError: Если запись не найдена
         """
         try:
-            record = self.db.query(self.model).filter(self.model.id == id).first()
+            with stage("db_query", DB_OPERATION_DURATION.labels("query")):
+                result = await self.db.execute(select(self.model).where(self.model.id == id))
+            record = result.scalars().first()
             if not record:
                 raise RecordNotFoundError(f"Запись {self.model.__name__} с id={id} не найдена")
             return record
         except SQLAlchemyError as e:
-            log.error(f"Ошибка при получении записи по ID: {str(e)}")
+            log.error("Ошибка при получении записи по ID: {}", e)
             raise DatabaseOperationError(f"Ошибка при получении записи: {str(e)}")
 
-    def create(self, data: Dict[str, Any]) -> T:
+    async def create(self, data: Dict[str, Any]) -> T:
         """
         Создание новой записи.
 
@@ -61,8 +66,32 @@ class BaseRepository(Generic[T]):
         try:
             obj = self.model(**data)
             self.db.add(obj)
-            self.db.flush()
+            with stage("db_flush", DB_OPERATION_DURATION.labels("flush")):
+                await self.db.flush()
             return obj
         except SQLAlchemyError as e:
-            log.error(f"Ошибка при создании записи: {str(e)}")
-            raise DatabaseOperationError(f"Ошибка при создании записи: {str(e)}")
\ No newline at end of file
+            log.error("Ошибка при создании записи: {}", e)
+            raise DatabaseOperationError(f"Ошибка при создании записи: {str(e)}")
+
+    async def bulk_create(self, items: List[Dict[str, Any]]) -> int:
+        """
+        Создание нескольких записей одним пакетным INSERT.
+
+        Args:
+            items: Данные для создания записей
+
+        Returns:
+            int: Количество созданных записей
+
+        Raises:
+            DatabaseOperationError: При ошибке создания записей
+        """
+        if not items:
+            return 0
+        try:
+            with stage("db_query", DB_OPERATION_DURATION.labels("query")):
+                await self.db.execute(insert(self.model), items)
+            return len(items)
+        except SQLAlchemyError as e:
+            log.error("Ошибка при пакетном создании записей: {}", e)
+            raise DatabaseOperationError(f"Ошибка при пакетном создании записей: {str(e)}")
\ No newline at end of file
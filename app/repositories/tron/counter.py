@@ -0,0 +1,104 @@
+import time
+from typing import Any, Callable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+from app.config import settings
+
+# Ключ Session.info с записями, вставленными в текущей транзакции: {кеш: количество}
+_PENDING_KEY = "history_count_pending"
+
+
+class HistoryCountCache:
+    """
+    Кешированное количество записей истории запросов.
+
+    Значение пересчитывается точным COUNT(*) раз в ttl секунд, а между
+    пересчетами увеличивается на количество записей, вставленных процессом
+    в зафиксированных транзакциях.
+    """
+
+    def __init__(self, ttl: float, timer: Callable[[], float] = time.monotonic):
+        """
+        Инициализация кеша.
+
+        Args:
+            ttl: Время актуальности значения в секундах
+            timer: Источник монотонного времени
+        """
+        self.ttl = ttl
+        self._timer = timer
+        self._value: Optional[int] = None
+        self._expires_at = 0.0
+
+    def get(self) -> Optional[int]:
+        """
+        Получение актуального значения.
+
+        Returns:
+            Optional[int]: Количество записей или None, если значение устарело
+        """
+        if self._value is None or self._expires_at <= self._timer():
+            return None
+        return self._value
+
+    def set(self, value: int) -> None:
+        """
+        Сохранение точного значения, посчитанного в БД.
+
+        Args:
+            value: Количество записей
+        """
+        self._value = value
+        self._expires_at = self._timer() + self.ttl
+
+    def add(self, count: int) -> None:
+        """
+        Учет вставленных записей без обращения к БД.
+
+        Args:
+            count: Количество вставленных записей
+        """
+        if self._value is not None:
+            self._value += count
+
+    def add_after_commit(self, db: AsyncSession, count: int) -> None:
+        """
+        Учет записей, вставленных в транзакции сессии, после ее фиксации.
+
+        При откате транзакции записи не учитываются, поэтому неудачный commit
+        не искажает кешированное значение.
+
+        Args:
+            db: Асинхронная сессия, в транзакции которой вставлены записи
+            count: Количество вставленных записей
+        """
+        pending = db.sync_session.info.setdefault(_PENDING_KEY, {})
+        pending[self] = pending.get(self, 0) + count
+
+    def invalidate(self) -> None:
+        """Сброс значения: следующий запрос выполнит точный подсчет."""
+        self._value = None
+
+
+# Общий для процесса кеш количества записей истории
+history_count_cache = HistoryCountCache(settings.HISTORY_COUNT_CACHE_TTL)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending_counts(session: Session) -> None:
+    """Учет вставленных записей после фиксации внешней транзакции."""
+    # Событие приходит и при освобождении точки сохранения (begin_nested)
+    if session.in_nested_transaction():
+        return
+    for cache, count in session.info.pop(_PENDING_KEY, {}).items():
+        cache.add(count)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_pending_counts(session: Session, transaction: SessionTransaction, *args: Any) -> None:
+    """Сброс неучтенных записей после отката или закрытия внешней транзакции."""
+    if transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
@@ -1,27 +1,118 @@
-from sqlalchemy import desc
+from datetime import datetime
+from sqlalchemy import Row, Select, desc, func, select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
-from typing import Dict, Any
+from typing import AsyncIterator, Dict, Any, List, Optional
 
+from app.config import settings
 from app.repositories.base import BaseRepository
+from app.repositories.tron.counter import history_count_cache
 from app.models import AddressQuery
-from app.schemas import PaginationParams
+from app.schemas import PaginationParams, CursorParams
 from app.exceptions import DatabaseOperationError, InvalidPaginationError
-from app.utils import log
+from app.utils import log, encode_cursor, decode_cursor
+from app.utils.metrics import DB_OPERATION_DURATION
+from app.utils.timing import stage
 
 
 class AddressRepository(BaseRepository[AddressQuery]):
     """Репозиторий для работы с запросами TRON-адресов."""
 
-    def __init__(self, db):
+    def __init__(self, db: AsyncSession):
         """
         Инициализация репозитория.
 
         Args:
-            db: Сессия SQLAlchemy
+            db: Асинхронная сессия SQLAlchemy
         """
         super().__init__(db, AddressQuery)
 
-    def get_history(self, pagination: PaginationParams) -> Dict[str, Any]:
+    async def create(self, data: Dict[str, Any]) -> AddressQuery:
+        """
+        Создание записи о запросе с учетом ее в кешированном количестве
+        после фиксации транзакции.
+
+        Args:
+            data: Данные для создания записи
+
+        Returns:
+            AddressQuery: Созданная запись
+        """
+        obj = await super().create(data)
+        history_count_cache.add_after_commit(self.db, 1)
+        return obj
+
+    async def bulk_create(self, items: List[Dict[str, Any]]) -> int:
+        """
+        Пакетное создание записей с учетом их в кешированном количестве
+        после фиксации транзакции.
+
+        Args:
+            items: Данные для создания записей
+
+        Returns:
+            int: Количество созданных записей
+        """
+        count = await super().bulk_create(items)
+        history_count_cache.add_after_commit(self.db, count)
+        return count
+
+    async def count_total(self, strategy: Optional[str] = None) -> int:
+        """
+        Подсчет общего количества записей истории.
+
+        Стратегии:
+            exact - точный COUNT(*) по всей таблице;
+            cached - COUNT(*) раз в HISTORY_COUNT_CACHE_TTL секунд плюс учет зафиксированных вставок процесса;
+            estimated - оценка планировщика PostgreSQL из pg_class.reltuples секций
+                (для небольших таблиц и других СУБД - точный подсчет).
+
+        Args:
+            strategy: Стратегия подсчета (по умолчанию HISTORY_COUNT_STRATEGY)
+
+        Returns:
+            int: Количество записей
+        """
+        strategy = strategy or settings.HISTORY_COUNT_STRATEGY
+
+        if strategy == "cached":
+            total = history_count_cache.get()
+            if total is None:
+                total = await self._count_exact()
+                history_count_cache.set(total)
+            return total
+
+        if strategy == "estimated" and self.db.get_bind().dialect.name == "postgresql":
+            # У секционированной таблицы статистика хранится в секциях
+            with stage("db_query", DB_OPERATION_DURATION.labels("query")):
+                estimate = await self.db.scalar(
+                    text(
+                        "SELECT CASE WHEN p.relkind = 'p' THEN ("
+                        "    SELECT COALESCE(SUM(GREATEST(c.reltuples, 0)), 0)"
+                        "    FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid"
+                        "    WHERE i.inhparent = p.oid"
+                        ") ELSE p.reltuples END::bigint "
+                        "FROM pg_class p WHERE p.oid = CAST(:table AS regclass)"
+                    ),
+                    {"table": self.model.__tablename__}
+                )
+            # reltuples = -1, пока таблица ни разу не анализировалась
+            if estimate is not None and estimate >= settings.HISTORY_COUNT_ESTIMATE_THRESHOLD:
+                return int(estimate)
+
+        return await self._count_exact()
+
+    async def _count_exact(self) -> int:
+        """
+        Точный подсчет количества записей истории.
+
+        Returns:
+            int: Количество записей
+        """
+        with stage("db_query", DB_OPERATION_DURATION.labels("query")):
+            return await self.db.scalar(select(func.count()).select_from(self.model))
+
+    async def get_history(self, pagination: PaginationParams) -> Dict[str, Any]:
         """
         Получение истории запросов с пагинацией.
 
@@ -29,7 +120,7 @@ class AddressRepository(BaseRepository[AddressQuery]):
             pagination: Параметры пагинации
 
         Returns:
-            Dict: Результаты с пагинацией
+            Dict: Результаты с пагинацией (элементы - строки колонок истории)
 
         Raises:
             InvalidPaginationError: При некорректных параметрах пагинации
@@ -40,24 +131,32 @@ class AddressRepository(BaseRepository[AddressQuery]):
             if pagination.page < 1 or pagination.limit < 1:
                 raise InvalidPaginationError("Некорректные параметры пагинации: page и limit должны быть больше 0")
 
-            query = self.db.query(self.model).order_by(desc(self.model.created_at))
+            query = self._history_query().order_by(desc(self.model.created_at))
 
-            # Подсчет общего количества
-            total = query.count()
+            # Подсчет общего количества (если клиент не отказался от него)
+            total = None
+            pages = None
+            if pagination.include_total:
+                total = await self.count_total()
+                pages = (total + pagination.limit - 1) // pagination.limit if total > 0 else 1
 
-            # Проверка, что запрашиваемая страница существует
-            pages = (total + pagination.limit - 1) // pagination.limit if total > 0 else 1
-            if pagination.page > pages and total > 0:
-                raise InvalidPaginationError(f"Запрашиваемая страница не существует: доступно {pages} страниц")
+                # Проверка, что запрашиваемая страница существует (только для точного подсчета)
+                if settings.HISTORY_COUNT_STRATEGY == "exact" and pagination.page > pages and total > 0:
+                    raise InvalidPaginationError(f"Запрашиваемая страница не существует: доступно {pages} страниц")
 
             # Вычисление смещения для пагинации
             skip = (pagination.page - 1) * pagination.limit
 
-            # Получение элементов для текущей страницы
-            items = query.offset(skip).limit(pagination.limit).all()
+            # Получение элементов для текущей страницы (на одну запись больше,
+            # чтобы узнать о следующей странице без подсчета всех записей)
+            with stage("db_query", DB_OPERATION_DURATION.labels("query")):
+                result = await self.db.execute(query.offset(skip).limit(pagination.limit + 1))
+            items = result.all()
+            has_next = len(items) > pagination.limit
+            items = items[:pagination.limit]
 
             # Определение следующей и предыдущей страницы
-            next_page = pagination.page + 1 if pagination.page < pages else None
+            next_page = pagination.page + 1 if has_next else None
             prev_page = pagination.page - 1 if pagination.page > 1 else None
 
             return {
@@ -73,5 +172,207 @@ class AddressRepository(BaseRepository[AddressQuery]):
             # Пробрасываем уже созданные исключения
             raise
         except SQLAlchemyError as e:
-            log.error(f"Ошибка при получении истории запросов: {str(e)}")
-            raise DatabaseOperationError(f"Ошибка при получении истории запросов: {str(e)}")
\ No newline at end of file
+            log.error("Ошибка при получении истории запросов: {}", e)
+            raise DatabaseOperationError(f"Ошибка при получении истории запросов: {str(e)}")
+
+    async def get_history_by_cursor(self, params: CursorParams) -> Dict[str, Any]:
+        """
+        Получение истории запросов с keyset-пагинацией по курсору.
+
+        Страница выбирается условием (created_at, id) < курсора по первичному
+        ключу (created_at, id), поэтому время выборки не зависит от глубины
+        страницы.
+
+        Args:
+            params: Параметры пагинации по курсору
+
+        Returns:
+            Dict: Элементы страницы и курсор следующей страницы
+
+        Raises:
+            InvalidPaginationError: При некорректном курсоре
+            DatabaseOperationError: При ошибке работы с БД
+        """
+        try:
+            return await self._get_page_by_cursor(self._history_query(), params)
+        except InvalidPaginationError:
+            # Пробрасываем уже созданные исключения
+            raise
+        except SQLAlchemyError as e:
+            log.error("Ошибка при получении истории запросов по курсору: {}", e)
+            raise DatabaseOperationError(f"Ошибка при получении истории запросов: {str(e)}")
+
+    async def get_address_history(
+            self,
+            address: str,
+            params: CursorParams,
+            created_from: Optional[datetime] = None,
+            created_to: Optional[datetime] = None
+    ) -> Dict[str, Any]:
+        """
+        Получение истории запросов одного адреса с keyset-пагинацией.
+
+        Выборка идет по индексу (address, created_at DESC, id DESC): страница
+        читается как диапазон индекса без сортировки всей таблицы.
+
+        Args:
+            address: TRON-адрес
+            params: Параметры пагинации по курсору
+            created_from: Начало периода (включительно)
+            created_to: Конец периода (не включительно)
+
+        Returns:
+            Dict: Элементы страницы и курсор следующей страницы
+
+        Raises:
+            InvalidPaginationError: При некорректном курсоре или периоде
+            DatabaseOperationError: При ошибке работы с БД
+        """
+        try:
+            query = self._filter(self._history_query(), address, created_from, created_to)
+            return await self._get_page_by_cursor(query, params)
+        except InvalidPaginationError:
+            # Пробрасываем уже созданные исключения
+            raise
+        except SQLAlchemyError as e:
+            log.error("Ошибка при получении истории адреса {}: {}", address, e)
+            raise DatabaseOperationError(f"Ошибка при получении истории адреса: {str(e)}")
+
+    async def stream_history(
+            self,
+            address: Optional[str] = None,
+            created_from: Optional[datetime] = None,
+            created_to: Optional[datetime] = None,
+            batch_size: int = 1000
+    ) -> AsyncIterator[Row]:
+        """
+        Потоковое чтение истории запросов через серверный курсор.
+
+        Строки читаются порциями по batch_size (yield_per), поэтому расход
+        памяти не зависит от общего количества записей. Записи отдаются
+        кортежами колонок от старых к новым, без создания ORM-объектов.
+
+        Args:
+            address: TRON-адрес (None - все адреса)
+            created_from: Начало периода (включительно)
+            created_to: Конец периода (не включительно)
+            batch_size: Количество строк, читаемых из курсора за раз
+
+        Yields:
+            Row: Строка (id, address, bandwidth, energy, balance, created_at)
+
+        Raises:
+            InvalidPaginationError: При некорректном периоде
+            DatabaseOperationError: При ошибке работы с БД
+        """
+        query = self._filter(self._history_query(), address, created_from, created_to)
+        query = query.order_by(self.model.created_at, self.model.id).execution_options(yield_per=batch_size)
+
+        try:
+            result = await self.db.stream(query)
+            async for row in result:
+                yield row
+        except SQLAlchemyError as e:
+            log.error("Ошибка при потоковом чтении истории запросов: {}", e)
+            raise DatabaseOperationError(f"Ошибка при выгрузке истории запросов: {str(e)}")
+
+    def _history_query(self) -> Select:
+        """
+        Запрос колонок истории без создания ORM-объектов.
+
+        Returns:
+            Select: Выборка (id, address, bandwidth, energy, balance, created_at)
+        """
+        return select(
+            self.model.id,
+            self.model.address,
+            self.model.bandwidth,
+            self.model.energy,
+            self.model.balance,
+            self.model.created_at
+        )
+
+    @staticmethod
+    def check_time_range(created_from: Optional[datetime], created_to: Optional[datetime]) -> None:
+        """
+        Проверка корректности периода выборки истории.
+
+        Args:
+            created_from: Начало периода (включительно)
+            created_to: Конец периода (не включительно)
+
+        Raises:
+            InvalidPaginationError: Если начало периода не меньше конца
+        """
+        if created_from is not None and created_to is not None and created_from >= created_to:
+            raise InvalidPaginationError("Некорректный период: created_from должен быть меньше created_to")
+
+    def _filter(
+            self,
+            query: Select,
+            address: Optional[str],
+            created_from: Optional[datetime],
+            created_to: Optional[datetime]
+    ) -> Select:
+        """
+        Добавление к запросу фильтров по адресу и периоду.
+
+        Args:
+            query: Исходный запрос
+            address: TRON-адрес (None - без фильтра)
+            created_from: Начало периода (включительно)
+            created_to: Конец периода (не включительно)
+
+        Returns:
+            Select: Запрос с фильтрами
+
+        Raises:
+            InvalidPaginationError: При некорректном периоде
+        """
+        self.check_time_range(created_from, created_to)
+        if address is not None:
+            query = query.where(self.model.address == address)
+        if created_from is not None:
+            query = query.where(self.model.created_at >= created_from)
+        if created_to is not None:
+            query = query.where(self.model.created_at < created_to)
+        return query
+
+    async def _get_page_by_cursor(self, query: Select, params: CursorParams) -> Dict[str, Any]:
+        """
+        Выборка страницы по курсору в порядке (created_at, id) по убыванию.
+
+        Элементы страницы - строки колонок истории (см. _history_query),
+        а не ORM-объекты.
+
+        Args:
+            query: Запрос с условиями отбора записей
+            params: Параметры пагинации по курсору
+
+        Returns:
+            Dict: Элементы страницы и курсор следующей страницы
+
+        Raises:
+            InvalidPaginationError: При некорректном курсоре
+        """
+        query = query.order_by(desc(self.model.created_at), desc(self.model.id))
+
+        if params.cursor:
+            created_at, id = decode_cursor(params.cursor)
+            query = query.where(tuple_(self.model.created_at, self.model.id) < tuple_(created_at, id))
+
+        # Запрашиваем на одну запись больше, чтобы узнать, есть ли следующая страница
+        with stage("db_query", DB_OPERATION_DURATION.labels("query")):
+            result = await self.db.execute(query.limit(params.limit + 1))
+        items = result.all()
+
+        next_cursor = None
+        if len(items) > params.limit:
+            items = items[:params.limit]
+            next_cursor = encode_cursor(items[-1].created_at, items[-1].id)
+
+        return {
+            "items": items,
+            "limit": params.limit,
+            "next_cursor": next_cursor
+        }
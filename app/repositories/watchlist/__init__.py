@@ -0,0 +1,3 @@
+from .repository import WatchlistRepository
+
+__all__ = ["WatchlistRepository"]
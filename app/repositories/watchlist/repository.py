@@ -0,0 +1,198 @@
+from sqlalchemy import Row, delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from typing import Any, Dict, List, Optional
+
+from app.repositories.base import BaseRepository
+from app.models import WatchedAddress
+from app.schemas import PaginationParams
+from app.exceptions import (
+    DatabaseOperationError,
+    RecordNotFoundError,
+    RecordAlreadyExistsError,
+    WatchlistFullError
+)
+from app.utils import log
+from app.utils.metrics import DB_OPERATION_DURATION
+from app.utils.timing import stage
+
+
+class WatchlistRepository(BaseRepository[WatchedAddress]):
+    """Репозиторий для работы со списком отслеживаемых TRON-адресов."""
+
+    def __init__(self, db: AsyncSession):
+        """
+        Инициализация репозитория.
+
+        Args:
+            db: Асинхронная сессия SQLAlchemy
+        """
+        super().__init__(db, WatchedAddress)
+
+    async def get_by_address(self, address: str) -> WatchedAddress:
+        """
+        Получение отслеживаемого адреса.
+
+        Args:
+            address: TRON-адрес
+
+        Returns:
+            WatchedAddress: Отслеживаемый адрес
+
+        Raises:
+            RecordNotFoundError: Если адрес не отслеживается
+            DatabaseOperationError: При ошибке работы с БД
+        """
+        try:
+            with stage("db_query", DB_OPERATION_DURATION.labels("query")):
+                record = await self.db.scalar(select(self.model).where(self.model.address == address))
+        except SQLAlchemyError as e:
+            log.error("Ошибка при получении отслеживаемого адреса {}: {}", address, e)
+            raise DatabaseOperationError(f"Ошибка при получении отслеживаемого адреса: {str(e)}")
+        if record is None:
+            raise RecordNotFoundError(f"Адрес {address} не отслеживается")
+        return record
+
+    async def add(self, address: str, label: Optional[str], max_size: int) -> WatchedAddress:
+        """
+        Добавление адреса в список отслеживания.
+
+        Args:
+            address: TRON-адрес
+            label: Метка адреса
+            max_size: Максимальное количество отслеживаемых адресов
+
+        Returns:
+            WatchedAddress: Добавленный адрес
+
+        Raises:
+            RecordAlreadyExistsError: Если адрес уже отслеживается
+            WatchlistFullError: Если список отслеживания заполнен
+            DatabaseOperationError: При ошибке работы с БД
+        """
+        try:
+            if await self.count() >= max_size:
+                raise WatchlistFullError(f"Нельзя отслеживать больше {max_size} адресов")
+            record = self.model(address=address, label=label)
+            # Уникальность проверяет БД: одновременные добавления одного адреса
+            # не приводят к ошибке 500, а точка сохранения оставляет сессию рабочей
+            async with self.db.begin_nested():
+                self.db.add(record)
+                with stage("db_flush", DB_OPERATION_DURATION.labels("flush")):
+                    await self.db.flush()
+            return record
+        except IntegrityError:
+            raise RecordAlreadyExistsError(f"Адрес {address} уже отслеживается")
+        except SQLAlchemyError as e:
+            log.error("Ошибка при добавлении адреса {} в список отслеживания: {}", address, e)
+            raise DatabaseOperationError(f"Ошибка при добавлении адреса в список отслеживания: {str(e)}")
+
+    async def remove(self, address: str) -> None:
+        """
+        Удаление адреса из списка отслеживания.
+
+        Args:
+            address: TRON-адрес
+
+        Raises:
+            RecordNotFoundError: Если адрес не отслеживается
+            DatabaseOperationError: При ошибке работы с БД
+        """
+        try:
+            with stage("db_query", DB_OPERATION_DURATION.labels("query")):
+                result = await self.db.execute(delete(self.model).where(self.model.address == address))
+        except SQLAlchemyError as e:
+            log.error("Ошибка при удалении адреса {} из списка отслеживания: {}", address, e)
+            raise DatabaseOperationError(f"Ошибка при удалении адреса из списка отслеживания: {str(e)}")
+        if result.rowcount == 0:
+            raise RecordNotFoundError(f"Адрес {address} не отслеживается")
+
+    async def count(self) -> int:
+        """
+        Количество отслеживаемых адресов.
+
+        Returns:
+            int: Количество адресов
+        """
+        with stage("db_query", DB_OPERATION_DURATION.labels("query")):
+            return await self.db.scalar(select(func.count()).select_from(self.model))
+
+    async def get_page(self, pagination: PaginationParams) -> Dict[str, Any]:
+        """
+        Получение страницы списка отслеживания (по адресу в алфавитном порядке).
+
+        Args:
+            pagination: Параметры пагинации
+
+        Returns:
+            Dict: Результаты с пагинацией
+
+        Raises:
+            DatabaseOperationError: При ошибке работы с БД
+        """
+        try:
+            total = await self.count()
+            pages = (total + pagination.limit - 1) // pagination.limit if total > 0 else 1
+            query = (
+                select(self.model)
+                .order_by(self.model.address)
+                .offset((pagination.page - 1) * pagination.limit)
+                .limit(pagination.limit)
+            )
+            with stage("db_query", DB_OPERATION_DURATION.labels("query")):
+                result = await self.db.execute(query)
+            return {
+                "items": result.scalars().all(),
+                "total": total,
+                "page": pagination.page,
+                "limit": pagination.limit,
+                "pages": pages,
+                "next_page": pagination.page + 1 if pagination.page < pages else None,
+                "prev_page": pagination.page - 1 if pagination.page > 1 else None
+            }
+        except SQLAlchemyError as e:
+            log.error("Ошибка при получении списка отслеживания: {}", e)
+            raise DatabaseOperationError(f"Ошибка при получении списка отслеживания: {str(e)}")
+
+    async def get_batch(self, after: Optional[str], limit: int) -> List[Row]:
+        """
+        Пакет отслеживаемых адресов для опроса (keyset-пагинация по адресу).
+
+        Args:
+            after: Последний адрес предыдущего пакета (None - с начала списка)
+            limit: Размер пакета
+
+        Returns:
+            List[Row]: Строки (id, address, bandwidth, energy, balance)
+        """
+        query = select(
+            self.model.id,
+            self.model.address,
+            self.model.bandwidth,
+            self.model.energy,
+            self.model.balance
+        )
+        if after is not None:
+            query = query.where(self.model.address > after)
+        with stage("db_query", DB_OPERATION_DURATION.labels("query")):
+            result = await self.db.execute(query.order_by(self.model.address).limit(limit))
+        return list(result.all())
+
+    async def update_values(self, items: List[Dict[str, Any]]) -> None:
+        """
+        Пакетное обновление последних известных значений адресов.
+
+        Args:
+            items: Словари с id и новыми значениями колонок
+
+        Raises:
+            DatabaseOperationError: При ошибке работы с БД
+        """
+        if not items:
+            return
+        try:
+            with stage("db_query", DB_OPERATION_DURATION.labels("query")):
+                await self.db.execute(update(self.model), items)
+        except SQLAlchemyError as e:
+            log.error("Ошибка при обновлении значений отслеживаемых адресов: {}", e)
+            raise DatabaseOperationError(f"Ошибка при обновлении значений отслеживаемых адресов: {str(e)}")
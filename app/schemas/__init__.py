@@ -1,10 +1,40 @@
-from .base import PaginationParams, PaginatedResponse
-from .tron.schemas import AddressRequest, TronAddressInfo, AddressQueryResponse
+from .base import PaginationParams, PaginatedResponse, CursorParams, CursorPaginatedResponse
+from .tron.schemas import (
+    AddressRequest,
+    TronAddressInfo,
+    AddressQueryResponse,
+    CacheStats,
+    BatchAddressRequest,
+    BatchAddressResult,
+    BatchAddressResponse,
+    HistoryWriterStats,
+    TronNodeStats,
+    TronNodePoolStats,
+    CircuitBreakerStats,
+    RateLimiterStats,
+    history_item
+)
+from .watchlist.schemas import WatchlistAddRequest, WatchedAddressResponse, WatchlistPollerStats
 
 __all__ = [
     "PaginationParams",
     "PaginatedResponse",
+    "CursorParams",
+    "CursorPaginatedResponse",
     "AddressRequest",
     "TronAddressInfo",
-    "AddressQueryResponse"
+    "AddressQueryResponse",
+    "CacheStats",
+    "BatchAddressRequest",
+    "BatchAddressResult",
+    "BatchAddressResponse",
+    "HistoryWriterStats",
+    "TronNodeStats",
+    "TronNodePoolStats",
+    "CircuitBreakerStats",
+    "RateLimiterStats",
+    "history_item",
+    "WatchlistAddRequest",
+    "WatchedAddressResponse",
+    "WatchlistPollerStats"
 ]
\ No newline at end of file
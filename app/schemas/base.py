@@ -9,15 +9,31 @@ class PaginationParams(BaseModel):
 
     page: int = Field(1, ge=1, description="Номер страницы (начиная с 1)")
     limit: int = Field(10, ge=1, le=100, description="Количество элементов на странице")
+    include_total: bool = Field(True, description="Считать общее количество элементов и страниц")
+
+
+class CursorParams(BaseModel):
+    """Параметры keyset-пагинации по курсору."""
+
+    cursor: Optional[str] = Field(None, description="Курсор из next_cursor предыдущей страницы (пусто - первая страница)")
+    limit: int = Field(10, ge=1, le=100, description="Количество элементов на странице")
 
 
 class PaginatedResponse(BaseModel, Generic[T]):
     """Ответ с пагинацией."""
 
     items: List[T] = Field(..., description="Список элементов")
-    total: int = Field(..., description="Общее количество элементов")
+    total: Optional[int] = Field(None, description="Общее количество элементов (None, если не запрошено)")
     page: int = Field(..., description="Текущая страница")
     limit: int = Field(..., description="Количество элементов на странице")
-    pages: int = Field(..., description="Общее количество страниц")
+    pages: Optional[int] = Field(None, description="Общее количество страниц (None, если не запрошено)")
     next_page: Optional[int] = Field(None, description="Номер следующей страницы")
-    prev_page: Optional[int] = Field(None, description="Номер предыдущей страницы")
\ No newline at end of file
+    prev_page: Optional[int] = Field(None, description="Номер предыдущей страницы")
+
+
+class CursorPaginatedResponse(BaseModel, Generic[T]):
+    """Ответ с keyset-пагинацией по курсору."""
+
+    items: List[T] = Field(..., description="Список элементов")
+    limit: int = Field(..., description="Количество элементов на странице")
+    next_cursor: Optional[str] = Field(None, description="Курсор следующей страницы (None - страница последняя)")
\ No newline at end of file
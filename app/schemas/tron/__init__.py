@@ -1,7 +1,31 @@
-from .schemas import AddressRequest, TronAddressInfo, AddressQueryResponse
+from .schemas import (
+    AddressRequest,
+    TronAddressInfo,
+    AddressQueryResponse,
+    CacheStats,
+    BatchAddressRequest,
+    BatchAddressResult,
+    BatchAddressResponse,
+    HistoryWriterStats,
+    TronNodeStats,
+    TronNodePoolStats,
+    CircuitBreakerStats,
+    RateLimiterStats,
+    history_item
+)
 
 __all__ = [
     "AddressRequest",
     "TronAddressInfo",
-    "AddressQueryResponse"
+    "AddressQueryResponse",
+    "CacheStats",
+    "BatchAddressRequest",
+    "BatchAddressResult",
+    "BatchAddressResponse",
+    "HistoryWriterStats",
+    "TronNodeStats",
+    "TronNodePoolStats",
+    "CircuitBreakerStats",
+    "RateLimiterStats",
+    "history_item"
 ]
\ No newline at end of file
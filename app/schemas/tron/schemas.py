@@ -1,22 +1,128 @@
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, BeforeValidator, Field, field_validator
+from typing import Annotated, Any, Dict, List, Optional, Sequence
 from datetime import datetime
+from decimal import Decimal
 import uuid
 
+from app.config import settings
+from app.utils import is_valid_tron_address
+
+
+def _number_to_str(value: Any) -> Any:
+    """
+    Преобразует числовые значения из БД и TRON API в строку для ответа API.
+
+    Args:
+        value: Значение поля
+
+    Returns:
+        Any: Строковое представление числа или исходное значение
+    """
+    if isinstance(value, Decimal):
+        # normalize убирает хвостовые нули NUMERIC(38, 6): 100.500000 -> 100.5
+        return format(value.normalize(), "f")
+    if isinstance(value, int) and not isinstance(value, bool):
+        return str(value)
+    return value
+
+
+# Число, которое API отдает строкой для совместимости с прежним форматом
+NumericStr = Annotated[str, BeforeValidator(_number_to_str)]
+
 
 class AddressRequest(BaseModel):
     """Схема для запроса информации о TRON-адресе."""
 
     address: str = Field(..., description="TRON-адрес для получения информации")
+    use_cache: bool = Field(True, description="Разрешить ответ из кеша (False - всегда свежие данные)")
+
+    @field_validator("address")
+    @classmethod
+    def validate_address(cls, value: str) -> str:
+        """
+        Локальная проверка адреса до обращения к TRON API.
+
+        Args:
+            value: TRON-адрес
+
+        Returns:
+            str: Проверенный адрес
+
+        Raises:
+            ValueError: Если адрес не проходит проверку base58check
+        """
+        if not is_valid_tron_address(value):
+            raise ValueError("Некорректный TRON-адрес: ошибка формата или контрольной суммы base58check")
+        return value
 
 
 class TronAddressInfo(BaseModel):
     """Схема с информацией о TRON-адресе."""
 
     address: str = Field(..., description="TRON-адрес")
-    bandwidth: str = Field(..., description="Bandwidth адреса")
-    energy: str = Field(..., description="Energy адреса")
-    balance: str = Field(..., description="Баланс в TRX")
+    bandwidth: NumericStr = Field(..., description="Bandwidth адреса")
+    energy: NumericStr = Field(..., description="Energy адреса")
+    balance: NumericStr = Field(..., description="Баланс в TRX")
+
+
+class BatchAddressRequest(BaseModel):
+    """Схема для пакетного запроса информации о TRON-адресах."""
+
+    addresses: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=settings.BATCH_MAX_ADDRESSES,
+        description="Список TRON-адресов для получения информации"
+    )
+    use_cache: bool = Field(True, description="Разрешить ответы из кеша (False - всегда свежие данные)")
+
+
+class BatchAddressError(BaseModel):
+    """Схема с описанием ошибки по одному адресу из пакета."""
+
+    message: str = Field(..., description="Сообщение об ошибке")
+    status_code: int = Field(..., description="HTTP-код, соответствующий ошибке")
+
+
+class BatchAddressResult(BaseModel):
+    """Схема с результатом обработки одного адреса из пакета."""
+
+    address: str = Field(..., description="TRON-адрес")
+    data: Optional[TronAddressInfo] = Field(None, description="Информация о адресе, если запрос успешен")
+    error: Optional[BatchAddressError] = Field(None, description="Ошибка, если запрос не удался")
+
+
+class BatchAddressResponse(BaseModel):
+    """Схема ответа на пакетный запрос информации о TRON-адресах."""
+
+    items: List[BatchAddressResult] = Field(..., description="Результаты в порядке адресов запроса")
+    succeeded: int = Field(..., description="Количество успешно обработанных адресов")
+    failed: int = Field(..., description="Количество адресов с ошибкой")
+
+
+def history_item(row: Sequence[Any]) -> Dict[str, Any]:
+    """
+    Формирует элемент истории для ответа API из строки колонок истории.
+
+    Результат совпадает с сериализацией AddressQueryResponse (числа -
+    строками), но без валидации через pydantic; id и created_at
+    сериализует orjson.
+
+    Args:
+        row: Строка (id, address, bandwidth, energy, balance, created_at)
+
+    Returns:
+        Dict: Элемент истории
+    """
+    id, address, bandwidth, energy, balance, created_at = row
+    return {
+        "id": id,
+        "address": address,
+        "bandwidth": _number_to_str(bandwidth),
+        "energy": _number_to_str(energy),
+        "balance": _number_to_str(balance),
+        "created_at": created_at
+    }
 
 
 class AddressQueryResponse(BaseModel):
@@ -24,10 +130,81 @@ class AddressQueryResponse(BaseModel):
 
     id: uuid.UUID = Field(..., description="Уникальный идентификатор записи")
     address: str = Field(..., description="TRON-адрес")
-    bandwidth: Optional[str] = Field(None, description="Bandwidth адреса")
-    energy: Optional[str] = Field(None, description="Energy адреса")
-    balance: Optional[str] = Field(None, description="Баланс в TRX")
+    bandwidth: Optional[NumericStr] = Field(None, description="Bandwidth адреса")
+    energy: Optional[NumericStr] = Field(None, description="Energy адреса")
+    balance: Optional[NumericStr] = Field(None, description="Баланс в TRX")
     created_at: datetime = Field(..., description="Дата и время создания записи")
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+
+class CacheStats(BaseModel):
+    """Схема со счетчиками кеша информации о адресах."""
+
+    enabled: bool = Field(..., description="Включено ли кеширование")
+    hits: int = Field(0, description="Количество попаданий в кеш")
+    misses: int = Field(0, description="Количество промахов кеша")
+    evictions: int = Field(0, description="Количество вытесненных записей")
+    coalesced: int = Field(0, description="Количество запросов, объединенных с уже выполняющимися")
+    stale_hits: int = Field(0, description="Количество устаревших ответов, отданных при недоступном TRON API")
+    size: int = Field(0, description="Текущее количество записей")
+    max_size: int = Field(0, description="Максимальное количество записей")
+
+
+class HistoryWriterStats(BaseModel):
+    """Схема с метриками отложенной записи истории запросов."""
+
+    enabled: bool = Field(..., description="Включена ли отложенная запись")
+    queue_depth: int = Field(0, description="Текущее количество записей в очереди")
+    queue_max_size: int = Field(0, description="Максимальное количество записей в очереди")
+    enqueued: int = Field(0, description="Количество записей, поставленных в очередь")
+    flushed: int = Field(0, description="Количество записей, сохраненных в БД")
+    dropped: int = Field(0, description="Количество записей, потерянных из-за ошибок БД")
+    rejected: int = Field(0, description="Количество записей, отклоненных из-за переполнения очереди")
+    backpressure_waits: int = Field(0, description="Количество ожиданий места в переполненной очереди")
+    flushes: int = Field(0, description="Количество сбросов очереди в БД")
+    last_flush_latency_ms: float = Field(0.0, description="Длительность последнего сброса в миллисекундах")
+    avg_flush_latency_ms: float = Field(0.0, description="Средняя длительность сброса в миллисекундах")
+
+
+class TronNodeStats(BaseModel):
+    """Схема с состоянием одного узла TRON."""
+
+    endpoint: str = Field(..., description="Базовый URL HTTP API узла")
+    healthy: bool = Field(..., description="Считается ли узел исправным")
+    ewma_latency_ms: Optional[float] = Field(None, description="Сглаженная (EWMA) задержка в миллисекундах")
+    requests: int = Field(0, description="Количество запросов к узлу")
+    failures: int = Field(0, description="Количество неудачных запросов")
+    consecutive_failures: int = Field(0, description="Количество ошибок подряд")
+
+
+class TronNodePoolStats(BaseModel):
+    """Схема с состоянием пула узлов TRON."""
+
+    hedged_requests: int = Field(0, description="Количество запросов, продублированных на второй узел")
+    nodes: List[TronNodeStats] = Field(..., description="Узлы в порядке выбора для следующего запроса")
+
+
+class CircuitBreakerStats(BaseModel):
+    """Схема с состоянием автоматического выключателя запросов к TRON API."""
+
+    enabled: bool = Field(..., description="Включен ли выключатель")
+    state: Optional[str] = Field(None, description="Состояние: closed, open или half_open")
+    consecutive_failures: int = Field(0, description="Количество ошибок подряд")
+    opened: int = Field(0, description="Сколько раз выключатель размыкался")
+    rejected: int = Field(0, description="Количество запросов, отклоненных без обращения к TRON API")
+
+
+class RateLimiterStats(BaseModel):
+    """Схема с метриками ограничителя исходящих запросов к TRON API."""
+
+    enabled: bool = Field(..., description="Включено ли ограничение")
+    rate: float = Field(0.0, description="Квота запросов в секунду")
+    capacity: int = Field(0, description="Максимальный всплеск запросов")
+    waiting: int = Field(0, description="Текущее количество запросов в очереди ожидания")
+    acquired: int = Field(0, description="Количество пропущенных запросов")
+    rejected: int = Field(0, description="Количество запросов, отклоненных по переполнению очереди или таймауту")
+    waited: int = Field(0, description="Количество запросов, ожидавших токен")
+    avg_wait_ms: float = Field(0.0, description="Среднее время ожидания токена в миллисекундах")
+    max_wait_ms: float = Field(0.0, description="Максимальное время ожидания токена в миллисекундах")
@@ -0,0 +1,3 @@
+from .schemas import WatchlistAddRequest, WatchedAddressResponse, WatchlistPollerStats
+
+__all__ = ["WatchlistAddRequest", "WatchedAddressResponse", "WatchlistPollerStats"]
@@ -0,0 +1,62 @@
+from pydantic import BaseModel, Field, field_validator
+from typing import Optional
+from datetime import datetime
+import uuid
+
+from app.schemas.tron.schemas import NumericStr
+from app.utils import is_valid_tron_address
+
+
+class WatchlistAddRequest(BaseModel):
+    """Схема для добавления адреса в список отслеживания."""
+
+    address: str = Field(..., description="TRON-адрес для отслеживания")
+    label: Optional[str] = Field(None, max_length=255, description="Произвольная метка адреса")
+
+    @field_validator("address")
+    @classmethod
+    def validate_address(cls, value: str) -> str:
+        """
+        Локальная проверка адреса до добавления в список.
+
+        Args:
+            value: TRON-адрес
+
+        Returns:
+            str: Проверенный адрес
+
+        Raises:
+            ValueError: Если адрес не проходит проверку base58check
+        """
+        if not is_valid_tron_address(value):
+            raise ValueError("Некорректный TRON-адрес: ошибка формата или контрольной суммы base58check")
+        return value
+
+
+class WatchedAddressResponse(BaseModel):
+    """Схема отслеживаемого адреса с последними известными значениями."""
+
+    id: uuid.UUID = Field(..., description="Уникальный идентификатор записи")
+    address: str = Field(..., description="TRON-адрес")
+    label: Optional[str] = Field(None, description="Произвольная метка адреса")
+    bandwidth: Optional[NumericStr] = Field(None, description="Последний известный bandwidth адреса")
+    energy: Optional[NumericStr] = Field(None, description="Последняя известная energy адреса")
+    balance: Optional[NumericStr] = Field(None, description="Последний известный баланс в TRX")
+    changed_at: Optional[datetime] = Field(None, description="Время последнего изменения значений")
+    created_at: datetime = Field(..., description="Дата и время добавления в список")
+
+    class Config:
+        from_attributes = True
+
+
+class WatchlistPollerStats(BaseModel):
+    """Схема с метриками фонового опроса списка отслеживания."""
+
+    enabled: bool = Field(..., description="Включен ли фоновый опрос")
+    cycles: int = Field(0, description="Количество завершенных циклов опроса")
+    skipped: int = Field(0, description="Количество циклов, пропущенных из-за опроса другим воркером")
+    polled: int = Field(0, description="Количество успешно опрошенных адресов")
+    changed: int = Field(0, description="Количество изменений, сохраненных в историю")
+    failed: int = Field(0, description="Количество адресов, опрошенных с ошибкой")
+    last_cycle_seconds: Optional[float] = Field(None, description="Длительность последнего цикла в секундах")
+    running: bool = Field(False, description="Выполняется ли фоновая задача")
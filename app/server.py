@@ -0,0 +1,11 @@
+from uvicorn.workers import UvicornWorker as BaseUvicornWorker
+
+
+class UvicornWorker(BaseUvicornWorker):
+    """
+    Рабочий процесс gunicorn с uvicorn на uvloop и httptools.
+
+    Используется в gunicorn.conf.py для продакшен-запуска без автоперезагрузки.
+    """
+
+    CONFIG_KWARGS = {"loop": "uvloop", "http": "httptools", "lifespan": "on"}
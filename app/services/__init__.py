@@ -1,3 +1,19 @@
 from .tron.service import TronService
+from .tron.cache import AddressInfoCache
+from .tron.resilience import CircuitBreaker, RetryPolicy
+from .history.writer import HistoryWriter
+from .history.partitions import PartitionMaintainer
+from .history.export import export_history, EXPORT_MEDIA_TYPES
+from .watchlist.poller import WatchlistPoller
 
-__all__ = ["TronService"]
\ No newline at end of file
+__all__ = [
+    "TronService",
+    "AddressInfoCache",
+    "CircuitBreaker",
+    "RetryPolicy",
+    "HistoryWriter",
+    "PartitionMaintainer",
+    "export_history",
+    "EXPORT_MEDIA_TYPES",
+    "WatchlistPoller"
+]
@@ -0,0 +1,5 @@
+from .writer import HistoryWriter
+from .partitions import PartitionMaintainer
+from .export import export_history, EXPORT_MEDIA_TYPES
+
+__all__ = ["HistoryWriter", "PartitionMaintainer", "export_history", "EXPORT_MEDIA_TYPES"]
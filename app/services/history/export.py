@@ -0,0 +1,128 @@
+import csv
+import io
+import json
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, AsyncIterator, Callable, List, Optional, Sequence
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories import AddressRepository
+from app.utils import log
+
+# Колонки выгрузки в порядке полей строки AddressRepository.stream_history
+EXPORT_COLUMNS = ("id", "address", "bandwidth", "energy", "balance", "created_at")
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv"
+}
+
+
+def _format_value(value: Any) -> Optional[str]:
+    """
+    Преобразует значение колонки в строку так же, как это делает API истории.
+
+    Args:
+        value: Значение колонки
+
+    Returns:
+        Optional[str]: Строковое представление или None
+    """
+    if value is None:
+        return None
+    if isinstance(value, Decimal):
+        # normalize убирает хвостовые нули NUMERIC(38, 6): 100.500000 -> 100.5
+        return format(value.normalize(), "f")
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return str(value)
+
+
+def format_ndjson(rows: Sequence[Sequence[Any]]) -> str:
+    """
+    Форматирует строки истории в NDJSON.
+
+    Args:
+        rows: Строки истории
+
+    Returns:
+        str: По одному JSON-объекту на строку
+    """
+    return "".join(
+        json.dumps(dict(zip(EXPORT_COLUMNS, map(_format_value, row))), ensure_ascii=False) + "\n"
+        for row in rows
+    )
+
+
+def format_csv(rows: Sequence[Sequence[Any]], header: bool = False) -> str:
+    """
+    Форматирует строки истории в CSV.
+
+    Args:
+        rows: Строки истории
+        header: Добавить строку заголовка
+
+    Returns:
+        str: Строки CSV
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    if header:
+        writer.writerow(EXPORT_COLUMNS)
+    writer.writerows([_format_value(value) for value in row] for row in rows)
+    return buffer.getvalue()
+
+
+async def export_history(
+        session_factory: Callable[[], AsyncSession],
+        export_format: str,
+        address: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        batch_size: int = 1000
+) -> AsyncIterator[str]:
+    """
+    Потоковая выгрузка истории запросов в NDJSON или CSV.
+
+    Сессия открывается на все время выгрузки и не зависит от обработчика
+    запроса. Строки читаются из серверного курсора и отдаются порциями по
+    batch_size, поэтому память не растет с объемом истории.
+
+    Args:
+        session_factory: Фабрика асинхронных сессий БД
+        export_format: Формат выгрузки: ndjson или csv
+        address: TRON-адрес (None - все адреса)
+        created_from: Начало периода (включительно)
+        created_to: Конец периода (не включительно)
+        batch_size: Количество строк в одной порции
+
+    Yields:
+        str: Очередная порция выгрузки
+    """
+    if export_format == "csv":
+        yield format_csv([], header=True)
+    formatter = format_csv if export_format == "csv" else format_ndjson
+
+    exported = 0
+    async with session_factory() as db:
+        try:
+            batch: List[Sequence[Any]] = []
+            async for row in AddressRepository(db).stream_history(address, created_from, created_to, batch_size):
+                batch.append(row)
+                if len(batch) >= batch_size:
+                    yield formatter(batch)
+                    exported += len(batch)
+                    batch = []
+            if batch:
+                yield formatter(batch)
+                exported += len(batch)
+        except Exception as e:
+            # Статус ответа уже отправлен, поэтому выгрузка просто обрывается
+            log.error("Выгрузка истории прервана после {} записей: {}", exported, e)
+            raise
+
+    log.info("Выгрузка истории завершена ({}), записей: {}", export_format, exported)
@@ -0,0 +1,256 @@
+import asyncio
+import re
+from datetime import date, datetime
+from typing import Callable, Dict, Iterable, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories.tron.counter import history_count_cache
+from app.utils import log
+
+TABLE_NAME = "addressquery"
+DEFAULT_PARTITION = f"{TABLE_NAME}_default"
+
+# Ключ advisory-блокировки, чтобы несколько воркеров не обслуживали секции одновременно
+_ADVISORY_LOCK_KEY = 0x74726F6E
+
+_PARTITION_NAME_RE = re.compile(rf"^{TABLE_NAME}_p(\d{{4}})(\d{{2}})$")
+
+
+def add_months(month: date, months: int) -> date:
+    """
+    Сдвигает первое число месяца на заданное количество месяцев.
+
+    Args:
+        month: Первое число месяца
+        months: Количество месяцев (может быть отрицательным)
+
+    Returns:
+        date: Первое число полученного месяца
+    """
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """
+    Имя месячной секции таблицы истории.
+
+    Args:
+        month: Первое число месяца
+
+    Returns:
+        str: Имя секции вида addressquery_p202501
+    """
+    return f"{TABLE_NAME}_p{month:%Y%m}"
+
+
+def months_to_create(today: date, months_ahead: int) -> List[date]:
+    """
+    Месяцы, секции для которых должны существовать заранее.
+
+    Args:
+        today: Текущая дата
+        months_ahead: Сколько месяцев вперед создавать секции
+
+    Returns:
+        List[date]: Первые числа месяцев от текущего до текущего + months_ahead
+    """
+    current = today.replace(day=1)
+    return [add_months(current, i) for i in range(months_ahead + 1)]
+
+
+def expired_partitions(names: Iterable[str], today: date, retention_months: int) -> List[str]:
+    """
+    Секции, все записи которых старше срока хранения.
+
+    Args:
+        names: Имена существующих секций
+        today: Текущая дата
+        retention_months: Срок хранения в месяцах (текущий месяц не считается)
+
+    Returns:
+        List[str]: Имена секций для удаления
+    """
+    cutoff = add_months(today.replace(day=1), -retention_months)
+    expired = []
+    for name in names:
+        match = _PARTITION_NAME_RE.match(name)
+        if match and date(int(match.group(1)), int(match.group(2)), 1) < cutoff:
+            expired.append(name)
+    return sorted(expired)
+
+
+class PartitionMaintainer:
+    """
+    Фоновое обслуживание месячных секций таблицы истории запросов.
+
+    Заранее создает секции на months_ahead месяцев вперед и, если задан срок
+    хранения, удаляет целиком секции старше retention_months месяцев вместо
+    построчного DELETE. Работает только с PostgreSQL.
+    """
+
+    def __init__(
+            self,
+            session_factory: Callable[[], AsyncSession],
+            months_ahead: int,
+            retention_months: Optional[int],
+            interval: float
+    ):
+        """
+        Инициализация обслуживания секций.
+
+        Args:
+            session_factory: Фабрика асинхронных сессий БД
+            months_ahead: Сколько месяцев вперед создавать секции
+            retention_months: Срок хранения истории в месяцах (None - хранить всегда)
+            interval: Интервал между запусками обслуживания в секундах
+        """
+        self._session_factory = session_factory
+        self.months_ahead = months_ahead
+        self.retention_months = retention_months
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+        self._stop_event = asyncio.Event()
+
+    def start(self) -> None:
+        """Запуск фоновой задачи обслуживания секций."""
+        self._stop_event.clear()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Остановка фоновой задачи обслуживания секций."""
+        self._stop_event.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+
+    async def run_once(self, today: Optional[date] = None) -> Dict[str, List[str]]:
+        """
+        Однократное обслуживание секций.
+
+        Каждая секция создается в своей транзакции, удаление устаревших
+        секций - в отдельной: ошибка с одним месяцем не останавливает
+        создание остальных секций и соблюдение срока хранения.
+
+        Args:
+            today: Текущая дата (по умолчанию - сегодня по UTC)
+
+        Returns:
+            Dict: Имена созданных и удаленных секций
+        """
+        today = today or datetime.utcnow().date()
+        result: Dict[str, List[str]] = {"created": [], "dropped": []}
+
+        async with self._session_factory() as db:
+            if db.get_bind().dialect.name != "postgresql":
+                return result
+            existing = set(await self._list_partitions(db))
+
+        for month in months_to_create(today, self.months_ahead):
+            name = partition_name(month)
+            if name in existing:
+                continue
+            try:
+                async with self._session_factory() as db:
+                    await db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _ADVISORY_LOCK_KEY})
+                    if await self._create_partition(db, month):
+                        result["created"].append(name)
+                    await db.commit()
+            except Exception as e:
+                log.error("Не удалось создать секцию истории {}: {}", name, e)
+
+        if self.retention_months is not None and expired_partitions(existing, today, self.retention_months):
+            async with self._session_factory() as db:
+                await db.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _ADVISORY_LOCK_KEY})
+                # Под блокировкой список перечитывается: секции мог удалить другой экземпляр
+                expired = expired_partitions(await self._list_partitions(db), today, self.retention_months)
+                for name in expired:
+                    await db.execute(text(f"ALTER TABLE {TABLE_NAME} DETACH PARTITION {name}"))
+                    await db.execute(text(f"DROP TABLE {name}"))
+                await db.commit()
+            result["dropped"].extend(expired)
+
+        if result["dropped"]:
+            history_count_cache.invalidate()
+        if result["created"] or result["dropped"]:
+            log.info("Обслуживание секций истории: создано {}, удалено {}", result["created"], result["dropped"])
+        return result
+
+    async def _create_partition(self, db: AsyncSession, month: date) -> bool:
+        """
+        Создание секции месяца.
+
+        Если обслуживание отстало и записи этого месяца уже попали в секцию
+        по умолчанию, CREATE TABLE ... PARTITION OF завершился бы ошибкой.
+        Тогда секция создается отдельной таблицей, записи месяца переносятся
+        в нее из секции по умолчанию, и она присоединяется к таблице истории.
+
+        Args:
+            db: Асинхронная сессия БД
+            month: Первое число месяца
+
+        Returns:
+            bool: False, если секцию уже создал другой экземпляр сервиса
+        """
+        name = partition_name(month)
+        if name in await self._list_partitions(db):
+            return False
+
+        bounds = {"start": month, "end": add_months(month, 1)}
+        values = f"FOR VALUES FROM ('{month.isoformat()}') TO ('{bounds['end'].isoformat()}')"
+        in_default = await db.scalar(
+            text(
+                f"SELECT EXISTS (SELECT 1 FROM {DEFAULT_PARTITION} "
+                "WHERE created_at >= :start AND created_at < :end)"
+            ),
+            bounds
+        )
+        if not in_default:
+            await db.execute(text(f"CREATE TABLE {name} PARTITION OF {TABLE_NAME} {values}"))
+            return True
+
+        log.warning("Записи за {:%Y-%m} попали в секцию по умолчанию, переносим их в {}", month, name)
+        await db.execute(text(f"CREATE TABLE {name} (LIKE {TABLE_NAME} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"))
+        await db.execute(
+            text(
+                f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} "
+                "WHERE created_at >= :start AND created_at < :end RETURNING *) "
+                f"INSERT INTO {name} SELECT * FROM moved"
+            ),
+            bounds
+        )
+        await db.execute(text(f"ALTER TABLE {TABLE_NAME} ATTACH PARTITION {name} {values}"))
+        return True
+
+    async def _list_partitions(self, db: AsyncSession) -> List[str]:
+        """
+        Имена секций таблицы истории.
+
+        Args:
+            db: Асинхронная сессия БД
+
+        Returns:
+            List[str]: Имена секций
+        """
+        result = await db.execute(
+            text(
+                "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = CAST(:table AS regclass)"
+            ),
+            {"table": TABLE_NAME}
+        )
+        return list(result.scalars().all())
+
+    async def _run(self) -> None:
+        """Цикл фоновой задачи: обслуживание раз в interval секунд до остановки."""
+        while not self._stop_event.is_set():
+            try:
+                await self.run_once()
+            except Exception as e:
+                log.error("Ошибка при обслуживании секций истории: {}", e)
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
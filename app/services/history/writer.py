@@ -0,0 +1,243 @@
+import asyncio
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.repositories import AddressRepository
+from app.exceptions import HistoryQueueFullError
+from app.utils import log
+from app.utils.metrics import DB_OPERATION_DURATION
+from app.utils.timing import stage
+
+# Маркер остановки, будящий фоновую задачу, которая ждет новых записей
+_STOP = object()
+
+
+class HistoryWriter:
+    """
+    Отложенная (write-behind) запись истории запросов адресов.
+
+    Записи складываются в ограниченную очередь в памяти, а фоновая задача
+    сохраняет их пакетами при накоплении batch_size записей или по истечении
+    flush_interval секунд.
+    """
+
+    def __init__(
+            self,
+            session_factory: Callable[[], AsyncSession],
+            max_size: int,
+            batch_size: int,
+            flush_interval: float,
+            enqueue_timeout: float
+    ):
+        """
+        Инициализация очереди записи.
+
+        Args:
+            session_factory: Фабрика асинхронных сессий БД
+            max_size: Максимальное количество записей в очереди
+            batch_size: Количество записей, при котором очередь сбрасывается в БД
+            flush_interval: Максимальное время ожидания перед сбросом в секундах
+            enqueue_timeout: Время ожидания места в переполненной очереди в секундах
+        """
+        self._session_factory = session_factory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.enqueue_timeout = enqueue_timeout
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=max_size)
+        # Сигнал о том, что фоновая задача забрала записи и в очереди появилось место
+        self._space_freed = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._stopping = False
+
+        self.enqueued = 0
+        self.flushed = 0
+        self.dropped = 0
+        self.rejected = 0
+        self.backpressure_waits = 0
+        self.flushes = 0
+        self.flush_time_total = 0.0
+        self.last_flush_latency = 0.0
+
+    def start(self) -> None:
+        """Запуск фоновой задачи записи."""
+        self._stopping = False
+        self._task = asyncio.create_task(self._run())
+        log.info("Запущена отложенная запись истории запросов")
+
+    async def stop(self) -> None:
+        """Остановка фоновой задачи с гарантированным сбросом очереди в БД."""
+        self._stopping = True
+        try:
+            self._queue.put_nowait(_STOP)
+        except asyncio.QueueFull:
+            # Очередь заполнена, значит фоновая задача не ждет и сама увидит остановку
+            pass
+        if self._task is not None:
+            await self._task
+            self._task = None
+        log.info("Отложенная запись истории остановлена, сохранено записей: {}", self.flushed)
+
+    async def enqueue(self, data: Dict[str, Any]) -> None:
+        """
+        Добавление записи о запросе в очередь.
+
+        Время запроса фиксируется в момент постановки в очередь.
+
+        Args:
+            data: Данные записи о запросе адреса
+
+        Raises:
+            HistoryQueueFullError: Если очередь не освободилась за enqueue_timeout
+        """
+        if self._stopping:
+            raise HistoryQueueFullError("Запись истории запросов остановлена")
+
+        record = {**data, "created_at": datetime.utcnow()}
+        try:
+            self._queue.put_nowait(record)
+        except asyncio.QueueFull:
+            # Очередь переполнена: ждем, пока фоновая задача ее разгрузит
+            self.backpressure_waits += 1
+            try:
+                await asyncio.wait_for(self._queue.put(record), self.enqueue_timeout)
+            except asyncio.TimeoutError:
+                self.rejected += 1
+                raise HistoryQueueFullError()
+        self.enqueued += 1
+
+    async def enqueue_many(self, items: List[Dict[str, Any]]) -> None:
+        """
+        Добавление нескольких записей о запросах в очередь.
+
+        Записи ставятся в очередь все сразу или ни одной: если место для
+        всего пакета не освободилось за enqueue_timeout, в очередь не
+        попадает ни одна запись, и клиент получает ошибку без частичной записи.
+
+        Args:
+            items: Данные записей о запросах адресов
+
+        Raises:
+            HistoryQueueFullError: Если места для всех записей не освободилось за enqueue_timeout
+        """
+        if self._stopping:
+            raise HistoryQueueFullError("Запись истории запросов остановлена")
+        if not items:
+            return
+        if len(items) > self._queue.maxsize:
+            self.rejected += len(items)
+            raise HistoryQueueFullError()
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.enqueue_timeout
+        waited = False
+        while self._queue.maxsize - self._queue.qsize() < len(items):
+            # Очередь переполнена: ждем, пока фоновая задача ее разгрузит
+            if not waited:
+                self.backpressure_waits += 1
+                waited = True
+            self._space_freed.clear()
+            try:
+                await asyncio.wait_for(self._space_freed.wait(), deadline - loop.time())
+            except asyncio.TimeoutError:
+                self.rejected += len(items)
+                raise HistoryQueueFullError()
+
+        # Между проверкой места и вставкой нет await, поэтому место не займут другие
+        created_at = datetime.utcnow()
+        for data in items:
+            self._queue.put_nowait({**data, "created_at": created_at})
+        self.enqueued += len(items)
+
+    async def _run(self) -> None:
+        """Цикл фоновой задачи: собирает пакеты и сохраняет их в БД."""
+        while not (self._stopping and self._queue.empty()):
+            batch = await self._next_batch()
+            if batch:
+                await self._flush(batch)
+
+    async def _next_batch(self) -> List[Dict[str, Any]]:
+        """
+        Сбор пакета записей по порогу размера или времени.
+
+        Returns:
+            List: Записи для сохранения (может быть пустым)
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.flush_interval
+        batch: List[Dict[str, Any]] = []
+
+        while len(batch) < self.batch_size:
+            # Забираем все, что уже лежит в очереди, без ожидания
+            while len(batch) < self.batch_size and not self._queue.empty():
+                self._append(batch, self._queue.get_nowait())
+            self._space_freed.set()
+            if len(batch) >= self.batch_size or (self._stopping and self._queue.empty()):
+                break
+
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                self._append(batch, await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+            self._space_freed.set()
+
+        return batch
+
+    @staticmethod
+    def _append(batch: List[Dict[str, Any]], item: Any) -> None:
+        """
+        Добавление записи в пакет с пропуском маркера остановки.
+
+        Args:
+            batch: Собираемый пакет
+            item: Элемент из очереди
+        """
+        if item is not _STOP:
+            batch.append(item)
+
+    async def _flush(self, batch: List[Dict[str, Any]]) -> None:
+        """
+        Сохранение пакета записей одной вставкой.
+
+        Args:
+            batch: Записи для сохранения
+        """
+        started = time.perf_counter()
+        try:
+            async with self._session_factory() as db:
+                await AddressRepository(db).bulk_create(batch)
+                with stage("db_commit", DB_OPERATION_DURATION.labels("commit")):
+                    await db.commit()
+            self.flushed += len(batch)
+        except Exception as e:
+            self.dropped += len(batch)
+            log.error("Ошибка при сохранении пакета истории ({} записей): {}", len(batch), e)
+        finally:
+            self.last_flush_latency = time.perf_counter() - started
+            self.flush_time_total += self.last_flush_latency
+            self.flushes += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Метрики очереди записи.
+
+        Returns:
+            Dict: Глубина очереди, счетчики записей и задержка сброса
+        """
+        return {
+            "queue_depth": self._queue.qsize(),
+            "queue_max_size": self._queue.maxsize,
+            "enqueued": self.enqueued,
+            "flushed": self.flushed,
+            "dropped": self.dropped,
+            "rejected": self.rejected,
+            "backpressure_waits": self.backpressure_waits,
+            "flushes": self.flushes,
+            "last_flush_latency_ms": round(self.last_flush_latency * 1000, 3),
+            "avg_flush_latency_ms": round(self.flush_time_total / self.flushes * 1000, 3) if self.flushes else 0.0
+        }
@@ -1,3 +1,4 @@
 from .service import TronService
+from .cache import AddressInfoCache
 
-__all__ = ["TronService"]
\ No newline at end of file
+__all__ = ["TronService", "AddressInfoCache"]
\ No newline at end of file
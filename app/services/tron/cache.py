@@ -0,0 +1,168 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from app.utils import log
+
+
+class AddressInfoCache:
+    """
+    In-process LRU-кеш с TTL для информации о TRON-адресах.
+
+    Одновременные промахи по одному адресу объединяются: к TRON API уходит
+    один запрос, результат которого получают все ожидающие. Устаревшие записи
+    остаются в кеше до вытеснения, чтобы их можно было отдать, пока TRON API
+    недоступен.
+    """
+
+    def __init__(
+            self,
+            max_size: int,
+            ttl: float,
+            timer: Callable[[], float] = time.monotonic
+    ):
+        """
+        Инициализация кеша.
+
+        Args:
+            max_size: Максимальное количество адресов в кеше
+            ttl: Время актуальности записи в секундах
+            timer: Источник монотонного времени
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._timer = timer
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._in_flight: Dict[str, asyncio.Task] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.coalesced = 0
+        self.stale_hits = 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Получение актуальной записи из кеша.
+
+        Args:
+            key: TRON-адрес
+
+        Returns:
+            Optional[Dict]: Информация о адресе или None, если записи нет или она устарела
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= self._timer():
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def get_stale(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Получение записи из кеша без учета TTL.
+
+        Используется как запасной ответ, когда свежие данные получить нельзя.
+
+        Args:
+            key: TRON-адрес
+
+        Returns:
+            Optional[Dict]: Копия последней известной информации о адресе или None
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        self.stale_hits += 1
+        return dict(entry[1])
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        """
+        Сохранение записи в кеш с вытеснением самых старых записей.
+
+        Args:
+            key: TRON-адрес
+            value: Информация о адресе
+        """
+        self._entries[key] = (self._timer() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def get_or_load(
+            self,
+            key: str,
+            loader: Callable[[str], Awaitable[Dict[str, Any]]],
+            use_cache: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Получение записи из кеша или загрузка через loader.
+
+        Args:
+            key: TRON-адрес
+            loader: Корутина для загрузки информации о адресе
+            use_cache: False, чтобы пропустить кеш и прочитать свежие данные
+
+        Returns:
+            Dict: Информация о адресе
+        """
+        if use_cache:
+            value = self.get(key)
+            if value is not None:
+                self.hits += 1
+                return dict(value)
+
+            task = self._in_flight.get(key)
+            if task is not None:
+                self.coalesced += 1
+                return dict(await asyncio.shield(task))
+
+        self.misses += 1
+        task = asyncio.ensure_future(loader(key))
+        if use_cache:
+            self._in_flight[key] = task
+        task.add_done_callback(lambda t: self._on_loaded(key, t))
+
+        # shield: отмена одного клиента не прерывает общий запрос к TRON API
+        return dict(await asyncio.shield(task))
+
+    def _on_loaded(self, key: str, task: asyncio.Task) -> None:
+        """
+        Сохраняет результат завершенной загрузки в кеш.
+
+        Args:
+            key: TRON-адрес
+            task: Завершенная задача загрузки
+        """
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+
+        if task.cancelled():
+            return
+        if task.exception() is not None:
+            log.debug("Ошибка загрузки адреса {} не кешируется: {}", key, task.exception())
+            return
+        self.set(key, task.result())
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Счетчики работы кеша.
+
+        Returns:
+            Dict: Попадания, промахи, вытеснения, объединенные запросы, устаревшие ответы и размер кеша
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "coalesced": self.coalesced,
+            "stale_hits": self.stale_hits,
+            "size": len(self._entries),
+            "max_size": self.max_size
+        }
@@ -0,0 +1,203 @@
+import asyncio
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Tuple, Type, TypeVar
+
+from app.utils import log
+from app.exceptions import TronCircuitOpenException
+
+T = TypeVar("T")
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Автоматический выключатель для запросов к TRON API.
+
+    В состоянии closed запросы проходят, а ошибки подряд считаются. После
+    failure_threshold ошибок выключатель переходит в open и recovery_timeout
+    секунд сразу отклоняет запросы. Затем в состоянии half_open пропускается
+    до half_open_max_calls пробных запросов: успех закрывает выключатель,
+    ошибка снова открывает его.
+    """
+
+    def __init__(
+            self,
+            failure_threshold: int,
+            recovery_timeout: float,
+            half_open_max_calls: int = 1,
+            timer: Callable[[], float] = time.monotonic
+    ):
+        """
+        Инициализация выключателя.
+
+        Args:
+            failure_threshold: Количество ошибок подряд для размыкания
+            recovery_timeout: Время в состоянии open до пробных запросов в секундах
+            half_open_max_calls: Количество одновременных пробных запросов
+            timer: Источник монотонного времени
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._timer = timer
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._half_open_calls = 0
+        self._probe_started_at = 0.0
+
+        self.consecutive_failures = 0
+        self.opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        """Текущее состояние с учетом истечения recovery_timeout."""
+        if self._state == OPEN and self._timer() - self._opened_at >= self.recovery_timeout:
+            self._state = HALF_OPEN
+            self._half_open_calls = 0
+            log.info("Выключатель TRON API перешел в состояние half-open")
+        elif self._state == HALF_OPEN and self._timer() - self._probe_started_at >= self.recovery_timeout:
+            # Пробный запрос так и не завершился (например, был отменен) - разрешаем новый
+            self._half_open_calls = 0
+        return self._state
+
+    def before_call(self) -> None:
+        """
+        Проверка, можно ли выполнить запрос.
+
+        Raises:
+            TronCircuitOpenException: Если выключатель разомкнут или пробные запросы уже выполняются
+        """
+        state = self.state
+        if state == CLOSED:
+            return
+        if state == HALF_OPEN and self._half_open_calls < self.half_open_max_calls:
+            self._half_open_calls += 1
+            self._probe_started_at = self._timer()
+            return
+        self.rejected += 1
+        raise TronCircuitOpenException()
+
+    def record_success(self) -> None:
+        """Учет успешного запроса."""
+        if self._state == OPEN:
+            # Запрос начался до размыкания - замыкать выключатель по нему рано
+            return
+        if self._state == HALF_OPEN:
+            log.info("Выключатель TRON API замкнут после успешного пробного запроса")
+        self._state = CLOSED
+        self.consecutive_failures = 0
+
+    def record_failure(self) -> None:
+        """Учет неудачного запроса."""
+        self.consecutive_failures += 1
+        if self._state == HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self._state != OPEN:
+                self.opened += 1
+                log.warning("Выключатель TRON API разомкнут после {} ошибок подряд", self.consecutive_failures)
+            self._state = OPEN
+            self._opened_at = self._timer()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Метрики выключателя.
+
+        Returns:
+            Dict: Состояние и счетчики выключателя
+        """
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "opened": self.opened,
+            "rejected": self.rejected
+        }
+
+
+class RetryPolicy:
+    """
+    Повтор идемпотентных запросов с экспоненциальной задержкой и джиттером.
+
+    Все попытки вместе с паузами укладываются в deadline секунд: попытка
+    ограничивается оставшимся временем, а пауза, которая не помещается в
+    остаток, не выполняется.
+    """
+
+    def __init__(
+            self,
+            attempts: int,
+            base_delay: float,
+            max_delay: float,
+            deadline: float,
+            timer: Callable[[], float] = time.monotonic
+    ):
+        """
+        Инициализация политики повторов.
+
+        Args:
+            attempts: Максимальное количество попыток (1 - без повторов)
+            base_delay: Базовая пауза перед повтором в секундах
+            max_delay: Максимальная пауза перед повтором в секундах
+            deadline: Общее время на все попытки в секундах
+            timer: Источник монотонного времени
+        """
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.deadline = deadline
+        self._timer = timer
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Пауза перед повтором (full jitter).
+
+        Args:
+            attempt: Номер неудачной попытки, начиная с 1
+
+        Returns:
+            float: Случайная пауза от 0 до min(max_delay, base_delay * 2^(attempt-1))
+        """
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+    async def call(
+            self,
+            func: Callable[[], Awaitable[T]],
+            retry_on: Tuple[Type[BaseException], ...],
+            on_timeout: Callable[[], BaseException]
+    ) -> T:
+        """
+        Выполнение запроса с повторами.
+
+        Args:
+            func: Фабрика корутины запроса
+            retry_on: Исключения, после которых запрос можно повторить
+            on_timeout: Фабрика исключения при исчерпании deadline
+
+        Returns:
+            T: Результат запроса
+
+        Raises:
+            BaseException: Последняя ошибка запроса или ошибка on_timeout
+        """
+        started = self._timer()
+        attempt = 0
+        while True:
+            attempt += 1
+            remaining = self.deadline - (self._timer() - started)
+            if remaining <= 0:
+                raise on_timeout()
+            try:
+                return await asyncio.wait_for(func(), remaining)
+            except asyncio.TimeoutError:
+                raise on_timeout()
+            except retry_on as e:
+                if attempt >= self.attempts:
+                    raise
+                delay = self.backoff(attempt)
+                if self._timer() - started + delay >= self.deadline:
+                    raise
+                log.warning("Повтор запроса к TRON API (попытка {}) через {:.3f} с: {}", attempt + 1, delay, e)
+                await asyncio.sleep(delay)
@@ -1,24 +1,111 @@
-from tronpy import Tron
+from tronpy import AsyncTron
 from tronpy.exceptions import (
     ApiError,
     AddressNotFound,
     NotFound,
     UnknownError,
-    ValidationError,
-    BadAddress
+    ValidationError
 )
-from typing import Dict, Any
+from decimal import Decimal
+from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar, Union
+import asyncio
 
-from app.utils import log
-from app.exceptions import TronAPIException, TronAddressNotFoundException, TronNetworkException
+from app.utils import log, request_log, is_valid_tron_address
+from app.utils.metrics import TRON_REQUEST_DURATION
+from app.utils.timing import stage
+from app.services.tron.cache import AddressInfoCache
+from app.services.tron.resilience import CircuitBreaker, RetryPolicy
+from app.exceptions import (
+    BaseAppException,
+    TronAPIException,
+    TronAddressNotFoundException,
+    TronNetworkException,
+    TronCircuitOpenException,
+    TronRateLimitException
+)
+
+T = TypeVar("T")
 
 
 class TronService:
     """Сервис для работы с TRON API."""
 
-    def __init__(self):
-        """Инициализация клиента TRON API."""
-        self.client = Tron(network='mainnet')
+    def __init__(
+            self,
+            client: AsyncTron,
+            cache: Optional[AddressInfoCache] = None,
+            breaker: Optional[CircuitBreaker] = None,
+            retry_policy: Optional[RetryPolicy] = None
+    ):
+        """
+        Инициализация сервиса.
+
+        Args:
+            client: Общий асинхронный клиент TRON API
+            cache: Общий кеш информации о адресах (None - без кеширования)
+            breaker: Общий автоматический выключатель (None - без выключателя)
+            retry_policy: Политика повторов запросов (None - без повторов)
+        """
+        self.client = client
+        self.cache = cache
+        self.breaker = breaker
+        self.retry_policy = retry_policy
+
+    async def get_cached_address_info(self, address: str, use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Получение информации о TRON-адресе через кеш.
+
+        Args:
+            address: TRON-адрес
+            use_cache: False, чтобы пропустить кеш и прочитать свежие данные
+
+        Returns:
+            Dict: Информация о адресе (bandwidth, energy, баланс)
+
+        Raises:
+            TronCircuitOpenException: Если выключатель разомкнут и в кеше нет записи об адресе
+        """
+        if self.cache is None:
+            return await self.get_address_info(address)
+        try:
+            return await self.cache.get_or_load(address, self.get_address_info, use_cache=use_cache)
+        except TronCircuitOpenException:
+            # Пока TRON API недоступен, лучше отдать последние известные данные
+            stale = self.cache.get_stale(address)
+            if stale is None:
+                raise
+            log.warning("TRON API недоступен, для адреса {} отдана устаревшая запись из кеша", address)
+            return stale
+
+    async def get_many_address_info(
+            self,
+            addresses: List[str],
+            concurrency: int,
+            use_cache: bool = True
+    ) -> List[Union[Dict[str, Any], BaseAppException]]:
+        """
+        Получение информации о нескольких TRON-адресах с ограничением параллелизма.
+
+        Ошибка по одному адресу не прерывает обработку остальных.
+
+        Args:
+            addresses: Список TRON-адресов
+            concurrency: Максимальное количество одновременных запросов к TRON API
+            use_cache: False, чтобы пропустить кеш и прочитать свежие данные
+
+        Returns:
+            List: Информация о адресе или исключение для каждого адреса в исходном порядке
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(address: str) -> Union[Dict[str, Any], BaseAppException]:
+            async with semaphore:
+                try:
+                    return await self.get_cached_address_info(address, use_cache=use_cache)
+                except BaseAppException as e:
+                    return e
+
+        return list(await asyncio.gather(*(fetch(address) for address in addresses)))
 
     async def get_address_info(self, address: str) -> Dict[str, Any]:
         """
@@ -32,73 +119,151 @@ class TronService:
 
         Raises:
             TronAddressNotFoundException: Если адрес не найден
+            TronCircuitOpenException: Если выключатель разомкнут
+            TronRateLimitException: Если запрос не уложился в квоту запросов
             TronNetworkException: При ошибке сети
             TronAPIException: При других ошибках TRON API
         """
         try:
-            log.info(f"Запрос информации для адреса {address}")
-
-            # Проверка формата адреса
-            try:
-                # Валидация формата адреса может вызвать BadAddress
-                if not address.startswith('T') or len(address) != 34:
-                    raise BadAddress("Некорректный формат TRON-адреса")
-            except BadAddress as e:
-                log.error(f"Некорректный формат адреса: {str(e)}")
-                raise TronAddressNotFoundException(f"Некорректный формат TRON-адреса: {str(e)}")
-
-            # Получаем аккаунт
-            try:
-                account = self.client.get_account_balance(address)
-            except AddressNotFound as e:
-                log.error(f"Адрес {address} не найден: {str(e)}")
-                raise TronAddressNotFoundException(f"Адрес {address} не найден в сети TRON")
-            except NotFound as e:
-                log.error(f"Ресурс не найден: {str(e)}")
-                raise TronAddressNotFoundException(f"Ресурс не найден: {str(e)}")
-
-            # Получаем bandwidth и energy
-            try:
-                account_resource = self.client.get_account_resource(address)
-            except ApiError as e:
-                log.error(f"Ошибка API при получении ресурсов аккаунта: {str(e)}")
-                raise TronNetworkException(f"Ошибка API при получении ресурсов аккаунта: {str(e)}")
-            except Exception as e:
-                log.error(f"Ошибка при получении ресурсов аккаунта: {str(e)}")
-                raise TronNetworkException(f"Ошибка при получении ресурсов аккаунта: {str(e)}")
-
-            # Получаем баланс в TRX
-            try:
-                balance = self.client.get_account_balance(address)
-            except ApiError as e:
-                log.error(f"Ошибка API при получении баланса: {str(e)}")
-                raise TronNetworkException(f"Ошибка API при получении баланса: {str(e)}")
-            except Exception as e:
-                log.error(f"Ошибка при получении баланса: {str(e)}")
-                raise TronNetworkException(f"Ошибка при получении баланса: {str(e)}")
+            request_log.info("Запрос информации для адреса {}", address)
+
+            # Локальная проверка адреса (base58check), чтобы не тратить запросы к узлу
+            with stage("validation"):
+                valid = is_valid_tron_address(address)
+            if not valid:
+                log.warning("Некорректный формат адреса: {}", address)
+                raise TronAddressNotFoundException("Некорректный формат TRON-адреса: ошибка base58check")
+
+            # При разомкнутом выключателе не ждем таймаута, а сразу отвечаем ошибкой
+            if self.breaker is not None:
+                self.breaker.before_call()
+
+            # Баланс и ресурсы запрашиваем одновременно, одним вызовом каждого метода
+            balance, account_resource = await asyncio.gather(
+                self._with_retry(lambda: self._get_balance(address)),
+                self._with_retry(lambda: self._get_account_resource(address)),
+                return_exceptions=True
+            )
+
+            # Выключатель учитывает только сбои сети; "адрес не найден" - нормальный ответ,
+            # а отказ ограничителя квоты ничего не говорит о доступности TRON API
+            if self.breaker is not None:
+                results = (balance, account_resource)
+                if any(isinstance(result, TronNetworkException) for result in results):
+                    self.breaker.record_failure()
+                elif not any(isinstance(result, TronRateLimitException) for result in results):
+                    self.breaker.record_success()
+
+            # Ошибка баланса (в том числе "адрес не найден") приоритетнее ошибки ресурсов
+            if isinstance(balance, BaseException):
+                raise balance
+            if isinstance(account_resource, BaseException):
+                raise account_resource
 
             # Формируем результат
-            bandwidth = str(account_resource.get("freeNetLimit", 0)) if account_resource else "0"
-            energy = str(account_resource.get("EnergyLimit", 0)) if account_resource else "0"
+            bandwidth = int(account_resource.get("freeNetLimit", 0)) if account_resource else 0
+            energy = int(account_resource.get("EnergyLimit", 0)) if account_resource else 0
 
             return {
                 "address": address,
                 "bandwidth": bandwidth,
                 "energy": energy,
-                "balance": str(balance)
+                "balance": balance
             }
-        except (TronAddressNotFoundException, TronNetworkException):
+        except (TronAddressNotFoundException, TronNetworkException, TronRateLimitException):
             # Пробрасываем уже созданные исключения
             raise
         except ValidationError as e:
-            log.error(f"Ошибка валидации данных TRON API: {str(e)}")
+            log.error("Ошибка валидации данных TRON API: {}", e)
             raise TronAPIException(f"Ошибка валидации данных TRON API: {str(e)}")
         except ApiError as e:
-            log.error(f"Ошибка TRON API: {str(e)}")
+            log.error("Ошибка TRON API: {}", e)
             raise TronAPIException(f"Ошибка при взаимодействии с TRON API: {str(e)}")
         except UnknownError as e:
-            log.error(f"Неизвестная ошибка TRON API: {str(e)}")
+            log.error("Неизвестная ошибка TRON API: {}", e)
             raise TronAPIException(f"Неизвестная ошибка при взаимодействии с TRON API: {str(e)}")
         except Exception as e:
-            log.error(f"Неожиданная ошибка при получении данных из TRON API: {str(e)}")
-            raise TronAPIException(f"Неожиданная ошибка при взаимодействии с TRON API: {str(e)}")
\ No newline at end of file
+            log.error("Неожиданная ошибка при получении данных из TRON API: {}", e)
+            raise TronAPIException(f"Неожиданная ошибка при взаимодействии с TRON API: {str(e)}")
+
+    async def _with_retry(self, func: Callable[[], Awaitable[T]]) -> T:
+        """
+        Выполнение идемпотентного запроса к TRON API с повторами при сбоях сети.
+
+        Args:
+            func: Фабрика корутины запроса
+
+        Returns:
+            T: Результат запроса
+
+        Raises:
+            TronNetworkException: Если запрос не удался за отведенные попытки и время
+        """
+        if self.retry_policy is None:
+            return await func()
+        return await self.retry_policy.call(
+            func,
+            retry_on=(TronNetworkException,),
+            on_timeout=lambda: TronNetworkException("Превышено время ожидания ответа TRON API")
+        )
+
+    async def _get_balance(self, address: str) -> Decimal:
+        """
+        Получение баланса аккаунта в TRX.
+
+        Этот же вызов служит проверкой существования адреса в сети TRON.
+
+        Args:
+            address: TRON-адрес
+
+        Returns:
+            Decimal: Баланс в TRX
+
+        Raises:
+            TronAddressNotFoundException: Если адрес не найден
+            TronNetworkException: При ошибке сети или API
+            TronRateLimitException: Если запрос не уложился в квоту запросов
+        """
+        try:
+            with stage("tron_balance", TRON_REQUEST_DURATION.labels("get_account_balance")):
+                return await self.client.get_account_balance(address)
+        except TronRateLimitException:
+            raise
+        except AddressNotFound as e:
+            log.error("Адрес {} не найден: {}", address, e)
+            raise TronAddressNotFoundException(f"Адрес {address} не найден в сети TRON")
+        except NotFound as e:
+            log.error("Ресурс не найден: {}", e)
+            raise TronAddressNotFoundException(f"Ресурс не найден: {str(e)}")
+        except ApiError as e:
+            log.error("Ошибка API при получении баланса: {}", e)
+            raise TronNetworkException(f"Ошибка API при получении баланса: {str(e)}")
+        except Exception as e:
+            log.error("Ошибка при получении баланса: {}", e)
+            raise TronNetworkException(f"Ошибка при получении баланса: {str(e)}")
+
+    async def _get_account_resource(self, address: str) -> Dict[str, Any]:
+        """
+        Получение ресурсов аккаунта (bandwidth и energy).
+
+        Args:
+            address: TRON-адрес
+
+        Returns:
+            Dict: Ресурсы аккаунта
+
+        Raises:
+            TronNetworkException: При ошибке сети или API
+            TronRateLimitException: Если запрос не уложился в квоту запросов
+        """
+        try:
+            with stage("tron_resource", TRON_REQUEST_DURATION.labels("get_account_resource")):
+                return await self.client.get_account_resource(address)
+        except TronRateLimitException:
+            raise
+        except ApiError as e:
+            log.error("Ошибка API при получении ресурсов аккаунта: {}", e)
+            raise TronNetworkException(f"Ошибка API при получении ресурсов аккаунта: {str(e)}")
+        except Exception as e:
+            log.error("Ошибка при получении ресурсов аккаунта: {}", e)
+            raise TronNetworkException(f"Ошибка при получении ресурсов аккаунта: {str(e)}")
@@ -0,0 +1,3 @@
+from .poller import WatchlistPoller
+
+__all__ = ["WatchlistPoller"]
@@ -0,0 +1,243 @@
+import asyncio
+import time
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from app.core.rate_limiter import TokenBucket, use_rate_limiter
+from app.repositories import AddressRepository, WatchlistRepository
+from app.services.tron.service import TronService
+from app.exceptions import BaseAppException, TronCircuitOpenException
+from app.utils import log
+from app.utils.metrics import DB_OPERATION_DURATION
+from app.utils.timing import stage
+
+# Ключ advisory-блокировки, чтобы список опрашивал только один воркер
+_ADVISORY_LOCK_KEY = 0x77617463
+
+
+class WatchlistPoller:
+    """
+    Фоновый опрос списка отслеживаемых адресов.
+
+    Раз в interval секунд обходит список пакетами по batch_size адресов
+    (keyset-пагинация по адресу) и запрашивает свежие данные через
+    TronService в обход кеша, не более concurrency запросов одновременно.
+    Запросы опроса расходуют свою квоту rate_limiter, а не квоту запросов
+    пользователей. Запись истории создается только для адресов, у которых
+    изменился bandwidth, energy или баланс; последние значения хранятся
+    в самой записи списка, изменения каждого пакета сохраняются короткой
+    транзакцией. В PostgreSQL цикл выполняет только воркер, получивший
+    сессионную advisory-блокировку; транзакция на время цикла не открывается.
+    """
+
+    def __init__(
+            self,
+            session_factory: Callable[[], AsyncSession],
+            service_factory: Callable[[], TronService],
+            interval: float,
+            batch_size: int,
+            concurrency: int,
+            rate_limiter: Optional[TokenBucket] = None
+    ):
+        """
+        Инициализация опроса списка.
+
+        Args:
+            session_factory: Фабрика асинхронных сессий БД
+            service_factory: Фабрика сервиса TRON API
+            interval: Интервал между циклами опроса в секундах
+            batch_size: Количество адресов в одном пакете
+            concurrency: Максимальное количество одновременных запросов к TRON API
+            rate_limiter: Отдельный ограничитель запросов опроса (None - общий ограничитель клиента)
+        """
+        self._session_factory = session_factory
+        self._service_factory = service_factory
+        self.interval = interval
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.rate_limiter = rate_limiter
+        self.cycles = 0
+        self.skipped = 0
+        self.polled = 0
+        self.changed = 0
+        self.failed = 0
+        self.last_cycle_seconds: Optional[float] = None
+        self._task: Optional[asyncio.Task] = None
+        self._stop_event = asyncio.Event()
+
+    def start(self) -> None:
+        """Запуск фоновой задачи опроса."""
+        self._stop_event.clear()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Остановка фоновой задачи опроса."""
+        self._stop_event.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+
+    async def run_once(self) -> Dict[str, int]:
+        """
+        Однократный опрос всего списка.
+
+        Returns:
+            Dict: Количество опрошенных, изменившихся и неудачно опрошенных адресов
+        """
+        result = {"polled": 0, "changed": 0, "failed": 0}
+        started = time.perf_counter()
+
+        async with self._session_factory() as lock_db:
+            lock = None
+            if lock_db.get_bind().dialect.name == "postgresql":
+                lock = await self._try_lock(lock_db)
+                if lock is None:
+                    self.skipped += 1
+                    return result
+            try:
+                with use_rate_limiter(self.rate_limiter):
+                    await self._poll(result)
+            finally:
+                if lock is not None:
+                    await lock.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": _ADVISORY_LOCK_KEY})
+
+        self.cycles += 1
+        self.polled += result["polled"]
+        self.changed += result["changed"]
+        self.failed += result["failed"]
+        self.last_cycle_seconds = time.perf_counter() - started
+        if result["changed"] or result["failed"]:
+            log.info(
+                "Опрос списка отслеживания: опрошено {}, изменилось {}, ошибок {}",
+                result["polled"], result["changed"], result["failed"]
+            )
+        return result
+
+    async def _try_lock(self, db: AsyncSession) -> Optional[AsyncConnection]:
+        """
+        Попытка получить сессионную advisory-блокировку опроса.
+
+        Соединение переводится в режим autocommit: блокировка держится до
+        pg_advisory_unlock без открытой транзакции (idle in transaction).
+
+        Args:
+            db: Асинхронная сессия БД, соединение которой держит блокировку
+
+        Returns:
+            Optional[AsyncConnection]: Соединение с блокировкой или None, если ее держит другой воркер
+        """
+        connection = await db.connection(execution_options={"isolation_level": "AUTOCOMMIT"})
+        acquired = await connection.scalar(
+            text("SELECT pg_try_advisory_lock(:key)"), {"key": _ADVISORY_LOCK_KEY}
+        )
+        return connection if acquired else None
+
+    async def _poll(self, result: Dict[str, int]) -> None:
+        """
+        Обход списка пакетами с сохранением изменений.
+
+        Args:
+            result: Счетчики цикла, дополняются по мере обхода
+        """
+        service = self._service_factory()
+        after: Optional[str] = None
+        while not self._stop_event.is_set():
+            async with self._session_factory() as db:
+                rows = await WatchlistRepository(db).get_batch(after, self.batch_size)
+            if not rows:
+                break
+            after = rows[-1].address
+
+            infos = await service.get_many_address_info(
+                [row.address for row in rows], self.concurrency, use_cache=False
+            )
+            changed = await self._save_changes(rows, infos)
+            failures = [info for info in infos if isinstance(info, BaseAppException)]
+
+            result["polled"] += len(rows) - len(failures)
+            result["changed"] += changed
+            result["failed"] += len(failures)
+
+            # Пока TRON API недоступен, остальные пакеты опрашивать бессмысленно
+            if any(isinstance(info, TronCircuitOpenException) for info in failures):
+                log.warning("TRON API недоступен, опрос списка отслеживания прерван")
+                break
+
+    async def _save_changes(self, rows: list, infos: list) -> int:
+        """
+        Сохранение изменившихся значений пакета.
+
+        Args:
+            rows: Строки списка (id, address, bandwidth, energy, balance)
+            infos: Информация о адресах или исключения в том же порядке
+
+        Returns:
+            int: Количество изменившихся адресов
+        """
+        now = datetime.utcnow()
+        snapshots = []
+        updates = []
+        for row, info in zip(rows, infos):
+            if isinstance(info, BaseAppException):
+                continue
+            current = (int(info["bandwidth"]), int(info["energy"]), Decimal(info["balance"]))
+            if current == (row.bandwidth, row.energy, row.balance):
+                continue
+            bandwidth, energy, balance = current
+            snapshots.append({
+                "address": row.address,
+                "bandwidth": bandwidth,
+                "energy": energy,
+                "balance": balance,
+                "created_at": now
+            })
+            updates.append({
+                "id": row.id,
+                "bandwidth": bandwidth,
+                "energy": energy,
+                "balance": balance,
+                "changed_at": now,
+                "updated_at": now
+            })
+
+        if snapshots:
+            async with self._session_factory() as db:
+                await AddressRepository(db).bulk_create(snapshots)
+                await WatchlistRepository(db).update_values(updates)
+                with stage("db_commit", DB_OPERATION_DURATION.labels("commit")):
+                    await db.commit()
+        return len(snapshots)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Статистика опроса списка.
+
+        Returns:
+            Dict: Количество циклов, пропущенных циклов, опрошенных, изменившихся
+                и неудачно опрошенных адресов, длительность последнего цикла
+        """
+        return {
+            "cycles": self.cycles,
+            "skipped": self.skipped,
+            "polled": self.polled,
+            "changed": self.changed,
+            "failed": self.failed,
+            "last_cycle_seconds": self.last_cycle_seconds,
+            "running": self._task is not None and not self._task.done()
+        }
+
+    async def _run(self) -> None:
+        """Цикл фоновой задачи: опрос раз в interval секунд до остановки."""
+        while not self._stop_event.is_set():
+            try:
+                await self.run_once()
+            except Exception as e:
+                log.error("Ошибка при опросе списка отслеживания: {}", e)
+            try:
+                await asyncio.wait_for(self._stop_event.wait(), self.interval)
+            except asyncio.TimeoutError:
+                pass
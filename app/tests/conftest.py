@@ -1,47 +1,76 @@
+import os
+import tempfile
 import pytest
 import asyncio
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool
 
-from app.core import Base, get_db
+from app.config import settings
+from app.core import Base, get_db, get_session_factory
 from app.main import app
 from app.models import AddressQuery
 
 
-# Настройка тестовой БД
-SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+# Настройка тестовой БД: файл SQLite, общий для синхронной сессии тестов
+# и асинхронной (aiosqlite) сессии приложения
+SQLITE_PATH = os.path.join(tempfile.gettempdir(), f"tron_tracker_test_{os.getpid()}.db")
+SQLALCHEMY_DATABASE_URL = f"sqlite:///{SQLITE_PATH}"
+ASYNC_SQLALCHEMY_DATABASE_URL = f"sqlite+aiosqlite:///{SQLITE_PATH}"
+
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
     connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
+    poolclass=NullPool,
 )
+async_engine = create_async_engine(ASYNC_SQLALCHEMY_DATABASE_URL, poolclass=NullPool)
+
 
-# Включаем проверку внешних ключей для SQLite
+# Включаем проверку внешних ключей и WAL для SQLite
 @event.listens_for(engine, "connect")
+@event.listens_for(async_engine.sync_engine, "connect")
 def set_sqlite_pragma(dbapi_connection, connection_record):
     cursor = dbapi_connection.cursor()
     cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.execute("PRAGMA journal_mode=WAL")
     cursor.close()
 
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+AsyncTestingSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
 
 
 # Переопределение зависимости БД для тестов
-def override_get_db():
-    db = TestingSessionLocal()
-    try:
-        yield db
-        db.commit()  # Добавляем явный commit
-    except Exception:
-        db.rollback()
-        raise
-    finally:
-        db.close()
+async def override_get_db():
+    async with AsyncTestingSessionLocal() as db:
+        try:
+            yield db
+            await db.commit()  # Добавляем явный commit
+        except Exception:
+            await db.rollback()
+            raise
 
 
 app.dependency_overrides[get_db] = override_get_db
+app.dependency_overrides[get_session_factory] = lambda: AsyncTestingSessionLocal
+
+# Секционирование доступно только в PostgreSQL, в тестах обслуживание секций не запускаем
+settings.HISTORY_PARTITION_MAINTENANCE = False
+settings.WATCHLIST_POLL_ENABLED = False
+
+
+@pytest.fixture(scope="session", autouse=True)
+def sqlite_file():
+    """
+    Удаляет файл тестовой БД после завершения тестов.
+    """
+    yield
+    async_engine.sync_engine.dispose()
+    engine.dispose()
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(SQLITE_PATH + suffix):
+            os.remove(SQLITE_PATH + suffix)
 
 
 @pytest.fixture(scope="function")
@@ -70,6 +99,23 @@ def test_db():
     Base.metadata.drop_all(bind=engine)
 
 
+@pytest.fixture(scope="function")
+async def async_db(test_db):
+    """
+    Возвращает асинхронную сессию к тестовой базе данных.
+    """
+    async with AsyncTestingSessionLocal() as db:
+        yield db
+
+
+@pytest.fixture(scope="function")
+def async_session_factory(test_db):
+    """
+    Возвращает фабрику асинхронных сессий к тестовой базе данных.
+    """
+    return AsyncTestingSessionLocal
+
+
 @pytest.fixture(scope="function")
 def client():
     """
@@ -85,8 +131,8 @@ def mock_tron_data():
     Тестовые данные об адресе TRON.
     """
     return {
-        "address": "TJ8RoHsTnHdUGtrvXZtzP7GdYB4DW3ct9W",
+        "address": "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t",
         "bandwidth": "5000",
         "energy": "2000",
         "balance": "100.5"
-    }
\ No newline at end of file
+    }
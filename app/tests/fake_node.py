@@ -0,0 +1,109 @@
+import asyncio
+import random
+from typing import Dict, Optional
+
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+
+class FakeTronNode:
+    """
+    Локальный фейковый full-node TRON с управляемой задержкой и ошибками.
+
+    Отвечает на методы HTTP API, которые использует сервис, и считает
+    количество обращений. Приложение можно подключить к httpx через
+    FakeNodeTransport или запустить как обычный HTTP-сервер.
+    """
+
+    def __init__(
+            self,
+            delay: float = 0.0,
+            status_code: int = 200,
+            balance: int = 100_500_000,
+            jitter: float = 0.0,
+            error_rate: float = 0.0
+    ):
+        """
+        Инициализация фейкового узла.
+
+        Args:
+            delay: Задержка ответа в секундах
+            status_code: HTTP-код ответа (не 200 - узел отвечает ошибкой)
+            balance: Баланс аккаунта в SUN
+            jitter: Случайная добавка к задержке от 0 до jitter секунд
+            error_rate: Доля запросов, на которые узел отвечает ошибкой 503
+        """
+        self.delay = delay
+        self.status_code = status_code
+        self.balance = balance
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.requests: Dict[str, int] = {}
+        self.app = FastAPI()
+        self.app.add_api_route("/{method:path}", self.handle, methods=["POST"])
+
+    @property
+    def total_requests(self) -> int:
+        """Общее количество обращений к узлу."""
+        return sum(self.requests.values())
+
+    async def handle(self, method: str, request: Request) -> JSONResponse:
+        """
+        Обработка запроса к HTTP API узла.
+
+        Args:
+            method: Метод HTTP API
+            request: HTTP-запрос
+
+        Returns:
+            JSONResponse: Ответ узла
+        """
+        self.requests[method] = self.requests.get(method, 0) + 1
+        delay = self.delay + (random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay:
+            await asyncio.sleep(delay)
+        if self.status_code != 200:
+            return JSONResponse({"Error": "fake node failure"}, status_code=self.status_code)
+        if self.error_rate and random.random() < self.error_rate:
+            return JSONResponse({"Error": "fake node failure"}, status_code=503)
+
+        params = await request.json() if await request.body() else {}
+        if method == "wallet/getaccount":
+            return JSONResponse({"address": params.get("address"), "balance": self.balance})
+        if method == "wallet/getaccountresource":
+            return JSONResponse({"freeNetLimit": 5000, "EnergyLimit": 2000})
+        if method == "wallet/getnowblock":
+            return JSONResponse({"blockID": "00" * 32, "block_header": {"raw_data": {"number": 1}}})
+        return JSONResponse({})
+
+
+class FakeNodeTransport(httpx.AsyncBaseTransport):
+    """Транспорт httpx, направляющий запросы в фейковые узлы по имени хоста."""
+
+    def __init__(self, nodes: Dict[str, FakeTronNode]):
+        """
+        Инициализация транспорта.
+
+        Args:
+            nodes: Фейковые узлы по имени хоста
+        """
+        self.transports = {host: httpx.ASGITransport(app=node.app) for host, node in nodes.items()}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """
+        Передача запроса фейковому узлу.
+
+        Args:
+            request: HTTP-запрос
+
+        Returns:
+            httpx.Response: Ответ узла
+
+        Raises:
+            httpx.ConnectError: Если узел с таким хостом не зарегистрирован
+        """
+        transport: Optional[httpx.ASGITransport] = self.transports.get(request.url.host)
+        if transport is None:
+            raise httpx.ConnectError(f"Узел {request.url.host} недоступен", request=request)
+        return await transport.handle_async_request(request)
@@ -1,9 +1,17 @@
+import json
 import pytest
+from datetime import datetime
+from decimal import Decimal
 from unittest.mock import patch, AsyncMock
 from fastapi.testclient import TestClient
 
+from app.config import settings
+from app.core import db as db_module, get_db
+from app.main import app
 from app.services import TronService
 from app.models import AddressQuery
+from app.exceptions import TronAddressNotFoundException
+from app.tests.conftest import AsyncTestingSessionLocal
 
 
 @pytest.mark.asyncio
@@ -26,6 +34,7 @@ async def test_get_address_info(client: TestClient, mock_tron_data, test_db):
         # Проверяем, что запрос успешно обработан
         assert response.status_code == 200
         assert response.json() == mock_tron_data
+        assert "db_flush;dur=" in response.headers["server-timing"]
 
         # Проверяем, что метод получения информации был вызван с правильными параметрами
         mock_get_info.assert_called_once_with(mock_tron_data["address"])
@@ -37,9 +46,20 @@ async def test_get_address_info(client: TestClient, mock_tron_data, test_db):
         query_result = test_db.query(AddressQuery).filter_by(address=mock_tron_data["address"]).first()
         assert query_result is not None
         assert query_result.address == mock_tron_data["address"]
-        assert query_result.bandwidth == mock_tron_data["bandwidth"]
-        assert query_result.energy == mock_tron_data["energy"]
-        assert query_result.balance == mock_tron_data["balance"]
+        assert query_result.bandwidth == int(mock_tron_data["bandwidth"])
+        assert query_result.energy == int(mock_tron_data["energy"])
+        assert query_result.balance == Decimal(mock_tron_data["balance"])
+
+
+@pytest.mark.asyncio
+async def test_get_address_info_rejects_invalid_address(client: TestClient, mock_tron_data, test_db):
+    """Тест отклонения адреса с неверной контрольной суммой до обращения к TRON API."""
+
+    with patch.object(TronService, 'get_address_info', new_callable=AsyncMock) as mock_get_info:
+        response = client.post("/api/v1/tron/address", json={"address": f"{mock_tron_data['address'][:-1]}u"})
+
+    assert response.status_code == 422
+    mock_get_info.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -85,4 +105,312 @@ async def test_get_address_history(client: TestClient, mock_tron_data, test_db):
     data = response.json()
     assert len(data["items"]) == 5
     assert data["next_page"] is None
-    assert data["prev_page"] == 1
\ No newline at end of file
+    assert data["prev_page"] == 1
+
+
+@pytest.mark.asyncio
+async def test_get_address_info_uses_cache(client: TestClient, mock_tron_data, test_db):
+    """Тест ответа из кеша и обхода кеша флагом use_cache."""
+
+    with patch.object(
+            TronService,
+            'get_address_info',
+            new_callable=AsyncMock,
+            return_value=mock_tron_data
+    ) as mock_get_info:
+        for _ in range(3):
+            response = client.post("/api/v1/tron/address", json={"address": mock_tron_data["address"]})
+            assert response.status_code == 200
+
+        # Повторные запросы обслуживаются из кеша
+        assert mock_get_info.await_count == 1
+
+        # Флаг use_cache=False заставляет прочитать свежие данные
+        response = client.post(
+            "/api/v1/tron/address",
+            json={"address": mock_tron_data["address"], "use_cache": False}
+        )
+        assert response.status_code == 200
+        assert mock_get_info.await_count == 2
+
+    stats = client.get("/api/v1/tron/cache/stats").json()
+    assert stats["enabled"] is True
+    assert stats["hits"] == 2
+    assert stats["misses"] == 2
+
+    # Каждый запрос по-прежнему сохраняется в историю
+    assert test_db.query(AddressQuery).count() == 4
+
+
+@pytest.mark.asyncio
+async def test_get_address_info_batch(client: TestClient, mock_tron_data, test_db):
+    """Тест пакетного запроса с ошибкой по одному из адресов."""
+
+    missing_address = "TXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXX"
+
+    async def get_info(address):
+        if address == missing_address:
+            raise TronAddressNotFoundException(f"Адрес {address} не найден в сети TRON")
+        return {**mock_tron_data, "address": address}
+
+    addresses = [mock_tron_data["address"], missing_address, f"{mock_tron_data['address'][:-1]}X"]
+    with patch.object(TronService, 'get_address_info', new_callable=AsyncMock, side_effect=get_info):
+        response = client.post("/api/v1/tron/address/batch", json={"addresses": addresses})
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["succeeded"] == 2
+    assert data["failed"] == 1
+
+    # Результаты возвращаются в порядке адресов запроса
+    assert [item["address"] for item in data["items"]] == addresses
+    assert data["items"][0]["data"]["balance"] == mock_tron_data["balance"]
+    assert data["items"][1]["data"] is None
+    assert data["items"][1]["error"]["status_code"] == 404
+
+    # В БД сохранены только успешные запросы
+    assert test_db.query(AddressQuery).count() == 2
+
+
+@pytest.mark.asyncio
+async def test_get_address_info_write_behind(mock_tron_data, test_db, async_session_factory):
+    """Тест отложенной записи истории с гарантированным сбросом при остановке."""
+
+    with patch.object(settings, "HISTORY_WRITE_BEHIND", True), \
+            patch.object(settings, "HISTORY_FLUSH_INTERVAL", 10.0), \
+            patch("app.main.SessionLocal", async_session_factory), \
+            patch.object(TronService, 'get_address_info', new_callable=AsyncMock, return_value=mock_tron_data):
+        with TestClient(app) as c:
+            response = c.post("/api/v1/tron/address", json={"address": mock_tron_data["address"], "use_cache": False})
+            assert response.status_code == 200
+
+            stats = c.get("/api/v1/tron/history/writer/stats").json()
+            assert stats["enabled"] is True
+            assert stats["enqueued"] == 1
+
+    # После остановки приложения очередь сброшена в БД
+    assert test_db.query(AddressQuery).count() == 1
+
+
+@pytest.mark.asyncio
+async def test_get_address_history_by_cursor(client: TestClient, mock_tron_data, test_db):
+    """Тест эндпоинта истории запросов в режиме cursor."""
+
+    for i in range(15):
+        test_db.add(AddressQuery(
+            address=f"{mock_tron_data['address']}{i}",
+            bandwidth=mock_tron_data["bandwidth"],
+            energy=mock_tron_data["energy"],
+            balance=mock_tron_data["balance"]
+        ))
+    test_db.commit()
+
+    # Первая страница в режиме cursor
+    response = client.get("/api/v1/tron/history?mode=cursor&limit=10")
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["items"]) == 10
+    assert data["next_cursor"] is not None
+    assert "total" not in data
+
+    # Вторая страница по курсору
+    response = client.get(f"/api/v1/tron/history?cursor={data['next_cursor']}&limit=10")
+    data = response.json()
+    assert len(data["items"]) == 5
+    assert data["next_cursor"] is None
+
+    # Поврежденный курсор
+    response = client.get("/api/v1/tron/history?cursor=broken&limit=10")
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_single_address_history(client: TestClient, mock_tron_data, test_db):
+    """Тест эндпоинта истории одного адреса."""
+
+    address = mock_tron_data["address"]
+    for i in range(3):
+        test_db.add(AddressQuery(address=address, created_at=datetime(2025, 1, 1 + i)))
+    test_db.add(AddressQuery(address=f"{address}X", created_at=datetime(2025, 1, 2)))
+    test_db.commit()
+
+    response = client.get(f"/api/v1/tron/address/{address}/history?limit=2")
+    assert response.status_code == 200
+    data = response.json()
+    assert [item["address"] for item in data["items"]] == [address, address]
+    assert data["next_cursor"] is not None
+
+    response = client.get(
+        f"/api/v1/tron/address/{address}/history",
+        params={"created_from": "2025-01-02T00:00:00", "created_to": "2025-01-03T00:00:00"}
+    )
+    data = response.json()
+    assert len(data["items"]) == 1
+    assert data["items"][0]["created_at"].startswith("2025-01-02")
+
+    # Начало периода позже конца
+    response = client.get(
+        f"/api/v1/tron/address/{address}/history",
+        params={"created_from": "2025-01-03T00:00:00", "created_to": "2025-01-02T00:00:00"}
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_export_history(client: TestClient, mock_tron_data, test_db):
+    """Тест потоковой выгрузки истории в NDJSON и CSV."""
+
+    address = mock_tron_data["address"]
+    for i in range(3):
+        test_db.add(AddressQuery(
+            address=address,
+            bandwidth=5000,
+            energy=2000,
+            balance=Decimal("100.500000"),
+            created_at=datetime(2025, 1, 1 + i)
+        ))
+    test_db.add(AddressQuery(address=f"{address}X", created_at=datetime(2025, 1, 2)))
+    test_db.commit()
+
+    response = client.get("/api/v1/tron/history/export", params={"address": address})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["created_at"][:10] for row in rows] == ["2025-01-01", "2025-01-02", "2025-01-03"]
+    assert rows[0]["balance"] == "100.5"
+    assert rows[0]["bandwidth"] == "5000"
+
+    response = client.get(
+        "/api/v1/tron/history/export",
+        params={"format": "csv", "created_from": "2025-01-02T00:00:00", "created_to": "2025-01-03T00:00:00"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    lines = response.text.splitlines()
+    assert lines[0] == "id,address,bandwidth,energy,balance,created_at"
+    assert len(lines) == 3
+
+    # Начало периода позже конца
+    response = client.get(
+        "/api/v1/tron/history/export",
+        params={"created_from": "2025-01-03T00:00:00", "created_to": "2025-01-02T00:00:00"}
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_get_address_history_without_total(client: TestClient, mock_tron_data, test_db):
+    """Тест отказа клиента от подсчета общего количества записей."""
+
+    for i in range(3):
+        test_db.add(AddressQuery(address=f"{mock_tron_data['address']}{i}"))
+    test_db.commit()
+
+    response = client.get("/api/v1/tron/history?page=1&limit=2&include_total=false")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] is None
+    assert data["pages"] is None
+    assert data["next_page"] == 2
+
+
+@pytest.mark.asyncio
+async def test_get_address_history_renders_numbers_as_strings(client: TestClient, mock_tron_data, test_db):
+    """Тест строкового представления числовых колонок в ответе API."""
+
+    test_db.add(AddressQuery(
+        address=mock_tron_data["address"],
+        bandwidth=5000,
+        energy=2000,
+        balance=Decimal("100.500000")
+    ))
+    test_db.commit()
+
+    item = client.get("/api/v1/tron/history").json()["items"][0]
+    assert item["bandwidth"] == "5000"
+    assert item["energy"] == "2000"
+    assert item["balance"] == "100.5"
+
+
+@pytest.mark.asyncio
+async def test_metrics(client: TestClient, mock_tron_data, test_db):
+    """Тест метрик запросов, ошибок и операций с БД в /metrics."""
+
+    with patch.object(TronService, 'get_address_info', new_callable=AsyncMock, return_value=mock_tron_data):
+        assert client.post("/api/v1/tron/address", json={"address": mock_tron_data["address"]}).status_code == 200
+
+    with patch.object(
+            TronService,
+            'get_address_info',
+            new_callable=AsyncMock,
+            side_effect=TronAddressNotFoundException("Адрес не найден")
+    ):
+        response = client.post("/api/v1/tron/address", json={"address": mock_tron_data["address"], "use_cache": False})
+        assert response.status_code == 404
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+
+    body = response.text
+    assert 'http_request_duration_seconds_count{method="POST",route="/api/v1/tron/address",status="200"}' in body
+    assert 'http_request_duration_seconds_count{method="POST",route="/api/v1/tron/address",status="404"}' in body
+    assert 'app_errors_total{exception="TronAddressNotFoundException"}' in body
+    assert 'db_operation_duration_seconds_count{operation="flush"}' in body
+    assert "http_requests_in_flight" in body
+
+
+@pytest.mark.asyncio
+async def test_watchlist_crud(client: TestClient, mock_tron_data, test_db):
+    """Тест добавления, получения и удаления отслеживаемых адресов."""
+
+    address = mock_tron_data["address"]
+
+    response = client.post("/api/v1/watchlist", json={"address": address, "label": "кошелек"})
+    assert response.status_code == 201
+    data = response.json()
+    assert data["address"] == address
+    assert data["label"] == "кошелек"
+    assert data["balance"] is None
+
+    # Повторное добавление и некорректный адрес
+    assert client.post("/api/v1/watchlist", json={"address": address}).status_code == 409
+    assert client.post("/api/v1/watchlist", json={"address": "invalid_address"}).status_code == 422
+
+    response = client.get("/api/v1/watchlist", params={"page": 1, "limit": 10})
+    assert response.status_code == 200
+    assert response.json()["total"] == 1
+    assert response.json()["items"][0]["address"] == address
+
+    assert client.get(f"/api/v1/watchlist/{address}").status_code == 200
+    assert client.get("/api/v1/watchlist/poller/stats").json() == {
+        "enabled": False,
+        "cycles": 0,
+        "skipped": 0,
+        "polled": 0,
+        "changed": 0,
+        "failed": 0,
+        "last_cycle_seconds": None,
+        "running": False
+    }
+
+    assert client.delete(f"/api/v1/watchlist/{address}").status_code == 204
+    assert client.delete(f"/api/v1/watchlist/{address}").status_code == 404
+    assert client.get(f"/api/v1/watchlist/{address}").status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_real_get_db_keeps_route_errors(client: TestClient, mock_tron_data, test_db, monkeypatch):
+    """Тест: исходная зависимость get_db не превращает ответы 4xx обработчика в ошибку 500."""
+
+    monkeypatch.setattr(db_module, "SessionLocal", AsyncTestingSessionLocal)
+    monkeypatch.delitem(app.dependency_overrides, get_db)
+
+    address = mock_tron_data["address"]
+    response = client.get(f"/api/v1/watchlist/{address}")
+    assert response.status_code == 404
+    assert client.delete(f"/api/v1/watchlist/{address}").status_code == 404
+
+    assert client.post("/api/v1/watchlist", json={"address": address}).status_code == 201
+    assert client.post("/api/v1/watchlist", json={"address": address}).status_code == 409
+    assert client.get(f"/api/v1/watchlist/{address}").status_code == 200
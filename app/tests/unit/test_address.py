@@ -0,0 +1,69 @@
+import pytest
+from tronpy.keys import to_base58check_address
+
+from app.utils import is_valid_tron_address
+from app.utils.address import b58decode, b58decode_check, _check_tron_address
+
+ADDRESS = "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t"
+
+
+def test_valid_addresses():
+    """Тест корректных адресов, в том числе сгенерированных tronpy."""
+
+    assert is_valid_tron_address(ADDRESS)
+    assert is_valid_tron_address(to_base58check_address(bytes([0x41] + [7] * 20)))
+
+
+@pytest.mark.parametrize("address", [
+    "",
+    "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6",  # 33 символа
+    "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6u",  # неверная контрольная сумма
+    "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj60",  # символ вне алфавита base58
+    "XR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t",  # не начинается с T
+    "TXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXX",
+])
+def test_invalid_addresses(address):
+    """Тест отклонения некорректных адресов."""
+
+    assert not is_valid_tron_address(address)
+
+
+def test_b58decode_keeps_leading_zeros():
+    """Тест сохранения ведущих нулевых байтов при декодировании base58."""
+
+    assert b58decode("11") == b"\x00\x00"
+    assert b58decode_check(ADDRESS)[0] == 0x41
+
+
+def test_validation_results_are_cached():
+    """Тест LRU-кеша результатов проверки."""
+
+    _check_tron_address.cache_clear()
+    is_valid_tron_address(ADDRESS)
+    is_valid_tron_address(ADDRESS)
+
+    info = _check_tron_address.cache_info()
+    assert info.hits == 1
+    assert info.misses == 1
+
+
+def test_oversized_input_is_not_cached():
+    """Тест того, что строки неподходящей длины не попадают в кеш."""
+
+    _check_tron_address.cache_clear()
+    for i in range(10):
+        assert not is_valid_tron_address("T" * 100_000 + str(i))
+
+    assert _check_tron_address.cache_info().currsize == 0
+
+
+def test_address_validation_benchmark_runs(capsys):
+    """Тест однократного запуска бенчмарка проверки адресов."""
+
+    from benchmarks.bench_address_validation import main
+
+    main(["--number", "10"])
+
+    output = capsys.readouterr().out
+    assert "base58check без кеша" in output
+    assert "отказ по длине" in output
@@ -0,0 +1,98 @@
+import asyncio
+import pytest
+
+from app.services import AddressInfoCache
+
+ADDRESS = "TJ8RoHsTnHdUGtrvXZtzP7GdYB4DW3ct9W"
+
+
+class FakeTimer:
+    """Управляемый источник времени для проверки TTL."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+async def test_cache_hit_and_ttl_expiry():
+    """Тест попадания в кеш и устаревания записи по TTL."""
+
+    timer = FakeTimer()
+    cache = AddressInfoCache(max_size=10, ttl=5, timer=timer)
+    calls = []
+
+    async def loader(address):
+        calls.append(address)
+        return {"address": address, "balance": str(len(calls))}
+
+    assert (await cache.get_or_load(ADDRESS, loader))["balance"] == "1"
+    assert (await cache.get_or_load(ADDRESS, loader))["balance"] == "1"
+
+    # После истечения TTL данные загружаются заново
+    timer.now = 6
+    assert (await cache.get_or_load(ADDRESS, loader))["balance"] == "2"
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+
+
+async def test_cache_lru_eviction():
+    """Тест вытеснения самых давно использованных записей."""
+
+    cache = AddressInfoCache(max_size=2, ttl=60)
+    cache.set("a", {"address": "a"})
+    cache.set("b", {"address": "b"})
+    cache.get("a")
+    cache.set("c", {"address": "c"})
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.stats()["evictions"] == 1
+
+
+async def test_cache_coalesces_concurrent_misses():
+    """Тест объединения одновременных промахов по одному адресу."""
+
+    cache = AddressInfoCache(max_size=10, ttl=60)
+    release = asyncio.Event()
+    calls = []
+
+    async def loader(address):
+        calls.append(address)
+        await release.wait()
+        return {"address": address}
+
+    tasks = [asyncio.create_task(cache.get_or_load(ADDRESS, loader)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert len(calls) == 1
+    assert all(r == {"address": ADDRESS} for r in results)
+    assert cache.stats()["coalesced"] == 4
+
+
+async def test_cache_bypass_and_errors_not_cached():
+    """Тест обхода кеша и отсутствия кеширования ошибок."""
+
+    cache = AddressInfoCache(max_size=10, ttl=60)
+    calls = []
+
+    async def failing_loader(address):
+        calls.append(address)
+        raise RuntimeError("upstream error")
+
+    with pytest.raises(RuntimeError):
+        await cache.get_or_load(ADDRESS, failing_loader)
+    assert cache.get(ADDRESS) is None
+
+    async def loader(address):
+        calls.append(address)
+        return {"address": address}
+
+    await cache.get_or_load(ADDRESS, loader)
+    await cache.get_or_load(ADDRESS, loader, use_cache=False)
+    assert len(calls) == 3
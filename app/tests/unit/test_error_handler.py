@@ -0,0 +1,54 @@
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.exceptions import RecordNotFoundError
+from app.middleware import ErrorHandlerMiddleware, register_exception_handlers
+
+
+def create_app() -> FastAPI:
+    """Тестовое приложение с обработкой ошибок как в app.main."""
+    app = FastAPI()
+    register_exception_handlers(app)
+    app.add_middleware(ErrorHandlerMiddleware)
+
+    @app.get("/not-found")
+    async def not_found():
+        raise RecordNotFoundError("Запись не найдена", detail={"id": 1})
+
+    @app.get("/crash")
+    async def crash():
+        raise RuntimeError("сбой")
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for i in range(3):
+                yield f"{i}\n"
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    return app
+
+
+def test_error_response_shape():
+    """Тест формата ответа для исключений приложения и необработанных ошибок."""
+
+    client = TestClient(create_app())
+
+    response = client.get("/not-found")
+    assert response.status_code == 404
+    assert response.json() == {"message": "Запись не найдена", "detail": {"id": 1}}
+
+    response = client.get("/crash")
+    assert response.status_code == 500
+    assert response.json() == {"message": "Внутренняя ошибка сервера", "detail": "сбой"}
+
+
+def test_streaming_response_passes_through():
+    """Тест прохождения потокового ответа через middleware."""
+
+    client = TestClient(create_app())
+
+    response = client.get("/stream")
+    assert response.status_code == 200
+    assert response.text == "0\n1\n2\n"
@@ -0,0 +1,99 @@
+import asyncio
+import pytest
+from sqlalchemy import func, select
+
+from app.exceptions import HistoryQueueFullError
+from app.models import AddressQuery
+from app.services import HistoryWriter
+
+
+def make_record(i):
+    return {
+        "address": f"TJ8RoHsTnHdUGtrvXZtzP7GdYB4DW3ct9W{i}",
+        "bandwidth": "5000",
+        "energy": "2000",
+        "balance": "100.5"
+    }
+
+
+async def count_records(session_factory):
+    async with session_factory() as db:
+        return await db.scalar(select(func.count()).select_from(AddressQuery))
+
+
+async def test_writer_flushes_on_batch_size(async_session_factory):
+    """Тест сброса очереди в БД при накоплении пакета."""
+
+    writer = HistoryWriter(async_session_factory, max_size=100, batch_size=3, flush_interval=10, enqueue_timeout=1)
+    writer.start()
+    try:
+        await writer.enqueue_many([make_record(i) for i in range(3)])
+        for _ in range(100):
+            if writer.flushed == 3:
+                break
+            await asyncio.sleep(0.01)
+
+        assert writer.flushed == 3
+        assert writer.stats()["flushes"] == 1
+        assert await count_records(async_session_factory) == 3
+    finally:
+        await writer.stop()
+
+
+async def test_writer_flushes_on_stop(async_session_factory):
+    """Тест гарантированного сброса очереди при остановке."""
+
+    writer = HistoryWriter(async_session_factory, max_size=100, batch_size=50, flush_interval=10, enqueue_timeout=1)
+    writer.start()
+    await writer.enqueue_many([make_record(i) for i in range(5)])
+
+    # Остановка не ждет истечения flush_interval
+    await asyncio.wait_for(writer.stop(), timeout=2)
+
+    assert writer.flushed == 5
+    assert writer.stats()["queue_depth"] == 0
+    assert await count_records(async_session_factory) == 5
+
+
+async def test_writer_backpressure_rejects_when_full(async_session_factory):
+    """Тест отказа в записи при переполненной очереди."""
+
+    # Фоновая задача не запущена, поэтому очередь не разгружается
+    writer = HistoryWriter(async_session_factory, max_size=2, batch_size=10, flush_interval=10, enqueue_timeout=0.05)
+    await writer.enqueue(make_record(0))
+    await writer.enqueue(make_record(1))
+
+    with pytest.raises(HistoryQueueFullError):
+        await writer.enqueue(make_record(2))
+
+    stats = writer.stats()
+    assert stats["queue_depth"] == 2
+    assert stats["backpressure_waits"] == 1
+    assert stats["rejected"] == 1
+
+
+async def test_enqueue_many_is_all_or_nothing(async_session_factory):
+    """Тест постановки пакета в очередь целиком или никак."""
+
+    # Фоновая задача не запущена: на пакет из двух записей места нет
+    writer = HistoryWriter(async_session_factory, max_size=3, batch_size=10, flush_interval=10, enqueue_timeout=0.05)
+    await writer.enqueue_many([make_record(0), make_record(1)])
+
+    with pytest.raises(HistoryQueueFullError):
+        await writer.enqueue_many([make_record(2), make_record(3)])
+
+    # Ни одна запись отклоненного пакета не попала в очередь
+    stats = writer.stats()
+    assert stats["queue_depth"] == 2
+    assert stats["enqueued"] == 2
+    assert stats["rejected"] == 2
+
+    # После разгрузки очереди пакет ставится целиком
+    writer.enqueue_timeout = 2
+    pending = asyncio.ensure_future(writer.enqueue_many([make_record(2), make_record(3)]))
+    writer.start()
+    await pending
+    await writer.stop()
+
+    assert writer.flushed == 4
+    assert await count_records(async_session_factory) == 4
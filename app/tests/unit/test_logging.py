@@ -0,0 +1,47 @@
+import json
+
+import pytest
+
+from app.config import settings
+from app.utils import log, request_log, setup_logging
+
+
+@pytest.fixture
+def messages():
+    """Список сообщений из временного обработчика логов."""
+    records = []
+    handler_id = log.add(lambda message: records.append(message.record["message"]), level="DEBUG")
+    yield records
+    log.remove(handler_id)
+
+
+def test_request_log_sampling(monkeypatch, messages):
+    """Тест выборки строк INFO и обязательного вывода предупреждений."""
+
+    monkeypatch.setattr(settings, "LOG_REQUEST_SAMPLE_RATE", 0.0)
+    request_log.info("Запрос информации для адреса {}", "A")
+    request_log.warning("Предупреждение {}", 1)
+
+    monkeypatch.setattr(settings, "LOG_REQUEST_SAMPLE_RATE", 1.0)
+    request_log.info("Запрос информации для адреса {}", "B")
+
+    assert messages == ["Предупреждение 1", "Запрос информации для адреса B"]
+
+
+async def test_production_json_logging(monkeypatch, capsys):
+    """Тест фонового JSON-вывода в режиме production."""
+
+    monkeypatch.setattr(settings, "LOG_MODE", "production")
+    monkeypatch.setattr(settings, "LOG_JSON", True)
+    try:
+        setup_logging()
+        log.info("Сообщение {}", "JSON")
+        await log.complete()
+        lines = [line for line in capsys.readouterr().out.splitlines() if line]
+    finally:
+        monkeypatch.undo()
+        setup_logging()
+
+    record = json.loads(lines[-1])["record"]
+    assert record["message"] == "Сообщение JSON"
+    assert record["level"]["name"] == "INFO"
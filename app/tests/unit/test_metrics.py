@@ -0,0 +1,29 @@
+import asyncio
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import QueuePool
+
+from app.utils.metrics import REGISTRY, instrument_pool
+
+
+async def test_pool_metrics_follow_checkout_and_checkin():
+    """Тест обновления метрик пула при выдаче и возврате соединений."""
+
+    engine = create_engine("sqlite://", poolclass=QueuePool, pool_size=1, max_overflow=2)
+    instrument_pool(engine)
+    try:
+        first = engine.connect()
+        second = engine.connect()
+        first.execute(text("SELECT 1"))
+
+        assert REGISTRY.get_sample_value("db_pool_size") == 1
+        assert REGISTRY.get_sample_value("db_pool_checked_out") == 2
+        assert REGISTRY.get_sample_value("db_pool_overflow") == 1
+
+        second.close()
+        first.close()
+        await asyncio.sleep(0)
+        assert REGISTRY.get_sample_value("db_pool_checked_out") == 0
+        assert REGISTRY.get_sample_value("db_pool_checked_in") == 1
+    finally:
+        engine.dispose()
@@ -0,0 +1,117 @@
+import httpx
+import pytest
+from decimal import Decimal
+from tronpy import AsyncTron
+
+from app.core.node_pool import NodePoolProvider, MIN_HEDGE_SAMPLES
+from app.services import TronService
+from app.exceptions import TronNetworkException
+from app.tests.fake_node import FakeTronNode, FakeNodeTransport
+
+ADDRESS = "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t"
+
+
+def make_provider(nodes, **kwargs) -> NodePoolProvider:
+    """
+    Создает пул узлов поверх фейковых узлов.
+
+    Args:
+        nodes: Фейковые узлы по имени хоста
+        **kwargs: Дополнительные параметры NodePoolProvider
+
+    Returns:
+        NodePoolProvider: Провайдер пула узлов
+    """
+    client = httpx.AsyncClient(transport=FakeNodeTransport(nodes))
+    return NodePoolProvider([f"http://{host}" for host in nodes], client=client, timeout=5.0, **kwargs)
+
+
+async def test_routes_to_fastest_node():
+    """Тест выбора узла с наименьшей EWMA-задержкой."""
+
+    slow, fast = FakeTronNode(delay=0.02), FakeTronNode()
+    provider = make_provider({"slow": slow, "fast": fast})
+
+    for _ in range(10):
+        await provider.make_request("wallet/getnowblock")
+
+    # Каждый узел получил замер, дальше запросы идут на быстрый
+    assert slow.total_requests == 1
+    assert fast.total_requests == 9
+    assert provider.ranked_nodes()[0].endpoint == "http://fast/"
+
+
+async def test_fails_over_and_marks_node_unhealthy():
+    """Тест переключения на другой узел при ошибках и исключения неисправного узла."""
+
+    broken, healthy = FakeTronNode(status_code=503), FakeTronNode()
+    provider = make_provider({"broken": broken, "healthy": healthy}, failure_threshold=2)
+    provider.nodes[0].ewma_latency = 0.0  # неисправный узел изначально считается самым быстрым
+
+    for _ in range(5):
+        assert await provider.make_request("wallet/getnowblock")
+
+    # После двух ошибок подряд неисправный узел больше не выбирается первым
+    assert broken.total_requests == 2
+    assert healthy.total_requests == 5
+    stats = provider.stats()
+    assert [node["healthy"] for node in stats["nodes"]] == [True, False]
+
+    # Узел возвращается в работу после успешной проверки доступности
+    broken.status_code = 200
+    await provider.check_health()
+    assert provider.is_healthy(provider.nodes[0])
+
+
+async def test_client_errors_do_not_fail_over():
+    """Тест того, что ошибка самого запроса (4xx) не переключает узел."""
+
+    rejecting, other = FakeTronNode(status_code=400), FakeTronNode()
+    provider = make_provider({"rejecting": rejecting, "other": other})
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await provider.make_request("wallet/getnowblock")
+
+    assert other.total_requests == 0
+    assert provider.is_healthy(provider.nodes[0])
+
+
+async def test_hedges_slow_request():
+    """Тест отправки копии запроса на второй узел при медленном ответе."""
+
+    primary, secondary = FakeTronNode(), FakeTronNode()
+    provider = make_provider({"primary": primary, "secondary": secondary}, hedge_percentile=95)
+
+    # Набираем статистику задержек основного узла
+    provider.nodes[1].ewma_latency = 1.0
+    for _ in range(MIN_HEDGE_SAMPLES):
+        await provider.make_request("wallet/getnowblock")
+    assert secondary.total_requests == 0
+
+    # Основной узел "подвис": ответ приходит с резервного
+    primary.delay = 1.0
+    assert await provider.make_request("wallet/getnowblock")
+    assert provider.hedged_requests == 1
+    assert secondary.total_requests == 1
+
+
+async def test_service_through_node_pool():
+    """Тест получения информации о адресе через пул узлов при отказе одного из них."""
+
+    provider = make_provider({"down": FakeTronNode(status_code=502), "up": FakeTronNode()})
+    service = TronService(AsyncTron(provider))
+
+    result = await service.get_address_info(ADDRESS)
+
+    assert result["balance"] == Decimal("100.5")
+    assert result["bandwidth"] == 5000
+
+
+async def test_service_raises_when_all_nodes_down():
+    """Тест ошибки сети, если недоступны все узлы."""
+
+    provider = make_provider({"down": FakeTronNode(status_code=503)})
+    service = TronService(AsyncTron(provider))
+
+    with pytest.raises(TronNetworkException):
+        await service.get_address_info(ADDRESS)
@@ -0,0 +1,99 @@
+from datetime import date
+from types import SimpleNamespace
+
+from app.services import PartitionMaintainer
+from app.services.history.partitions import (
+    add_months,
+    partition_name,
+    months_to_create,
+    expired_partitions
+)
+
+
+def test_add_months_crosses_year_boundary():
+    """Тест сдвига месяца через границу года."""
+
+    assert add_months(date(2025, 11, 1), 3) == date(2026, 2, 1)
+    assert add_months(date(2025, 1, 1), -1) == date(2024, 12, 1)
+
+
+def test_months_to_create():
+    """Тест списка секций, создаваемых заранее."""
+
+    months = months_to_create(date(2025, 12, 15), months_ahead=2)
+
+    assert months == [date(2025, 12, 1), date(2026, 1, 1), date(2026, 2, 1)]
+    assert partition_name(months[1]) == "addressquery_p202601"
+
+
+def test_expired_partitions():
+    """Тест выбора секций старше срока хранения."""
+
+    names = [
+        "addressquery_p202501",
+        "addressquery_p202502",
+        "addressquery_p202503",
+        "addressquery_p202504",
+        "addressquery_default",
+    ]
+
+    # При сроке хранения 2 месяца в апреле остаются февраль, март и апрель
+    assert expired_partitions(names, date(2025, 4, 10), retention_months=2) == ["addressquery_p202501"]
+    assert expired_partitions(names, date(2025, 4, 10), retention_months=12) == []
+
+
+async def test_run_once_skips_non_postgresql(async_session_factory):
+    """Тест пропуска обслуживания секций вне PostgreSQL."""
+
+    maintainer = PartitionMaintainer(async_session_factory, months_ahead=3, retention_months=1, interval=60)
+
+    assert await maintainer.run_once() == {"created": [], "dropped": []}
+
+
+class FakePostgresSession:
+    """Сессия, которая записывает SQL вместо выполнения в PostgreSQL."""
+
+    def __init__(self, state):
+        self.state = state
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def get_bind(self):
+        return SimpleNamespace(dialect=SimpleNamespace(name="postgresql"))
+
+    async def execute(self, statement, params=None):
+        sql = str(statement)
+        if sql.startswith("CREATE TABLE addressquery_p202502"):
+            raise RuntimeError("ошибка создания секции")
+        self.state["sql"].append(sql)
+        return SimpleNamespace(scalars=lambda: SimpleNamespace(all=lambda: list(self.state["partitions"])))
+
+    async def scalar(self, statement, params=None):
+        # Записи попали в секцию по умолчанию только за январь
+        return params["start"] == date(2025, 1, 1)
+
+    async def commit(self):
+        self.state["commits"] += 1
+
+
+async def test_run_once_moves_default_rows_and_isolates_failures():
+    """Тест переноса записей из секции по умолчанию и независимости месяцев."""
+
+    state = {"sql": [], "commits": 0, "partitions": ["addressquery_p202410", "addressquery_default"]}
+    maintainer = PartitionMaintainer(lambda: FakePostgresSession(state), months_ahead=2, retention_months=2, interval=60)
+
+    result = await maintainer.run_once(today=date(2025, 1, 15))
+
+    # Февраль не создан из-за ошибки, но март создан и срок хранения соблюден
+    assert result == {"created": ["addressquery_p202501", "addressquery_p202503"], "dropped": ["addressquery_p202410"]}
+    sql = state["sql"]
+    january = [statement for statement in sql if "addressquery_p202501" in statement]
+    assert january[0].startswith("CREATE TABLE addressquery_p202501 (LIKE addressquery")
+    assert "DELETE FROM addressquery_default" in january[1]
+    assert january[2].startswith("ALTER TABLE addressquery ATTACH PARTITION addressquery_p202501")
+    assert any(statement.startswith("CREATE TABLE addressquery_p202503 PARTITION OF") for statement in sql)
+    assert "DROP TABLE addressquery_p202410" in sql
@@ -0,0 +1,131 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+from tronpy import AsyncTron
+
+from app.core.node_pool import NodePoolProvider
+from app.core.rate_limiter import TokenBucket, use_rate_limiter
+from app.services import TronService, CircuitBreaker
+from app.exceptions import TronRateLimitException
+from app.tests.fake_node import FakeTronNode, FakeNodeTransport
+from app.utils.metrics import REGISTRY
+
+ADDRESS = "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t"
+
+
+async def test_burst_then_paced_requests():
+    """Тест пропуска всплеска без ожидания и равномерного темпа после него."""
+
+    bucket = TokenBucket(rate=50, capacity=3, max_waiters=10, timeout=1)
+
+    started = time.monotonic()
+    waits = [await bucket.acquire() for _ in range(5)]
+    elapsed = time.monotonic() - started
+
+    # Три запроса из запаса бакета, два следующих - по 1/50 секунды
+    assert waits[:3] == [0.0, 0.0, 0.0]
+    assert elapsed >= 0.035
+    stats = bucket.stats()
+    assert stats["acquired"] == 5
+    assert stats["waited"] == 2
+    assert stats["max_wait_ms"] > 0
+
+
+
+async def test_wait_time_exported_to_metrics():
+    """Тест записи времени ожидания токена в гистограмму Prometheus."""
+
+    def sample(name, **labels):
+        return REGISTRY.get_sample_value(f"tron_rate_limit_wait_seconds_{name}", labels) or 0.0
+
+    count, immediate = sample("count"), sample("bucket", le="0.0")
+    bucket = TokenBucket(rate=50, capacity=1, max_waiters=10, timeout=1)
+    waits = [await bucket.acquire() for _ in range(3)]
+
+    assert sample("count") - count == 3
+    assert sample("bucket", le="0.0") - immediate == 1
+    assert sample("sum") >= sum(waits) > 0
+
+async def test_bounded_queue_and_timeout():
+    """Тест отказа при переполненной очереди и по таймауту ожидания."""
+
+    bucket = TokenBucket(rate=1, capacity=1, max_waiters=1, timeout=0.05)
+    await bucket.acquire()
+
+    # Второй запрос встает в очередь, третий сразу отклоняется
+    waiter = asyncio.ensure_future(bucket.acquire())
+    await asyncio.sleep(0)
+    with pytest.raises(TronRateLimitException):
+        await bucket.acquire()
+
+    # Токен появится только через секунду - ожидающий не укладывается в таймаут
+    with pytest.raises(TronRateLimitException):
+        await waiter
+    assert bucket.stats()["rejected"] == 2
+    assert bucket.stats()["waiting"] == 0
+
+
+async def test_cancelled_waiter_leaves_queue():
+    """Тест освобождения места в очереди при отмене ожидающего запроса."""
+
+    bucket = TokenBucket(rate=1, capacity=1, max_waiters=10, timeout=5)
+    await bucket.acquire()
+
+    # Первый ожидающий держит блокировку, второй ждет ее; отменяем обоих
+    holder = asyncio.ensure_future(bucket.acquire())
+    queued = asyncio.ensure_future(bucket.acquire())
+    await asyncio.sleep(0.01)
+    assert bucket.stats()["waiting"] == 2
+
+    queued.cancel()
+    holder.cancel()
+    for task in (queued, holder):
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    assert bucket._waiters == 0
+    # После пополнения снова работает быстрый путь без ожидания
+    bucket._tokens = 1.0
+    assert await bucket.acquire() == 0.0
+
+
+async def test_service_reports_rate_limit_without_tripping_breaker():
+    """Тест ошибки квоты в сервисе без размыкания выключателя."""
+
+    bucket = TokenBucket(rate=0.001, capacity=2, max_waiters=10, timeout=0.01)
+    client = httpx.AsyncClient(transport=FakeNodeTransport({"node": FakeTronNode()}))
+    provider = NodePoolProvider(["http://node"], client=client, timeout=5.0, rate_limiter=bucket)
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+    service = TronService(AsyncTron(provider), breaker=breaker)
+
+    # Первый запрос забирает оба токена (баланс и ресурсы), второй в квоту не укладывается
+    await service.get_address_info(ADDRESS)
+    with pytest.raises(TronRateLimitException) as exc_info:
+        await service.get_address_info(ADDRESS)
+
+    assert exc_info.value.status_code == 503
+    assert breaker.state == "closed"
+
+
+async def test_background_requests_use_own_rate_limiter():
+    """Тест расхода отдельной квоты запросами фоновой задачи."""
+
+    shared = TokenBucket(rate=0.001, capacity=2, max_waiters=10, timeout=0.01)
+    background = TokenBucket(rate=0.001, capacity=4, max_waiters=10, timeout=0.01)
+    client = httpx.AsyncClient(transport=FakeNodeTransport({"node": FakeTronNode()}))
+    provider = NodePoolProvider(["http://node"], client=client, timeout=5.0, rate_limiter=shared)
+    service = TronService(AsyncTron(provider))
+
+    # Запросы в подзадачах фоновой задачи идут через ее ограничитель
+    with use_rate_limiter(background):
+        await service.get_many_address_info([ADDRESS, ADDRESS], concurrency=2)
+
+    assert background.stats()["acquired"] == 4
+    assert shared.stats()["acquired"] == 0
+
+    # Квота пользователей не израсходована
+    await service.get_address_info(ADDRESS)
+    assert shared.stats()["acquired"] == 2
+
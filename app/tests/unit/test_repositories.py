@@ -1,25 +1,38 @@
 import pytest
-from app.repositories import AddressRepository
+from datetime import datetime, timedelta
+from decimal import Decimal
+from unittest.mock import AsyncMock, patch
+from sqlalchemy import select
+from sqlalchemy.exc import OperationalError
+
+from app.repositories import AddressRepository, WatchlistRepository
+from app.repositories.tron.counter import HistoryCountCache
 from app.models import AddressQuery
-from app.schemas import PaginationParams
+from app.schemas import PaginationParams, CursorParams
+from app.exceptions import (
+    DatabaseOperationError,
+    InvalidPaginationError,
+    RecordAlreadyExistsError,
+    WatchlistFullError
+)
 
 
-def test_create_address_query(test_db):
+async def test_create_address_query(async_db):
     """Тест создания записи о запросе адреса."""
 
     # Тестовые данные
     address_data = {
         "address": "TJ8RoHsTnHdUGtrvXZtzP7GdYB4DW3ct9W",
-        "bandwidth": "5000",
-        "energy": "2000",
-        "balance": "100.5"
+        "bandwidth": 5000,
+        "energy": 2000,
+        "balance": Decimal("100.5")
     }
 
     # Создаем репозиторий
-    repository = AddressRepository(test_db)
+    repository = AddressRepository(async_db)
 
     # Создаем запись
-    result = repository.create(address_data)
+    result = await repository.create(address_data)
 
     # Проверяем, что запись создана и содержит правильные данные
     assert result.address == address_data["address"]
@@ -28,31 +41,31 @@ def test_create_address_query(test_db):
     assert result.balance == address_data["balance"]
 
     # Проверяем, что запись сохранена в БД
-    db_record = test_db.query(AddressQuery).filter_by(id=result.id).first()
+    db_record = await repository.get_by_id(result.id)
     assert db_record is not None
     assert db_record.address == address_data["address"]
 
 
-def test_get_history_with_pagination(test_db):
+async def test_get_history_with_pagination(async_db):
     """Тест получения истории запросов с пагинацией."""
 
     # Добавляем тестовые данные в БД
     for i in range(15):
         address_query = AddressQuery(
             address=f"TJ8RoHsTnHdUGtrvXZtzP7GdYB4DW3ct9W{i}",
-            bandwidth="5000",
-            energy="2000",
-            balance="100.5"
+            bandwidth=5000,
+            energy=2000,
+            balance=Decimal("100.5")
         )
-        test_db.add(address_query)
-    test_db.commit()
+        async_db.add(address_query)
+    await async_db.commit()
 
     # Создаем репозиторий
-    repository = AddressRepository(test_db)
+    repository = AddressRepository(async_db)
 
     # Получаем первую страницу
     pagination = PaginationParams(page=1, limit=10)
-    result = repository.get_history(pagination)
+    result = await repository.get_history(pagination)
 
     # Проверяем результаты
     assert result["total"] == 15
@@ -65,9 +78,213 @@ def test_get_history_with_pagination(test_db):
 
     # Получаем вторую страницу
     pagination = PaginationParams(page=2, limit=10)
-    result = repository.get_history(pagination)
+    result = await repository.get_history(pagination)
 
     # Проверяем результаты
     assert len(result["items"]) == 5
     assert result["next_page"] is None
-    assert result["prev_page"] == 1
\ No newline at end of file
+    assert result["prev_page"] == 1
+
+
+async def test_bulk_create_address_queries(async_db):
+    """Тест пакетного создания записей о запросах адресов."""
+
+    items = [
+        {
+            "address": f"TJ8RoHsTnHdUGtrvXZtzP7GdYB4DW3ct9W{i}",
+            "bandwidth": 5000,
+            "energy": 2000,
+            "balance": Decimal("100.5")
+        }
+        for i in range(5)
+    ]
+
+    repository = AddressRepository(async_db)
+    assert await repository.bulk_create(items) == 5
+    assert await repository.bulk_create([]) == 0
+    await async_db.commit()
+
+    records = (await async_db.execute(select(AddressQuery))).scalars().all()
+    assert len(records) == 5
+    assert all(record.id is not None and record.created_at is not None for record in records)
+
+
+async def test_get_history_by_cursor(async_db):
+    """Тест keyset-пагинации истории по курсору с одинаковым created_at."""
+
+    # Часть записей создана в одно и то же время, порядок задает id
+    created_at = datetime(2025, 1, 1, 12, 0, 0)
+    for i in range(7):
+        async_db.add(AddressQuery(
+            address=f"TJ8RoHsTnHdUGtrvXZtzP7GdYB4DW3ct9W{i}",
+            bandwidth=5000,
+            energy=2000,
+            balance=Decimal("100.5"),
+            created_at=created_at if i < 4 else created_at + timedelta(seconds=i)
+        ))
+    await async_db.commit()
+
+    repository = AddressRepository(async_db)
+
+    # Проходим все страницы по курсору
+    seen = []
+    params = CursorParams(limit=3)
+    while True:
+        result = await repository.get_history_by_cursor(params)
+        seen.extend(result["items"])
+        if result["next_cursor"] is None:
+            break
+        params = CursorParams(cursor=result["next_cursor"], limit=3)
+
+    # Все записи получены ровно один раз в порядке убывания (created_at, id)
+    assert len(seen) == 7
+    assert len({item.id for item in seen}) == 7
+    keys = [(item.created_at, item.id.hex) for item in seen]
+    assert keys == sorted(keys, reverse=True)
+
+
+async def test_get_history_by_invalid_cursor(async_db):
+    """Тест ошибки при поврежденном курсоре."""
+
+    repository = AddressRepository(async_db)
+
+    with pytest.raises(InvalidPaginationError):
+        await repository.get_history_by_cursor(CursorParams(cursor="not-a-cursor", limit=10))
+
+
+async def test_get_address_history_with_time_range(async_db):
+    """Тест истории одного адреса с фильтром по периоду и пагинацией по курсору."""
+
+    address = "TJ8RoHsTnHdUGtrvXZtzP7GdYB4DW3ct9W"
+    start = datetime(2025, 1, 1)
+    for i in range(6):
+        async_db.add(AddressQuery(address=address, created_at=start + timedelta(days=i)))
+        async_db.add(AddressQuery(address=f"{address}X", created_at=start + timedelta(days=i)))
+    await async_db.commit()
+
+    repository = AddressRepository(async_db)
+
+    # Период [2 января; 6 января) - четыре записи адреса, по две на страницу
+    created_from, created_to = start + timedelta(days=1), start + timedelta(days=5)
+    result = await repository.get_address_history(address, CursorParams(limit=2), created_from, created_to)
+    assert [item.created_at.day for item in result["items"]] == [5, 4]
+    assert result["next_cursor"] is not None
+
+    result = await repository.get_address_history(
+        address, CursorParams(cursor=result["next_cursor"], limit=2), created_from, created_to
+    )
+    assert [item.created_at.day for item in result["items"]] == [3, 2]
+    assert all(item.address == address for item in result["items"])
+    assert result["next_cursor"] is None
+
+    # Пустой период
+    with pytest.raises(InvalidPaginationError):
+        await repository.get_address_history(address, CursorParams(limit=2), created_to, created_from)
+
+
+async def test_stream_history(async_db):
+    """Тест потокового чтения истории порциями меньше общего количества записей."""
+
+    start = datetime(2025, 1, 1)
+    for i in range(5):
+        async_db.add(AddressQuery(address="TJ8RoHsTnHdUGtrvXZtzP7GdYB4DW3ct9W", created_at=start + timedelta(hours=i)))
+    await async_db.commit()
+
+    repository = AddressRepository(async_db)
+    rows = [row async for row in repository.stream_history(created_from=start + timedelta(hours=1), batch_size=2)]
+
+    assert [row.created_at for row in rows] == [start + timedelta(hours=i) for i in range(1, 5)]
+    assert rows[0]._fields == ("id", "address", "bandwidth", "energy", "balance", "created_at")
+
+
+async def test_get_history_without_total(async_db):
+    """Тест получения страницы истории без подсчета общего количества."""
+
+    for i in range(15):
+        async_db.add(AddressQuery(address=f"TJ8RoHsTnHdUGtrvXZtzP7GdYB4DW3ct9W{i}"))
+    await async_db.commit()
+
+    repository = AddressRepository(async_db)
+    result = await repository.get_history(PaginationParams(page=1, limit=10, include_total=False))
+
+    assert result["total"] is None
+    assert result["pages"] is None
+    assert len(result["items"]) == 10
+    assert result["next_page"] == 2
+
+    result = await repository.get_history(PaginationParams(page=2, limit=10, include_total=False))
+    assert len(result["items"]) == 5
+    assert result["next_page"] is None
+
+
+async def test_count_total_strategies(async_db):
+    """Тест стратегий подсчета количества записей истории."""
+
+    repository = AddressRepository(async_db)
+    await repository.bulk_create([{"address": f"TJ8RoHsTnHdUGtrvXZtzP7GdYB4DW3ct9W{i}"} for i in range(3)])
+    await async_db.commit()
+
+    with patch("app.repositories.tron.repository.history_count_cache", HistoryCountCache(ttl=60)):
+        # Первый подсчет выполняется в БД, дальше значение обновляется зафиксированными вставками
+        assert await repository.count_total("cached") == 3
+        with patch.object(AddressRepository, "_count_exact", new_callable=AsyncMock) as mock_count:
+            async with async_db.begin_nested():
+                await repository.create({"address": "TJ8RoHsTnHdUGtrvXZtzP7GdYB4DW3ct9W"})
+            assert await repository.count_total("cached") == 3
+            await async_db.commit()
+            assert await repository.count_total("cached") == 4
+
+            # Откаченные вставки в кешированном количестве не учитываются
+            await repository.bulk_create([{"address": "TJ8RoHsTnHdUGtrvXZtzP7GdYB4DW3ct9X"}])
+            await async_db.rollback()
+            await async_db.commit()
+            assert await repository.count_total("cached") == 4
+            mock_count.assert_not_awaited()
+
+    # Вне PostgreSQL оценка недоступна, используется точный подсчет
+    assert await repository.count_total("estimated") == 4
+    assert await repository.count_total("exact") == 4
+
+
+async def test_numeric_columns_support_range_filters(async_db):
+    """Тест хранения ресурсов и баланса числами и фильтрации по диапазону баланса."""
+
+    repository = AddressRepository(async_db)
+    await repository.bulk_create([
+        {"address": f"TJ8RoHsTnHdUGtrvXZtzP7GdYB4DW3ct9W{i}", "bandwidth": 5000, "energy": 2000, "balance": Decimal(i)}
+        for i in range(5)
+    ])
+    await async_db.commit()
+
+    result = await async_db.execute(select(AddressQuery).where(AddressQuery.balance > Decimal("2.5")))
+    records = result.scalars().all()
+
+    assert len(records) == 2
+    assert all(isinstance(record.bandwidth, int) for record in records)
+
+
+async def test_watchlist_add_conflicts_via_unique_constraint(async_db):
+    """Тест ответа о конфликте при повторном добавлении адреса без порчи сессии."""
+
+    repository = WatchlistRepository(async_db)
+    await repository.add("TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t", None, max_size=10)
+
+    with pytest.raises(RecordAlreadyExistsError):
+        await repository.add("TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t", "повтор", max_size=10)
+
+    # Откатывается только точка сохранения: первая запись и сессия остаются
+    await repository.add("TJ8RoHsTnHdUGtrvXZtzP7GdYB4DW3ct9W", None, max_size=10)
+    assert await repository.count() == 2
+    with pytest.raises(WatchlistFullError):
+        await repository.add("TXLAQ63Xg1NAzckPwKHvzw7CSEmLMEqcdj", None, max_size=2)
+
+
+async def test_watchlist_update_values_wraps_database_errors(async_db):
+    """Тест обертки ошибок БД при обновлении значений отслеживаемых адресов."""
+
+    repository = WatchlistRepository(async_db)
+    error = OperationalError("UPDATE watchedaddress", {}, Exception("нет соединения"))
+
+    with patch.object(async_db, "execute", AsyncMock(side_effect=error)):
+        with pytest.raises(DatabaseOperationError):
+            await repository.update_values([{"id": 1, "bandwidth": 1}])
@@ -0,0 +1,137 @@
+import asyncio
+import pytest
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+from tronpy.exceptions import ApiError
+
+from app.services import TronService, AddressInfoCache, CircuitBreaker, RetryPolicy
+from app.exceptions import TronNetworkException, TronCircuitOpenException
+
+ADDRESS = "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t"
+
+
+class FakeTimer:
+    """Управляемый источник времени."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def tron_client():
+    """
+    Мок асинхронного клиента TRON API.
+    """
+    client = MagicMock()
+    client.get_account_balance = AsyncMock(return_value=Decimal("100.5"))
+    client.get_account_resource = AsyncMock(return_value={"freeNetLimit": 5000, "EnergyLimit": 2000})
+    return client
+
+
+def test_breaker_state_transitions():
+    """Тест переходов closed -> open -> half_open -> closed/open."""
+
+    timer = FakeTimer()
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10, timer=timer)
+
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open"
+    with pytest.raises(TronCircuitOpenException):
+        breaker.before_call()
+
+    # После recovery_timeout пропускается один пробный запрос
+    timer.now = 10
+    assert breaker.state == "half_open"
+    breaker.before_call()
+    with pytest.raises(TronCircuitOpenException):
+        breaker.before_call()
+
+    # Неудачная проба снова размыкает выключатель, удачная - замыкает
+    breaker.record_failure()
+    assert breaker.state == "open"
+    timer.now = 20
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.stats()["opened"] == 2
+    assert breaker.stats()["rejected"] == 2
+
+
+async def test_retry_policy_retries_until_success():
+    """Тест повторов после сбоев сети."""
+
+    policy = RetryPolicy(attempts=3, base_delay=0.001, max_delay=0.001, deadline=5)
+    calls = []
+
+    async def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise TronNetworkException()
+        return "ok"
+
+    assert await policy.call(flaky, (TronNetworkException,), TronNetworkException) == "ok"
+    assert len(calls) == 3
+
+
+async def test_retry_policy_respects_attempts_and_deadline():
+    """Тест ограничения количества попыток и общего времени."""
+
+    policy = RetryPolicy(attempts=2, base_delay=0.001, max_delay=0.001, deadline=5)
+    failing = AsyncMock(side_effect=TronNetworkException())
+
+    with pytest.raises(TronNetworkException):
+        await policy.call(failing, (TronNetworkException,), TronNetworkException)
+    assert failing.await_count == 2
+
+    # Медленная попытка прерывается по истечении deadline
+    async def slow():
+        await asyncio.sleep(1)
+
+    policy = RetryPolicy(attempts=5, base_delay=0.001, max_delay=0.001, deadline=0.05)
+    with pytest.raises(TronNetworkException, match="deadline"):
+        await policy.call(slow, (TronNetworkException,), lambda: TronNetworkException("deadline"))
+
+
+async def test_service_fails_fast_when_breaker_open(tron_client):
+    """Тест отказа без обращения к TRON API при разомкнутом выключателе."""
+
+    tron_client.get_account_balance.side_effect = ApiError("node is down")
+    breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=60)
+    service = TronService(tron_client, breaker=breaker)
+
+    for _ in range(2):
+        with pytest.raises(TronNetworkException):
+            await service.get_address_info(ADDRESS)
+    assert breaker.state == "open"
+
+    tron_client.get_account_balance.reset_mock()
+    with pytest.raises(TronCircuitOpenException) as exc_info:
+        await service.get_address_info(ADDRESS)
+    assert exc_info.value.status_code == 503
+    tron_client.get_account_balance.assert_not_called()
+
+
+async def test_service_serves_stale_cache_when_breaker_open(tron_client):
+    """Тест ответа устаревшей записью из кеша при разомкнутом выключателе."""
+
+    timer = FakeTimer()
+    cache = AddressInfoCache(max_size=10, ttl=5, timer=timer)
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=60)
+    service = TronService(tron_client, cache, breaker=breaker)
+
+    fresh = await service.get_cached_address_info(ADDRESS)
+
+    # Запись устарела, а TRON API перестал отвечать
+    timer.now = 10
+    tron_client.get_account_balance.side_effect = ApiError("node is down")
+    with pytest.raises(TronNetworkException):
+        await service.get_cached_address_info(ADDRESS)
+    assert breaker.state == "open"
+
+    assert await service.get_cached_address_info(ADDRESS) == fresh
+    assert cache.stats()["stale_hits"] == 1
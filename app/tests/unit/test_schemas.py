@@ -0,0 +1,21 @@
+import uuid
+from datetime import datetime
+from decimal import Decimal
+
+import orjson
+
+from app.schemas import AddressQueryResponse, history_item
+
+
+def test_history_item_matches_response_schema():
+    """Тест совпадения быстрой сериализации истории с AddressQueryResponse."""
+
+    rows = [
+        (uuid.uuid4(), "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t", 5000, 2000, Decimal("100.500000"), datetime(2025, 1, 2, 3, 4, 5, 678)),
+        (uuid.uuid4(), "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t", None, 0, Decimal("0E-6"), datetime(2025, 1, 2, 3, 4, 5)),
+    ]
+    fields = ("id", "address", "bandwidth", "energy", "balance", "created_at")
+
+    for row in rows:
+        expected = AddressQueryResponse.model_validate(dict(zip(fields, row))).model_dump(mode="json")
+        assert orjson.loads(orjson.dumps(history_item(row))) == expected
@@ -0,0 +1,137 @@
+import asyncio
+import pytest
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+from tronpy.exceptions import AddressNotFound, ApiError
+from tronpy.keys import to_base58check_address
+
+from app.services import TronService
+from app.exceptions import TronAddressNotFoundException, TronNetworkException
+
+ADDRESS = "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t"
+
+
+@pytest.fixture
+def tron_client():
+    """
+    Мок асинхронного клиента TRON API.
+    """
+    client = MagicMock()
+    client.get_account_balance = AsyncMock(return_value=Decimal("100.5"))
+    client.get_account_resource = AsyncMock(return_value={"freeNetLimit": 5000, "EnergyLimit": 2000})
+    return client
+
+
+async def test_get_address_info(tron_client):
+    """Тест получения информации об адресе через асинхронный клиент."""
+
+    service = TronService(tron_client)
+    result = await service.get_address_info(ADDRESS)
+
+    assert result == {
+        "address": ADDRESS,
+        "bandwidth": 5000,
+        "energy": 2000,
+        "balance": Decimal("100.5")
+    }
+    tron_client.get_account_resource.assert_awaited_once_with(ADDRESS)
+
+
+async def test_get_address_info_not_found(tron_client):
+    """Тест преобразования AddressNotFound в TronAddressNotFoundException."""
+
+    tron_client.get_account_balance.side_effect = AddressNotFound("account not found on-chain")
+    service = TronService(tron_client)
+
+    with pytest.raises(TronAddressNotFoundException):
+        await service.get_address_info(ADDRESS)
+
+
+async def test_get_address_info_network_error(tron_client):
+    """Тест преобразования ошибок API ресурсов в TronNetworkException."""
+
+    tron_client.get_account_resource.side_effect = ApiError("node unavailable")
+    service = TronService(tron_client)
+
+    with pytest.raises(TronNetworkException):
+        await service.get_address_info(ADDRESS)
+
+
+async def test_get_address_info_calls_upstream_concurrently(tron_client):
+    """Тест одновременного запроса баланса и ресурсов без повторного вызова баланса."""
+
+    started = []
+    both_started = asyncio.Event()
+
+    async def track(name, value):
+        started.append(name)
+        if len(started) == 2:
+            both_started.set()
+        # Вызов завершится, только если второй запрос уже отправлен
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+        return value
+
+    async def get_balance(addr):
+        return await track("balance", Decimal("1"))
+
+    async def get_resource(addr):
+        return await track("resource", {})
+
+    tron_client.get_account_balance.side_effect = get_balance
+    tron_client.get_account_resource.side_effect = get_resource
+    service = TronService(tron_client)
+
+    await service.get_address_info(ADDRESS)
+
+    assert sorted(started) == ["balance", "resource"]
+    tron_client.get_account_balance.assert_awaited_once_with(ADDRESS)
+
+
+async def test_get_address_info_not_found_takes_precedence(tron_client):
+    """Тест приоритета ошибки "адрес не найден" над ошибкой ресурсов."""
+
+    tron_client.get_account_balance.side_effect = AddressNotFound("account not found on-chain")
+    tron_client.get_account_resource.side_effect = AddressNotFound("account not found on-chain")
+    service = TronService(tron_client)
+
+    with pytest.raises(TronAddressNotFoundException):
+        await service.get_address_info(ADDRESS)
+
+
+async def test_get_many_address_info_bounds_concurrency(tron_client):
+    """Тест ограничения параллелизма и изоляции ошибок в пакетном запросе."""
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def get_balance(addr):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if addr == addresses[0]:
+            raise AddressNotFound("account not found on-chain")
+        return Decimal("1")
+
+    tron_client.get_account_balance.side_effect = get_balance
+    service = TronService(tron_client)
+    addresses = [to_base58check_address(bytes([0x41] + [i] * 20)) for i in range(10)]
+
+    results = await service.get_many_address_info(addresses, concurrency=3)
+
+    assert max_in_flight <= 3
+    assert isinstance(results[0], TronAddressNotFoundException)
+    assert all(result["address"] == address for address, result in zip(addresses[1:], results[1:]))
+
+
+async def test_get_address_info_rejects_bad_checksum_locally(tron_client):
+    """Тест отклонения адреса с неверной контрольной суммой без запроса к узлу."""
+
+    service = TronService(tron_client)
+
+    with pytest.raises(TronAddressNotFoundException):
+        await service.get_address_info(f"{ADDRESS[:-1]}u")
+
+    tron_client.get_account_balance.assert_not_called()
+    tron_client.get_account_resource.assert_not_called()
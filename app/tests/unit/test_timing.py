@@ -0,0 +1,73 @@
+import asyncio
+import os
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.middleware import ProfilerMiddleware, ServerTimingMiddleware
+from app.utils.timing import format_server_timing, stage, start_stage_timings
+
+
+async def test_stage_timings_shared_between_tasks():
+    """Тест суммирования этапов, в том числе из задач asyncio.gather."""
+
+    timings = start_stage_timings()
+
+    async def query():
+        with stage("db_query"):
+            await asyncio.sleep(0.01)
+
+    await asyncio.gather(query(), query())
+    with stage("tron_balance"):
+        pass
+
+    assert set(timings) == {"db_query", "tron_balance"}
+    assert timings["db_query"] >= 0.02
+    assert format_server_timing({"db_query": 0.0125}, 0.02) == "db_query;dur=12.5, app;dur=20.0"
+
+
+def create_app() -> FastAPI:
+    """Тестовое приложение с замерами этапов и профилированием."""
+    app = FastAPI()
+    app.add_middleware(ServerTimingMiddleware)
+    app.add_middleware(ProfilerMiddleware)
+
+    @app.get("/slow")
+    async def slow():
+        with stage("db_query"):
+            await asyncio.sleep(0.02)
+        return {"status": "ok"}
+
+    return app
+
+
+def test_server_timing_header():
+    """Тест заголовка Server-Timing с этапами запроса."""
+
+    response = TestClient(create_app()).get("/slow")
+
+    assert response.status_code == 200
+    stages = [part.split(";")[0] for part in response.headers["server-timing"].split(", ")]
+    assert stages == ["db_query", "app"]
+
+
+def test_profiler_by_header(monkeypatch, tmp_path):
+    """Тест сохранения профиля запроса по заголовку X-Profile."""
+
+    monkeypatch.setattr(settings, "PROFILING_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "PROFILING_HEADER_ENABLED", True)
+    monkeypatch.setattr(settings, "PROFILING_SAMPLE_RATE", 0.0)
+    client = TestClient(create_app())
+
+    assert client.get("/slow").status_code == 200
+    assert os.listdir(tmp_path) == []
+
+    assert client.get("/slow", headers={"X-Profile": "1"}).status_code == 200
+    (name,) = os.listdir(tmp_path)
+    assert "-GET-slow-" in name and name.endswith(".folded")
+    with open(tmp_path / name, encoding="utf-8") as file:
+        lines = file.read().splitlines()
+    assert lines
+    stack, count = lines[0].rsplit(" ", 1)
+    assert int(count) > 0 and ";" in stack
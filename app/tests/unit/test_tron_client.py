@@ -0,0 +1,41 @@
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.core import create_tron_client, close_tron_client
+from app.main import app
+
+
+async def test_create_tron_client_uses_pool_settings():
+    """Тест настройки пула соединений клиента TRON API."""
+
+    client = create_tron_client()
+    try:
+        http_client = client.provider.client
+
+        # Проверяем размер пула и таймауты из настроек
+        pool = http_client._transport._pool
+        assert pool._max_connections == settings.TRON_POOL_MAXSIZE
+        assert pool._max_keepalive_connections == settings.TRON_POOL_CONNECTIONS
+        assert http_client.timeout.connect == settings.TRON_CONNECT_TIMEOUT
+        assert http_client.timeout.read == settings.TRON_READ_TIMEOUT
+    finally:
+        await close_tron_client(client)
+
+    assert client.provider.client.is_closed
+
+
+def test_lifespan_creates_single_tron_client():
+    """Тест создания общего клиента TRON API в lifespan приложения."""
+
+    with patch("app.main.close_tron_client") as mock_close:
+        with TestClient(app) as c:
+            tron_client = app.state.tron_client
+            assert tron_client is not None
+
+            # Повторные запросы не пересоздают клиент
+            c.get("/health")
+            assert app.state.tron_client is tron_client
+
+        # После остановки приложения пул соединений закрыт
+        mock_close.assert_awaited_once_with(tron_client)
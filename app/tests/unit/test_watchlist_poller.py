@@ -0,0 +1,138 @@
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from sqlalchemy import func, select
+
+from app.exceptions import TronAddressNotFoundException
+from app.models import AddressQuery, WatchedAddress
+from app.services import WatchlistPoller
+
+ADDRESSES = ["TJ8RoHsTnHdUGtrvXZtzP7GdYB4DW3ct9W", "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t"]
+
+
+class StubService:
+    """Сервис TRON с заранее заданными ответами по адресам."""
+
+    def __init__(self):
+        self.infos = {
+            address: {"address": address, "bandwidth": 5000, "energy": 2000, "balance": Decimal("100.5")}
+            for address in ADDRESSES
+        }
+        self.calls = []
+
+    async def get_many_address_info(self, addresses, concurrency, use_cache=True):
+        self.calls.append((list(addresses), use_cache))
+        return [self.infos[address] for address in addresses]
+
+
+async def count_snapshots(session_factory):
+    async with session_factory() as db:
+        return await db.scalar(select(func.count()).select_from(AddressQuery))
+
+
+async def test_poller_saves_snapshot_only_on_change(async_session_factory):
+    """Тест записи истории только при изменении значений адреса."""
+
+    async with async_session_factory() as db:
+        db.add_all([WatchedAddress(address=address) for address in ADDRESSES])
+        await db.commit()
+
+    service = StubService()
+    poller = WatchlistPoller(async_session_factory, lambda: service, interval=60, batch_size=1, concurrency=5)
+
+    # Первый опрос: значений еще нет, сохраняются оба адреса
+    assert await poller.run_once() == {"polled": 2, "changed": 2, "failed": 0}
+    assert await count_snapshots(async_session_factory) == 2
+    # Пакеты по одному адресу и всегда мимо кеша
+    assert service.calls == [([ADDRESSES[0]], False), ([ADDRESSES[1]], False)]
+
+    # Ничего не изменилось - новых записей нет
+    assert await poller.run_once() == {"polled": 2, "changed": 0, "failed": 0}
+    assert await count_snapshots(async_session_factory) == 2
+
+    # Изменился баланс одного адреса
+    service.infos[ADDRESSES[1]] = {**service.infos[ADDRESSES[1]], "balance": Decimal("99.25")}
+    assert await poller.run_once() == {"polled": 2, "changed": 1, "failed": 0}
+    assert await count_snapshots(async_session_factory) == 3
+
+    async with async_session_factory() as db:
+        watched = await db.scalar(select(WatchedAddress).where(WatchedAddress.address == ADDRESSES[1]))
+    assert watched.balance == Decimal("99.25")
+    assert watched.changed_at is not None
+
+    stats = poller.stats()
+    assert stats["cycles"] == 3
+    assert stats["changed"] == 3
+    assert stats["running"] is False
+
+
+async def test_poller_skips_failed_addresses(async_session_factory):
+    """Тест пропуска адресов, опрошенных с ошибкой."""
+
+    async with async_session_factory() as db:
+        db.add_all([WatchedAddress(address=address) for address in ADDRESSES])
+        await db.commit()
+
+    service = StubService()
+    service.infos[ADDRESSES[0]] = TronAddressNotFoundException("Адрес не найден")
+    poller = WatchlistPoller(async_session_factory, lambda: service, interval=60, batch_size=10, concurrency=5)
+
+    assert await poller.run_once() == {"polled": 1, "changed": 1, "failed": 1}
+    assert await count_snapshots(async_session_factory) == 1
+
+
+class FakeLockConnection:
+    """Соединение PostgreSQL, записывающее запросы advisory-блокировки."""
+
+    def __init__(self, acquired):
+        self.acquired = acquired
+        self.statements = []
+        self.execution_options = None
+
+    async def scalar(self, statement, params=None):
+        self.statements.append(str(statement))
+        return self.acquired
+
+    async def execute(self, statement, params=None):
+        self.statements.append(str(statement))
+
+
+class FakeLockSession:
+    """Сессия PostgreSQL, отдающая соединение для блокировки."""
+
+    def __init__(self, connection):
+        self._connection = connection
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def get_bind(self):
+        return SimpleNamespace(dialect=SimpleNamespace(name="postgresql"))
+
+    async def connection(self, execution_options=None):
+        self._connection.execution_options = execution_options
+        return self._connection
+
+
+async def test_poller_uses_session_advisory_lock():
+    """Тест сессионной advisory-блокировки без открытой транзакции."""
+
+    # Блокировку держит другой воркер - цикл пропускается
+    busy = FakeLockConnection(acquired=False)
+    poller = WatchlistPoller(lambda: FakeLockSession(busy), StubService, interval=60, batch_size=10, concurrency=5)
+    assert await poller.run_once() == {"polled": 0, "changed": 0, "failed": 0}
+    assert poller.stats()["skipped"] == 1
+
+    # Блокировка получена в autocommit и освобождается после цикла
+    free = FakeLockConnection(acquired=True)
+    poller = WatchlistPoller(lambda: FakeLockSession(free), StubService, interval=60, batch_size=10, concurrency=5)
+    with patch.object(WatchlistPoller, "_poll", new_callable=AsyncMock) as poll:
+        await poller.run_once()
+
+    poll.assert_awaited_once()
+    assert free.execution_options == {"isolation_level": "AUTOCOMMIT"}
+    assert free.statements == ["SELECT pg_try_advisory_lock(:key)", "SELECT pg_advisory_unlock(:key)"]
+
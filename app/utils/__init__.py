@@ -1,3 +1,5 @@
-from app.utils.logger_utils import log, setup_logging
+from app.utils.logger_utils import log, request_log, setup_logging
+from app.utils.cursor import encode_cursor, decode_cursor
+from app.utils.address import is_valid_tron_address
 
-__all__ = ["log", "setup_logging"]
\ No newline at end of file
+__all__ = ["log", "request_log", "setup_logging", "encode_cursor", "decode_cursor", "is_valid_tron_address"]
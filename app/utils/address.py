@@ -0,0 +1,97 @@
+import hashlib
+from functools import lru_cache
+
+from app.config import settings
+
+BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+# Префикс адресов основной сети TRON (0x41 дает первый символ "T")
+TRON_ADDRESS_PREFIX = 0x41
+TRON_ADDRESS_LENGTH = 34
+
+_BASE58_INDEX = {char: index for index, char in enumerate(BASE58_ALPHABET)}
+
+
+def b58decode(value: str) -> bytes:
+    """
+    Декодирует строку из base58.
+
+    Args:
+        value: Строка в base58
+
+    Returns:
+        bytes: Декодированные байты
+
+    Raises:
+        ValueError: Если строка содержит символы вне алфавита base58
+    """
+    number = 0
+    for char in value:
+        digit = _BASE58_INDEX.get(char)
+        if digit is None:
+            raise ValueError(f"Недопустимый символ base58: {char!r}")
+        number = number * 58 + digit
+
+    # Ведущие "1" кодируют ведущие нулевые байты
+    leading_zeros = len(value) - len(value.lstrip("1"))
+    return b"\x00" * leading_zeros + number.to_bytes((number.bit_length() + 7) // 8, "big")
+
+
+def b58decode_check(value: str) -> bytes:
+    """
+    Декодирует строку из base58check и проверяет контрольную сумму.
+
+    Args:
+        value: Строка в base58check
+
+    Returns:
+        bytes: Полезная нагрузка без 4 байт контрольной суммы
+
+    Raises:
+        ValueError: Если строка повреждена или контрольная сумма не совпадает
+    """
+    raw = b58decode(value)
+    if len(raw) < 5:
+        raise ValueError("Слишком короткая строка base58check")
+    payload, checksum = raw[:-4], raw[-4:]
+    if hashlib.sha256(hashlib.sha256(payload).digest()).digest()[:4] != checksum:
+        raise ValueError("Некорректная контрольная сумма base58check")
+    return payload
+
+
+def is_valid_tron_address(address: str) -> bool:
+    """
+    Проверяет TRON-адрес локально, без обращения к сети.
+
+    Адрес должен быть строкой base58check из 34 символов, содержащей 21 байт
+    с префиксом 0x41 и верной контрольной суммой. Длина и первый символ
+    проверяются до кеша, поэтому в LRU-кеш попадают только строки длины
+    адреса и размер кеша не зависит от размера запросов.
+
+    Args:
+        address: TRON-адрес
+
+    Returns:
+        bool: True, если адрес корректен
+    """
+    if len(address) != TRON_ADDRESS_LENGTH or not address.startswith("T"):
+        return False
+    return _check_tron_address(address)
+
+
+@lru_cache(maxsize=settings.ADDRESS_VALIDATION_CACHE_SIZE)
+def _check_tron_address(address: str) -> bool:
+    """
+    Проверяет base58check и префикс адреса нужной длины (с LRU-кешем).
+
+    Args:
+        address: Строка из 34 символов, начинающаяся с "T"
+
+    Returns:
+        bool: True, если адрес корректен
+    """
+    try:
+        payload = b58decode_check(address)
+    except ValueError:
+        return False
+    return len(payload) == 21 and payload[0] == TRON_ADDRESS_PREFIX
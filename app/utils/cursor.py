@@ -0,0 +1,42 @@
+import base64
+import uuid
+from datetime import datetime
+from typing import Tuple
+
+from app.exceptions import InvalidPaginationError
+
+
+def encode_cursor(created_at: datetime, id: uuid.UUID) -> str:
+    """
+    Кодирует позицию записи в непрозрачный курсор.
+
+    Args:
+        created_at: Дата и время создания записи
+        id: Идентификатор записи
+
+    Returns:
+        str: Курсор в формате base64url
+    """
+    raw = f"{created_at.isoformat()}|{id.hex}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """
+    Декодирует курсор в позицию записи.
+
+    Args:
+        cursor: Курсор, полученный из encode_cursor
+
+    Returns:
+        Tuple[datetime, uuid.UUID]: Дата создания и идентификатор записи
+
+    Raises:
+        InvalidPaginationError: Если курсор поврежден
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, id = raw.split("|")
+        return datetime.fromisoformat(created_at), uuid.UUID(hex=id)
+    except (ValueError, UnicodeDecodeError):
+        raise InvalidPaginationError("Некорректный курсор пагинации")
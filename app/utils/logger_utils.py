@@ -1,24 +1,72 @@
 import sys
 import os
+import random
 from loguru import logger
 from ..config import settings
 
 os.makedirs("logs", exist_ok=True)
 
+
+class SampledLogger:
+    """
+    Логгер для строк, которые пишутся на каждый запрос.
+
+    Сообщения уровня INFO и ниже выводятся с вероятностью
+    LOG_REQUEST_SAMPLE_RATE; решение принимается до форматирования, поэтому
+    отброшенные строки почти ничего не стоят. Предупреждения и ошибки
+    выводятся всегда. Сообщения форматируются лениво: "текст {}", значение.
+    """
+
+    def _sampled(self) -> bool:
+        """Проверка, попадает ли очередная строка в выборку."""
+        rate = settings.LOG_REQUEST_SAMPLE_RATE
+        return rate >= 1 or (rate > 0 and random.random() < rate)
+
+    def debug(self, message: str, *args, **kwargs) -> None:
+        """Запись сообщения уровня DEBUG с учетом выборки."""
+        if self._sampled():
+            logger.opt(depth=1).debug(message, *args, **kwargs)
+
+    def info(self, message: str, *args, **kwargs) -> None:
+        """Запись сообщения уровня INFO с учетом выборки."""
+        if self._sampled():
+            logger.opt(depth=1).info(message, *args, **kwargs)
+
+    def warning(self, message: str, *args, **kwargs) -> None:
+        """Запись сообщения уровня WARNING."""
+        logger.opt(depth=1).warning(message, *args, **kwargs)
+
+    def error(self, message: str, *args, **kwargs) -> None:
+        """Запись сообщения уровня ERROR."""
+        logger.opt(depth=1).error(message, *args, **kwargs)
+
+
 def setup_logging() -> None:
-    """Настройка логирования для приложения"""
+    """
+    Настройка логирования для приложения.
+
+    В режиме development логи пишутся синхронно с подробной диагностикой
+    исключений. В режиме production все обработчики работают через фоновую
+    очередь (enqueue=True), поэтому запись на диск не блокирует обработку
+    запросов, а значения переменных в трассировках (diagnose) не выводятся.
+    При LOG_JSON=True вывод в stdout идет в виде JSON-строк.
+    """
 
     # Удаляем стандартный логгер
     logger.remove()
 
+    production = settings.LOG_MODE == "production"
+
     # Настройка формата и уровня логирования
     logger.add(
         sys.stdout,
         level=settings.LOG_LEVEL,
         format=settings.LOG_FORMAT,
-        colorize=True,
-        backtrace=True,
-        diagnose=True,
+        colorize=not production and not settings.LOG_JSON,
+        serialize=settings.LOG_JSON,
+        backtrace=not production,
+        diagnose=not production,
+        enqueue=production,
     )
 
     # Логирование в файл (опционально)
@@ -27,18 +75,21 @@ def setup_logging() -> None:
         rotation="00:00",  # Ротация логов в полночь
         retention="30 days",  # Хранение логов 30 дней
         compression="zip",  # Сжатие старых логов
-        level="DEBUG",
+        level="DEBUG" if not production else settings.LOG_LEVEL,
         format=settings.LOG_FORMAT,
+        diagnose=not production,
+        enqueue=production,
     )
 
-    # Перехват стандартного логгирования
-    logger.add(
-        sys.stderr,
-        level="ERROR",
-        format=settings.LOG_FORMAT,
-        backtrace=True,
-        diagnose=True,
-    )
+    # Перехват стандартного логгирования (в production ошибки уже есть в stdout)
+    if not production:
+        logger.add(
+            sys.stderr,
+            level="ERROR",
+            format=settings.LOG_FORMAT,
+            backtrace=True,
+            diagnose=True,
+        )
 
     # Логирование необработанных исключений
     logger.add(
@@ -49,8 +100,13 @@ def setup_logging() -> None:
         level="ERROR",
         format=settings.LOG_FORMAT,
         catch=True,  # Перехват всех необработанных исключений
+        diagnose=not production,
+        enqueue=production,
     )
 
 
 # Экспорт логгера для использования в других модулях
-log = logger
\ No newline at end of file
+log = logger
+
+# Логгер строк, которые пишутся на каждый запрос (с выборкой)
+request_log = SampledLogger()
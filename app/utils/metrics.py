@@ -0,0 +1,106 @@
+import asyncio
+import os
+from typing import Any
+
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram, generate_latest, multiprocess
+from prometheus_client.registry import REGISTRY, CollectorRegistry
+from sqlalchemy import event
+
+# Границы корзин гистограмм в секундах: от 1 мс до 10 с
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "Время обработки HTTP-запроса",
+    ("method", "route", "status"),
+    buckets=LATENCY_BUCKETS
+)
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "Количество HTTP-запросов в обработке",
+    multiprocess_mode="livesum"
+)
+APP_ERRORS = Counter(
+    "app_errors_total",
+    "Ошибки, возвращенные клиенту, по классу исключения",
+    ("exception",)
+)
+TRON_REQUEST_DURATION = Histogram(
+    "tron_request_duration_seconds",
+    "Время запроса к TRON API по методу клиента",
+    ("method",),
+    buckets=LATENCY_BUCKETS
+)
+TRON_RATE_LIMIT_WAIT = Histogram(
+    "tron_rate_limit_wait_seconds",
+    "Время ожидания токена ограничителя запросов к TRON API",
+    buckets=(0.0,) + LATENCY_BUCKETS
+)
+DB_OPERATION_DURATION = Histogram(
+    "db_operation_duration_seconds",
+    "Время операций с БД (query, flush, commit)",
+    ("operation",),
+    buckets=LATENCY_BUCKETS
+)
+
+
+# Состояние пула соединений: под gunicorn значения рабочих процессов суммируются
+DB_POOL_GAUGES = (
+    (Gauge("db_pool_size", "Размер пула соединений", multiprocess_mode="livesum"), "size"),
+    (Gauge("db_pool_checked_out", "Соединения, выданные из пула", multiprocess_mode="livesum"), "checkedout"),
+    (Gauge("db_pool_checked_in", "Свободные соединения в пуле", multiprocess_mode="livesum"), "checkedin"),
+    (Gauge("db_pool_overflow", "Соединения сверх размера пула", multiprocess_mode="livesum"), "overflow"),
+)
+
+
+def instrument_pool(engine: Any) -> None:
+    """
+    Обновление метрик пула соединений SQLAlchemy при выдаче и возврате соединений.
+
+    Значения записываются в момент изменения, а не при сборе метрик, поэтому
+    попадают в /metrics и в многопроцессном режиме, где /metrics отдает
+    один из рабочих процессов.
+
+    Args:
+        engine: Движок SQLAlchemy (синхронный или асинхронный)
+    """
+    sync_engine = getattr(engine, "sync_engine", engine)
+    pool = sync_engine.pool
+    # У NullPool и StaticPool нет счетчиков соединений
+    gauges = [(gauge, getattr(pool, method)) for gauge, method in DB_POOL_GAUGES if hasattr(pool, method)]
+    if not gauges:
+        return
+
+    def refresh() -> None:
+        for gauge, read in gauges:
+            # overflow отрицателен, пока пул не заполнен
+            gauge.set(max(read(), 0))
+
+    def on_checkin(*args: Any) -> None:
+        # Событие checkin приходит до возврата соединения в пул: счетчики читаем
+        # следующим шагом цикла событий (вне цикла - сразу, с отставанием до следующего события)
+        try:
+            asyncio.get_running_loop().call_soon(refresh)
+        except RuntimeError:
+            refresh()
+
+    event.listen(sync_engine, "checkout", lambda *args: refresh())
+    event.listen(sync_engine, "checkin", on_checkin)
+    refresh()
+
+
+def render_metrics() -> bytes:
+    """
+    Метрики в текстовом формате Prometheus.
+
+    При запуске под gunicorn (задан PROMETHEUS_MULTIPROC_DIR) метрики всех
+    рабочих процессов собираются из общего каталога.
+
+    Returns:
+        bytes: Содержимое ответа /metrics
+    """
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest(REGISTRY)
@@ -0,0 +1,84 @@
+import os
+import sys
+import threading
+from collections import Counter
+from types import FrameType
+from typing import Optional
+
+
+class SamplingProfiler:
+    """
+    Сэмплирующий профилировщик потока с циклом событий.
+
+    Фоновый поток раз в interval секунд снимает стек профилируемого потока
+    и считает одинаковые стеки. Результат сохраняется в формате folded stacks
+    ("функция;функция;функция количество"), который принимают flamegraph.pl,
+    speedscope и inferno. Замеряется реальное время: ожидание ввода-вывода
+    попадает в стек цикла событий (select/epoll).
+
+    Профилируется весь поток, поэтому при одновременных запросах в профиль
+    попадают и они.
+    """
+
+    def __init__(self, interval: float, thread_id: Optional[int] = None):
+        """
+        Инициализация профилировщика.
+
+        Args:
+            interval: Интервал между снимками стека в секундах
+            thread_id: Идентификатор профилируемого потока (по умолчанию - текущий)
+        """
+        self.interval = interval
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Запуск сбора снимков стека."""
+        self._thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Остановка сбора снимков стека."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        """Цикл снятия снимков стека."""
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.samples[self._fold(frame)] += 1
+
+    @staticmethod
+    def _fold(frame: FrameType) -> str:
+        """
+        Преобразование стека в строку folded stacks.
+
+        Args:
+            frame: Верхний кадр стека
+
+        Returns:
+            str: Кадры от корня к вершине через ";"
+        """
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+            frame = frame.f_back
+        return ";".join(reversed(names))
+
+    def write(self, path: str) -> None:
+        """
+        Сохранение профиля в формате folded stacks.
+
+        Args:
+            path: Путь к файлу профиля
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as file:
+            for stack, count in self.samples.most_common():
+                file.write(f"{stack} {count}\n")
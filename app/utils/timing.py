@@ -0,0 +1,65 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+
+from prometheus_client import Histogram
+
+# Длительность этапов текущего запроса в секундах (None - замеры не ведутся)
+_stage_timings: ContextVar[Optional[Dict[str, float]]] = ContextVar("stage_timings", default=None)
+
+
+def start_stage_timings() -> Dict[str, float]:
+    """
+    Включение замеров этапов для текущего запроса.
+
+    Словарь общий для всех задач, созданных в контексте запроса (например,
+    через asyncio.gather), поэтому их этапы тоже попадают в замеры.
+
+    Returns:
+        Dict: Длительность этапов в секундах по названию этапа
+    """
+    timings: Dict[str, float] = {}
+    _stage_timings.set(timings)
+    return timings
+
+
+@contextmanager
+def stage(name: str, histogram: Optional[Histogram] = None) -> Iterator[None]:
+    """
+    Замер длительности этапа обработки запроса.
+
+    Время повторяющихся этапов (например, нескольких запросов к БД)
+    суммируется. Вне запроса с включенными замерами время пишется только
+    в гистограмму.
+
+    Args:
+        name: Название этапа для заголовка Server-Timing
+        histogram: Гистограмма Prometheus (с подставленными метками) для этого же замера
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - started
+        if histogram is not None:
+            histogram.observe(elapsed)
+        timings = _stage_timings.get()
+        if timings is not None:
+            timings[name] = timings.get(name, 0.0) + elapsed
+
+
+def format_server_timing(timings: Dict[str, float], total: float) -> str:
+    """
+    Формирование значения заголовка Server-Timing.
+
+    Args:
+        timings: Длительность этапов в секундах
+        total: Общее время обработки запроса в секундах
+
+    Returns:
+        str: Например, "tron_balance;dur=120.5, db_flush;dur=1.2, app;dur=125.0"
+    """
+    parts = [f"{name};dur={elapsed * 1000:.1f}" for name, elapsed in timings.items()]
+    parts.append(f"app;dur={total * 1000:.1f}")
+    return ", ".join(parts)
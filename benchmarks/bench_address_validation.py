@@ -0,0 +1,58 @@
+"""
+Микро-бенчмарк локальной проверки TRON-адресов.
+
+Запуск из корня проекта:
+    python -m benchmarks.bench_address_validation
+"""
+import argparse
+import timeit
+from typing import List, Optional
+
+from tronpy.keys import to_base58check_address
+
+from app.utils import is_valid_tron_address
+from app.utils.address import _check_tron_address
+
+VALID_ADDRESS = "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t"
+INVALID_ADDRESS = "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6u"
+
+
+def bench(name: str, func, number: int) -> None:
+    """
+    Замеряет среднее время вызова и печатает результат.
+
+    Args:
+        name: Название сценария
+        func: Замеряемая функция без аргументов
+        number: Количество вызовов
+    """
+    best = min(timeit.repeat(func, number=number, repeat=5))
+    print(f"{name:<40} {best / number * 1e6:8.3f} мкс/вызов")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Точка входа бенчмарка.
+
+    Args:
+        argv: Аргументы командной строки (None - из sys.argv)
+    """
+    parser = argparse.ArgumentParser(description="Бенчмарк проверки TRON-адресов")
+    parser.add_argument("--number", type=int, default=100000, help="Количество вызовов в замере")
+    args = parser.parse_args(argv)
+
+    # Уникальные адреса, чтобы каждый вызов проходил мимо кеша
+    unique = [to_base58check_address(bytes([0x41]) + i.to_bytes(20, "big")) for i in range(args.number)]
+    cold = iter(unique)
+
+    def validate_cold() -> None:
+        _check_tron_address.__wrapped__(next(cold))
+
+    bench("base58check без кеша", validate_cold, args.number // 5)
+    bench("кеш: корректный адрес", lambda: is_valid_tron_address(VALID_ADDRESS), args.number)
+    bench("кеш: неверная контрольная сумма", lambda: is_valid_tron_address(INVALID_ADDRESS), args.number)
+    bench("отказ по длине", lambda: is_valid_tron_address("T123"), args.number)
+
+
+if __name__ == "__main__":
+    main()
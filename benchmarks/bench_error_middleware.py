@@ -0,0 +1,159 @@
+"""
+Бенчмарк накладных расходов middleware обработки ошибок.
+
+Сравнивает прежнюю реализацию на BaseHTTPMiddleware с ASGI-middleware и
+обработчиками исключений на эндпоинтах /health и /api/v1/tron/address.
+Запросы выполняются в процессе через httpx.ASGITransport, TRON API и БД
+заменены заглушками, поэтому замер показывает только стоимость стека
+приложения.
+
+Запуск из корня проекта:
+    python -m benchmarks.bench_error_middleware
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any, Dict
+
+import httpx
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.api import api_router
+from app.api.deps import get_history_writer, get_tron_service
+from app.core.db import get_db
+from app.exceptions import BaseAppException
+from app.middleware import ErrorHandlerMiddleware, register_exception_handlers
+
+ADDRESS_INFO = {
+    "address": "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t",
+    "bandwidth": "5000",
+    "energy": "2000",
+    "balance": "100.5"
+}
+
+
+class LegacyErrorHandlerMiddleware(BaseHTTPMiddleware):
+    """Прежняя реализация middleware на BaseHTTPMiddleware."""
+
+    async def dispatch(self, request: Request, call_next):
+        try:
+            return await call_next(request)
+        except BaseAppException as e:
+            return JSONResponse(
+                status_code=e.status_code,
+                content={"message": e.message, "detail": e.detail if e.detail else None}
+            )
+        except Exception as e:
+            return JSONResponse(
+                status_code=500,
+                content={"message": "Внутренняя ошибка сервера", "detail": str(e)}
+            )
+
+
+class StubTronService:
+    """Сервис TRON, который сразу возвращает готовый ответ."""
+
+    async def get_cached_address_info(self, address: str, use_cache: bool = True) -> Dict[str, Any]:
+        return dict(ADDRESS_INFO, address=address)
+
+
+class StubHistoryWriter:
+    """Очередь записи истории, которая ничего не сохраняет."""
+
+    async def enqueue(self, data: Dict[str, Any]) -> None:
+        return None
+
+
+async def stub_db():
+    yield None
+
+
+def create_app(legacy: bool) -> FastAPI:
+    """
+    Создает приложение с роутерами сервиса и выбранной обработкой ошибок.
+
+    Args:
+        legacy: True - BaseHTTPMiddleware, False - ASGI-middleware и обработчики исключений
+
+    Returns:
+        FastAPI: Приложение для замера
+    """
+    app = FastAPI()
+    if legacy:
+        app.add_middleware(LegacyErrorHandlerMiddleware)
+    else:
+        register_exception_handlers(app)
+        app.add_middleware(ErrorHandlerMiddleware)
+    app.include_router(api_router, prefix="/api")
+
+    @app.get("/health")
+    async def health_check():
+        return {"status": "ok"}
+
+    app.dependency_overrides[get_tron_service] = StubTronService
+    app.dependency_overrides[get_history_writer] = StubHistoryWriter
+    app.dependency_overrides[get_db] = stub_db
+    return app
+
+
+async def bench(name: str, app: FastAPI, method: str, url: str, number: int, **kwargs) -> None:
+    """
+    Замеряет время запросов и печатает среднее и перцентили.
+
+    Args:
+        name: Название сценария
+        app: Приложение
+        method: HTTP-метод
+        url: Путь запроса
+        number: Количество запросов
+        **kwargs: Параметры запроса httpx
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # Прогрев
+        for _ in range(100):
+            (await client.request(method, url, **kwargs)).raise_for_status()
+
+        timings = []
+        for _ in range(number):
+            started = time.perf_counter()
+            response = await client.request(method, url, **kwargs)
+            timings.append(time.perf_counter() - started)
+            response.raise_for_status()
+
+    timings.sort()
+    mean = statistics.fmean(timings) * 1e6
+    p50 = timings[len(timings) // 2] * 1e6
+    p99 = timings[int(len(timings) * 0.99)] * 1e6
+    print(f"{name:<45} среднее {mean:8.1f} мкс  p50 {p50:8.1f} мкс  p99 {p99:8.1f} мкс")
+
+
+async def run(number: int) -> None:
+    """Запуск всех сценариев."""
+    for legacy in (True, False):
+        app = create_app(legacy)
+        label = "BaseHTTPMiddleware" if legacy else "ASGI-middleware"
+        await bench(f"{label}: GET /health", app, "GET", "/health", number)
+        await bench(
+            f"{label}: POST /api/v1/tron/address",
+            app,
+            "POST",
+            "/api/v1/tron/address",
+            number,
+            json={"address": ADDRESS_INFO["address"]}
+        )
+
+
+def main() -> None:
+    """Точка входа бенчмарка."""
+    parser = argparse.ArgumentParser(description="Бенчмарк middleware обработки ошибок")
+    parser.add_argument("--number", type=int, default=5000, help="Количество запросов в замере")
+    args = parser.parse_args()
+    asyncio.run(run(args.number))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Бенчмарк сериализации страницы истории запросов.
+
+Сравнивает прежний путь (ORM-объекты -> валидация response_model с
+from_attributes -> json.dumps, как в JSONResponse) с текущим (строки колонок
+-> history_item -> orjson). Запросы к БД в замер не входят.
+
+Запуск из корня проекта:
+    python -m benchmarks.bench_history_serialization
+"""
+import argparse
+import json
+import timeit
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, Dict, List, Tuple
+
+import orjson
+from pydantic import TypeAdapter
+
+from app.models import AddressQuery
+from app.schemas import AddressQueryResponse, PaginatedResponse, history_item
+
+ADDRESS = "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t"
+
+
+def make_rows(size: int) -> List[Tuple]:
+    """
+    Создает строки колонок истории.
+
+    Args:
+        size: Количество строк
+
+    Returns:
+        List[Tuple]: Строки (id, address, bandwidth, energy, balance, created_at)
+    """
+    started = datetime(2025, 1, 1)
+    return [
+        (uuid.uuid4(), ADDRESS, 5000 + i, 2000 + i, Decimal("100.500000") + i, started + timedelta(seconds=i, microseconds=i))
+        for i in range(size)
+    ]
+
+
+def make_page(items: List[Any]) -> Dict[str, Any]:
+    """
+    Создает страницу истории в формате AddressRepository.get_history.
+
+    Args:
+        items: Элементы страницы
+
+    Returns:
+        Dict: Страница истории
+    """
+    return {"items": items, "total": 1000, "page": 1, "limit": len(items), "pages": 10, "next_page": 2, "prev_page": None}
+
+
+def main() -> None:
+    """Точка входа бенчмарка."""
+    parser = argparse.ArgumentParser(description="Бенчмарк сериализации истории")
+    parser.add_argument("--size", type=int, default=100, help="Количество элементов на странице")
+    parser.add_argument("--number", type=int, default=500, help="Количество сериализаций в замере")
+    args = parser.parse_args()
+
+    adapter = TypeAdapter(PaginatedResponse[AddressQueryResponse])
+    rows = make_rows(args.size)
+    fields = ("id", "address", "bandwidth", "energy", "balance", "created_at")
+    orm_page = make_page([AddressQuery(**dict(zip(fields, row))) for row in rows])
+    row_page = make_page(rows)
+
+    def before() -> bytes:
+        # Так FastAPI обрабатывает ответ с response_model и JSONResponse
+        content = adapter.dump_python(adapter.validate_python(orm_page, from_attributes=True), mode="json")
+        return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+    def after() -> bytes:
+        return orjson.dumps({**row_page, "items": [history_item(row) for row in row_page["items"]]})
+
+    assert json.loads(before()) == json.loads(after())
+
+    for name, func in (("response_model + json", before), ("history_item + orjson", after)):
+        best = min(timeit.repeat(func, number=args.number, repeat=5))
+        print(f"{name:<25} {best / args.number * 1e6:9.1f} мкс/страница ({args.size} элементов)")
+
+
+if __name__ == "__main__":
+    main()
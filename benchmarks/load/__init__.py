@@ -0,0 +1,6 @@
+"""
+Нагрузочный бенчмарк сервиса с локальным фейковым узлом TRON.
+
+Запуск из корня проекта:
+    python -m benchmarks.load --concurrency 1,10,50 --duration 10
+"""
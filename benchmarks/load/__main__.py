@@ -0,0 +1,295 @@
+"""
+Нагрузочный бенчмарк: задержка (p50/p95/p99) и пропускная способность.
+
+Запускает фейковый узел TRON и приложение отдельными процессами (или
+использует уже запущенный сервис по --url), нагружает сценарии health,
+address и history с заданной конкурентностью и сохраняет результаты в JSON
+для сравнения запусков.
+
+Запуск из корня проекта:
+    python -m benchmarks.load --concurrency 1,10,50 --duration 10 --node-delay 0.05
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+from tronpy.keys import to_base58check_address
+
+SCENARIOS = ("health", "address", "history")
+
+
+def make_request_factory(scenario: str, addresses: List[str]) -> Callable[[], Tuple[str, str, Optional[Dict]]]:
+    """
+    Фабрика запросов сценария.
+
+    Args:
+        scenario: Название сценария
+        addresses: Адреса для сценария address
+
+    Returns:
+        Callable: Функция, возвращающая (метод, путь, JSON-тело)
+    """
+    if scenario == "health":
+        return lambda: ("GET", "/health", None)
+    if scenario == "address":
+        return lambda: ("POST", "/api/v1/tron/address", {"address": random.choice(addresses)})
+    if scenario == "history":
+        return lambda: ("GET", "/api/v1/tron/history?limit=100&include_total=false", None)
+    raise ValueError(f"Неизвестный сценарий: {scenario}")
+
+
+def percentile(values: List[float], q: float) -> float:
+    """
+    Перцентиль по методу ближайшего ранга.
+
+    Args:
+        values: Отсортированные значения
+        q: Перцентиль от 0 до 100
+
+    Returns:
+        float: Значение перцентиля
+    """
+    if not values:
+        return 0.0
+    index = max(0, min(len(values) - 1, int(round(q / 100 * len(values) + 0.5)) - 1))
+    return values[index]
+
+
+async def run_scenario(
+        client: httpx.AsyncClient,
+        scenario: str,
+        concurrency: int,
+        duration: float,
+        warmup: float,
+        addresses: List[str]
+) -> Dict[str, Any]:
+    """
+    Нагрузка одного сценария с заданной конкурентностью.
+
+    Каждый из concurrency воркеров отправляет запросы один за другим, пока не
+    истечет duration. Запросы в первые warmup секунд не учитываются.
+
+    Args:
+        client: HTTP-клиент
+        scenario: Название сценария
+        concurrency: Количество одновременных запросов
+        duration: Длительность замера в секундах (без прогрева)
+        warmup: Длительность прогрева в секундах
+        addresses: Адреса для сценария address
+
+    Returns:
+        Dict: Количество запросов, ошибок, RPS и перцентили задержки
+    """
+    make_request = make_request_factory(scenario, addresses)
+    latencies: List[float] = []
+    errors: Dict[str, int] = {}
+    started = time.perf_counter()
+    measure_from = started + warmup
+    deadline = measure_from + duration
+
+    async def worker() -> None:
+        while True:
+            request_started = time.perf_counter()
+            if request_started >= deadline:
+                return
+            method, path, body = make_request()
+            try:
+                response = await client.request(method, path, json=body)
+                error = None if response.status_code < 400 else str(response.status_code)
+            except httpx.HTTPError as e:
+                error = type(e).__name__
+            finished = time.perf_counter()
+            if request_started < measure_from:
+                continue
+            latencies.append(finished - request_started)
+            if error is not None:
+                errors[error] = errors.get(error, 0) + 1
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - measure_from
+
+    latencies.sort()
+    return {
+        "scenario": scenario,
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": sum(errors.values()),
+        "errors_by_status": errors,
+        "duration_s": round(elapsed, 3),
+        "rps": round(len(latencies) / elapsed, 1) if elapsed > 0 else 0.0,
+        "latency_ms": {
+            "p50": round(percentile(latencies, 50) * 1000, 3),
+            "p95": round(percentile(latencies, 95) * 1000, 3),
+            "p99": round(percentile(latencies, 99) * 1000, 3),
+            "mean": round(sum(latencies) / len(latencies) * 1000, 3) if latencies else 0.0,
+            "max": round(latencies[-1] * 1000, 3) if latencies else 0.0
+        }
+    }
+
+
+def start_server(args: List[str]) -> subprocess.Popen:
+    """
+    Запуск сервера бенчмарка отдельным процессом.
+
+    Args:
+        args: Аргументы benchmarks.load.servers
+
+    Returns:
+        subprocess.Popen: Процесс сервера
+    """
+    return subprocess.Popen([sys.executable, "-m", "benchmarks.load.servers", *args])
+
+
+async def wait_ready(url: str, method: str = "GET", timeout: float = 30.0) -> None:
+    """
+    Ожидание готовности сервера.
+
+    Args:
+        url: URL для проверки
+        method: HTTP-метод проверки
+        timeout: Максимальное время ожидания в секундах
+
+    Raises:
+        RuntimeError: Если сервер не ответил за timeout
+    """
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            try:
+                await client.request(method, url)
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.2)
+    raise RuntimeError(f"Сервер {url} не запустился за {timeout} с")
+
+
+def git_revision() -> Optional[str]:
+    """Текущий коммит репозитория (если доступен)."""
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Запуск серверов и всех замеров.
+
+    Args:
+        args: Параметры командной строки
+
+    Returns:
+        Dict: Отчет бенчмарка
+    """
+    processes: List[subprocess.Popen] = []
+    base_url = args.url
+    try:
+        if base_url is None:
+            node_url = f"http://127.0.0.1:{args.node_port}"
+            processes.append(start_server([
+                "node",
+                "--port", str(args.node_port),
+                "--delay", str(args.node_delay),
+                "--jitter", str(args.node_jitter),
+                "--error-rate", str(args.node_error_rate)
+            ]))
+            await wait_ready(f"{node_url}/wallet/getnowblock", method="POST")
+            processes.append(start_server([
+                "app",
+                "--port", str(args.app_port),
+                "--node-url", node_url,
+                "--db", args.db,
+                "--seed-rows", str(args.seed_rows)
+            ]))
+            base_url = f"http://127.0.0.1:{args.app_port}"
+        await wait_ready(f"{base_url}/health")
+
+        addresses = [to_base58check_address(bytes([0x41]) + i.to_bytes(20, "big")) for i in range(args.addresses)]
+        results = []
+        for scenario in args.scenarios:
+            for concurrency in args.concurrency:
+                limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+                async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=args.timeout) as client:
+                    result = await run_scenario(client, scenario, concurrency, args.duration, args.warmup, addresses)
+                results.append(result)
+                latency = result["latency_ms"]
+                print(
+                    f"{scenario:<8} c={concurrency:<4} {result['rps']:>9.1f} rps  "
+                    f"p50 {latency['p50']:>8.2f} мс  p95 {latency['p95']:>8.2f} мс  p99 {latency['p99']:>8.2f} мс  "
+                    f"ошибок {result['errors']}"
+                )
+    finally:
+        for process in reversed(processes):
+            process.terminate()
+            process.wait(timeout=10)
+
+    return {
+        "started_at": datetime.now(timezone.utc).isoformat(),
+        "revision": git_revision(),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count()
+        },
+        "config": {
+            "url": args.url,
+            "db": args.db,
+            "duration_s": args.duration,
+            "warmup_s": args.warmup,
+            "addresses": args.addresses,
+            "node_delay_s": args.node_delay,
+            "node_jitter_s": args.node_jitter,
+            "node_error_rate": args.node_error_rate
+        },
+        "results": results
+    }
+
+
+def main() -> None:
+    """Точка входа бенчмарка."""
+    parser = argparse.ArgumentParser(description="Нагрузочный бенчмарк сервиса")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="Сценарии через запятую: health,address,history")
+    parser.add_argument("--concurrency", default="1,10,50", help="Уровни конкурентности через запятую")
+    parser.add_argument("--duration", type=float, default=10.0, help="Длительность замера каждого уровня в секундах")
+    parser.add_argument("--warmup", type=float, default=2.0, help="Прогрев перед замером в секундах")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Таймаут запроса в секундах")
+    parser.add_argument("--addresses", type=int, default=1000, help="Количество разных адресов в сценарии address")
+    parser.add_argument("--url", default=None, help="URL уже запущенного сервиса (без запуска серверов)")
+    parser.add_argument("--app-port", type=int, default=18000, help="Порт приложения")
+    parser.add_argument("--node-port", type=int, default=18001, help="Порт фейкового узла TRON")
+    parser.add_argument("--node-delay", type=float, default=0.05, help="Задержка фейкового узла в секундах")
+    parser.add_argument("--node-jitter", type=float, default=0.01, help="Случайная добавка к задержке узла в секундах")
+    parser.add_argument("--node-error-rate", type=float, default=0.0, help="Доля ответов 503 фейкового узла")
+    parser.add_argument("--db", choices=("sqlite", "postgres"), default="sqlite", help="База данных приложения")
+    parser.add_argument("--seed-rows", type=int, default=1000, help="Записей истории в SQLite перед замером")
+    parser.add_argument("--output", default=None, help="Файл JSON с результатами (по умолчанию benchmarks/results/)")
+    args = parser.parse_args()
+
+    args.scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    for name in args.scenarios:
+        if name not in SCENARIOS:
+            parser.error(f"Неизвестный сценарий: {name}")
+    args.concurrency = [int(value) for value in args.concurrency.split(",")]
+
+    report = asyncio.run(run(args))
+
+    output = args.output or os.path.join(
+        "benchmarks", "results", f"load-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(report, file, ensure_ascii=False, indent=2)
+    print(f"Результаты сохранены: {output}")
+
+
+if __name__ == "__main__":
+    main()
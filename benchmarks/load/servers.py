@@ -0,0 +1,140 @@
+"""
+Серверы для нагрузочного бенчмарка: фейковый узел TRON и тестируемое приложение.
+
+Запускаются отдельными процессами из benchmarks.load, чтобы генератор нагрузки
+не делил цикл событий с сервером:
+    python -m benchmarks.load.servers node --port 18001 --delay 0.05 --error-rate 0.01
+    python -m benchmarks.load.servers app --port 18000 --node-url http://127.0.0.1:18001
+"""
+import argparse
+import json
+import os
+import tempfile
+import uuid
+from datetime import datetime, timedelta
+from decimal import Decimal
+
+import uvicorn
+
+
+def run_node(args: argparse.Namespace) -> None:
+    """
+    Запуск фейкового узла TRON.
+
+    Args:
+        args: Параметры командной строки
+    """
+    from app.tests.fake_node import FakeTronNode
+
+    node = FakeTronNode(delay=args.delay, jitter=args.jitter, error_rate=args.error_rate)
+    uvicorn.run(node.app, host=args.host, port=args.port, log_level="warning")
+
+
+def run_app(args: argparse.Namespace) -> None:
+    """
+    Запуск приложения с одним рабочим процессом.
+
+    Узлы TRON заменяются фейковым узлом. При --db sqlite база создается во
+    временном файле и заполняется --seed-rows записями истории; при --db
+    postgres используется БД из настроек (.env) с примененными миграциями.
+
+    Args:
+        args: Параметры командной строки
+    """
+    # Настройки по умолчанию для замера; переменные окружения имеют приоритет
+    os.environ.setdefault("TRON_NODE_URLS", json.dumps([args.node_url]))
+    os.environ.setdefault("TRON_RATE_LIMIT_ENABLED", "False")
+    os.environ.setdefault("HISTORY_PARTITION_MAINTENANCE", "False")
+    os.environ.setdefault("WATCHLIST_POLL_ENABLED", "False")
+    os.environ.setdefault("LOG_LEVEL", "WARNING")
+
+    from app.main import app
+
+    if args.db == "sqlite":
+        from sqlalchemy import create_engine, insert
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+        from sqlalchemy.pool import NullPool
+
+        from app.core import Base, get_db, get_session_factory
+        from app.models import AddressQuery
+
+        path = os.path.join(tempfile.gettempdir(), f"tron_tracker_load_{os.getpid()}.db")
+        engine = create_engine(f"sqlite:///{path}")
+        Base.metadata.drop_all(engine)
+        Base.metadata.create_all(engine)
+        started = datetime.utcnow() - timedelta(days=1)
+        rows = [
+            {
+                "id": uuid.uuid4(),
+                "address": "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t",
+                "bandwidth": 5000,
+                "energy": 2000,
+                "balance": Decimal("100.5"),
+                "created_at": started + timedelta(seconds=i),
+                "updated_at": started + timedelta(seconds=i)
+            }
+            for i in range(args.seed_rows)
+        ]
+        with engine.begin() as connection:
+            connection.exec_driver_sql("PRAGMA journal_mode=WAL")
+            if rows:
+                connection.execute(insert(AddressQuery), rows)
+        engine.dispose()
+
+        async_engine = create_async_engine(
+            f"sqlite+aiosqlite:///{path}",
+            poolclass=NullPool,
+            connect_args={"timeout": 30}
+        )
+        session_factory = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+        async def sqlite_db():
+            async with session_factory() as db:
+                try:
+                    yield db
+                    await db.commit()
+                except Exception:
+                    await db.rollback()
+                    raise
+
+        app.dependency_overrides[get_db] = sqlite_db
+        app.dependency_overrides[get_session_factory] = lambda: session_factory
+
+    uvicorn.run(
+        app,
+        host=args.host,
+        port=args.port,
+        loop="uvloop",
+        http="httptools",
+        log_level="warning",
+        access_log=False
+    )
+
+
+def main() -> None:
+    """Точка входа."""
+    parser = argparse.ArgumentParser(description="Серверы нагрузочного бенчмарка")
+    subparsers = parser.add_subparsers(dest="server", required=True)
+
+    node = subparsers.add_parser("node", help="Фейковый узел TRON")
+    node.add_argument("--host", default="127.0.0.1")
+    node.add_argument("--port", type=int, default=18001)
+    node.add_argument("--delay", type=float, default=0.0, help="Задержка ответа в секундах")
+    node.add_argument("--jitter", type=float, default=0.0, help="Случайная добавка к задержке в секундах")
+    node.add_argument("--error-rate", type=float, default=0.0, help="Доля ответов 503")
+    node.set_defaults(func=run_node)
+
+    app = subparsers.add_parser("app", help="Тестируемое приложение")
+    app.add_argument("--host", default="127.0.0.1")
+    app.add_argument("--port", type=int, default=18000)
+    app.add_argument("--node-url", default="http://127.0.0.1:18001", help="URL фейкового узла TRON")
+    app.add_argument("--db", choices=("sqlite", "postgres"), default="sqlite", help="База данных")
+    app.add_argument("--seed-rows", type=int, default=1000, help="Записей истории в SQLite перед замером")
+    app.set_defaults(func=run_app)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
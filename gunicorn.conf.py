@@ -0,0 +1,56 @@
+"""
+Конфигурация gunicorn для продакшен-запуска.
+
+Запуск:
+    gunicorn app.main:app -c gunicorn.conf.py
+
+Каждый рабочий процесс - отдельный uvicorn (uvloop + httptools) со своим
+пулом соединений с БД и клиентом TRON API. Процессы перезапускаются после
+SERVER_MAX_REQUESTS запросов (со случайным разбросом), текущие запросы
+при этом дообрабатываются в течение SERVER_GRACEFUL_TIMEOUT секунд.
+Миграции в этой конфигурации не выполняются: их применяют отдельным
+шагом (alembic upgrade head) до запуска сервера.
+"""
+import multiprocessing
+import os
+import shutil
+import tempfile
+
+from app.config import settings
+
+bind = f"{settings.SERVER_HOST}:{settings.SERVER_PORT}"
+workers = settings.SERVER_WORKERS or multiprocessing.cpu_count()
+worker_class = "app.server.UvicornWorker"
+
+# Перезапуск рабочих процессов для защиты от накопления памяти
+max_requests = settings.SERVER_MAX_REQUESTS
+max_requests_jitter = settings.SERVER_MAX_REQUESTS_JITTER
+graceful_timeout = settings.SERVER_GRACEFUL_TIMEOUT
+timeout = settings.SERVER_TIMEOUT
+keepalive = settings.SERVER_KEEPALIVE
+
+# Приложение загружается в каждом рабочем процессе, а не до fork:
+# пул соединений с БД и фоновые задачи нельзя разделять между процессами
+preload_app = False
+
+# Логи запросов пишет приложение
+accesslog = None
+
+# Общий каталог метрик Prometheus для всех рабочих процессов
+metrics_dir = os.environ.setdefault(
+    "PROMETHEUS_MULTIPROC_DIR",
+    os.path.join(tempfile.gettempdir(), "tron_tracker_metrics")
+)
+
+
+def on_starting(server):
+    """Очистка метрик предыдущего запуска."""
+    shutil.rmtree(metrics_dir, ignore_errors=True)
+    os.makedirs(metrics_dir, exist_ok=True)
+
+
+def child_exit(server, worker):
+    """Удаление метрик остановленного рабочего процесса."""
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
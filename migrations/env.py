@@ -1,13 +1,16 @@
+import logging
 from logging.config import fileConfig
 
 from sqlalchemy import engine_from_config
-from sqlalchemy import pool
+from sqlalchemy import inspect, pool, text
+from sqlalchemy.engine import Connection
 
 from alembic import context
+from alembic.script import ScriptDirectory
 
 from app.config import settings
 from app.core import Base
-from app.models import AddressQuery
+from app.models import AddressQuery, WatchedAddress
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -18,6 +21,8 @@ config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
+logger = logging.getLogger("alembic.env")
+
 # add your model's MetaData object here
 # for 'autogenerate' support
 # from myapp import mymodel
@@ -31,6 +36,39 @@ target_metadata = Base.metadata
 
 config.set_main_option("sqlalchemy.url", str(settings.DATABASE_URI))
 
+# Базовая ревизия: схема, которую создавала автогенерация миграций при запуске
+# в прежних версиях сервиса
+BASE_REVISION = "3f1c2a9b7d10"
+
+
+def stamp_legacy_database(connection: Connection) -> None:
+    """
+    Переводит БД, созданную прежней автогенерацией миграций, на базовую ревизию.
+
+    Такие БД хранят в alembic_version ревизию, которой нет в migrations/versions,
+    и alembic upgrade head на них завершается ошибкой. Если ни одна записанная
+    ревизия не известна, а таблица истории уже есть, ревизия заменяется на
+    базовую (аналог alembic stamp 3f1c2a9b7d10), и дальше применяются
+    только последующие миграции.
+
+    Args:
+        connection: Соединение с БД
+    """
+    inspector = inspect(connection)
+    if not inspector.has_table("alembic_version") or not inspector.has_table("addressquery"):
+        return
+
+    recorded = connection.execute(text("SELECT version_num FROM alembic_version")).scalars().all()
+    known = {script.revision for script in ScriptDirectory.from_config(config).walk_revisions()}
+    if not recorded or any(revision in known for revision in recorded):
+        return
+
+    logger.warning("Ревизии %s нет в migrations/versions, БД переведена на базовую ревизию %s", recorded, BASE_REVISION)
+    connection.execute(text("DELETE FROM alembic_version"))
+    connection.execute(text("INSERT INTO alembic_version (version_num) VALUES (:revision)"), {"revision": BASE_REVISION})
+    connection.commit()
+
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -69,6 +107,7 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
+        stamp_legacy_database(connection)
         context.configure(
             connection=connection, target_metadata=target_metadata
         )
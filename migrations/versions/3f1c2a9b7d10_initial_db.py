@@ -0,0 +1,39 @@
+"""Initial db
+
+Revision ID: 3f1c2a9b7d10
+Revises: 
+Create Date: 2025-02-01 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c2a9b7d10'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'addressquery',
+        sa.Column('address', sa.String(), nullable=False, comment='TRON-адрес, для которого был выполнен запрос'),
+        sa.Column('bandwidth', sa.String(), nullable=True, comment='Bandwidth адреса (в единицах TRON) на момент запроса'),
+        sa.Column('energy', sa.String(), nullable=True, comment='Energy адреса (в единицах TRON) на момент запроса'),
+        sa.Column('balance', sa.String(), nullable=True, comment='Баланс адреса в TRX на момент запроса'),
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_addressquery_address'), 'addressquery', ['address'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_addressquery_address'), table_name='addressquery')
+    op.drop_table('addressquery')
@@ -0,0 +1,38 @@
+"""Add (created_at, id) index for keyset pagination
+
+Revision ID: 8b4e6d2c1a07
+Revises: 3f1c2a9b7d10
+Create Date: 2025-02-10 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b4e6d2c1a07'
+down_revision: Union[str, None] = '3f1c2a9b7d10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Индекс строится без блокировки записи в таблицу
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_addressquery_created_at_id',
+            'addressquery',
+            ['created_at', 'id'],
+            unique=False,
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_addressquery_created_at_id',
+            table_name='addressquery',
+            postgresql_concurrently=True
+        )
@@ -0,0 +1,36 @@
+"""Composite (address, created_at DESC, id DESC) index for per-address history
+
+Revision ID: a4c2e8f1b3d5
+Revises: e7a3b8c4d6f1
+Create Date: 2025-02-26 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c2e8f1b3d5'
+down_revision: Union[str, None] = 'e7a3b8c4d6f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Индекс на секционированной таблице создается во всех секциях;
+    # CONCURRENTLY для секционированных таблиц PostgreSQL не поддерживает
+    op.create_index(
+        'ix_addressquery_address_created_at',
+        'addressquery',
+        ['address', sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False
+    )
+    # Префикс составного индекса полностью заменяет одиночный индекс по address
+    op.drop_index('ix_addressquery_address', table_name='addressquery')
+
+
+def downgrade() -> None:
+    op.create_index('ix_addressquery_address', 'addressquery', ['address'], unique=False)
+    op.drop_index('ix_addressquery_address_created_at', table_name='addressquery')
@@ -0,0 +1,40 @@
+"""Watched addresses for the watchlist poller
+
+Revision ID: b7e2d4f6a8c1
+Revises: a4c2e8f1b3d5
+Create Date: 2025-03-05 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2d4f6a8c1'
+down_revision: Union[str, None] = 'a4c2e8f1b3d5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'watchedaddress',
+        sa.Column('address', sa.String(), nullable=False, comment='Отслеживаемый TRON-адрес'),
+        sa.Column('label', sa.String(), nullable=True, comment='Произвольная метка адреса'),
+        sa.Column('bandwidth', sa.BigInteger(), nullable=True, comment='Последний известный bandwidth адреса'),
+        sa.Column('energy', sa.BigInteger(), nullable=True, comment='Последняя известная energy адреса'),
+        sa.Column('balance', sa.Numeric(38, 6), nullable=True, comment='Последний известный баланс адреса в TRX'),
+        sa.Column('changed_at', sa.DateTime(), nullable=True, comment='Время последнего изменения значений адреса'),
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('address')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('watchedaddress')
@@ -0,0 +1,70 @@
+"""Store bandwidth, energy and balance as numbers
+
+Revision ID: c5d9e1f3a2b4
+Revises: 8b4e6d2c1a07
+Create Date: 2025-02-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5d9e1f3a2b4'
+down_revision: Union[str, None] = '8b4e6d2c1a07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Существующие строковые значения переносятся приведением типа при смене колонки;
+    # пустые и нечисловые строки становятся NULL
+    op.alter_column(
+        'addressquery', 'bandwidth',
+        existing_type=sa.String(),
+        type_=sa.BigInteger(),
+        existing_nullable=True,
+        postgresql_using="CASE WHEN bandwidth ~ '^-?[0-9]+$' THEN bandwidth::bigint END"
+    )
+    op.alter_column(
+        'addressquery', 'energy',
+        existing_type=sa.String(),
+        type_=sa.BigInteger(),
+        existing_nullable=True,
+        postgresql_using="CASE WHEN energy ~ '^-?[0-9]+$' THEN energy::bigint END"
+    )
+    op.alter_column(
+        'addressquery', 'balance',
+        existing_type=sa.String(),
+        type_=sa.Numeric(38, 6),
+        existing_nullable=True,
+        postgresql_using="CASE WHEN balance ~ '^-?[0-9]+(\\.[0-9]+)?$' THEN balance::numeric(38, 6) END"
+    )
+    op.create_index('ix_addressquery_balance', 'addressquery', ['balance'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_addressquery_balance', table_name='addressquery')
+    op.alter_column(
+        'addressquery', 'balance',
+        existing_type=sa.Numeric(38, 6),
+        type_=sa.String(),
+        existing_nullable=True,
+        postgresql_using="trim_scale(balance)::varchar"
+    )
+    op.alter_column(
+        'addressquery', 'energy',
+        existing_type=sa.BigInteger(),
+        type_=sa.String(),
+        existing_nullable=True,
+        postgresql_using="energy::varchar"
+    )
+    op.alter_column(
+        'addressquery', 'bandwidth',
+        existing_type=sa.BigInteger(),
+        type_=sa.String(),
+        existing_nullable=True,
+        postgresql_using="bandwidth::varchar"
+    )
@@ -0,0 +1,105 @@
+"""Partition addressquery by month on created_at
+
+Revision ID: e7a3b8c4d6f1
+Revises: c5d9e1f3a2b4
+Create Date: 2025-02-24 12:00:00.000000
+
+"""
+from datetime import date, datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7a3b8c4d6f1'
+down_revision: Union[str, None] = 'c5d9e1f3a2b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Сколько будущих месяцев создать сразу (дальше их создает фоновая задача)
+PARTITIONS_AHEAD = 3
+
+COLUMNS = "id, created_at, updated_at, address, bandwidth, energy, balance"
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_month_partition(month: date) -> None:
+    op.execute(
+        f"CREATE TABLE IF NOT EXISTS addressquery_p{month:%Y%m} PARTITION OF addressquery "
+        f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_add_months(month, 1).isoformat()}')"
+    )
+
+
+def upgrade() -> None:
+    # Старую таблицу переименовываем вместе с ключом и индексами, чтобы освободить имена
+    op.rename_table('addressquery', 'addressquery_legacy')
+    op.execute("ALTER TABLE addressquery_legacy RENAME CONSTRAINT addressquery_pkey TO addressquery_legacy_pkey")
+    op.execute("ALTER INDEX ix_addressquery_address RENAME TO ix_addressquery_legacy_address")
+    op.execute("ALTER INDEX ix_addressquery_balance RENAME TO ix_addressquery_legacy_balance")
+    op.execute("DROP INDEX ix_addressquery_created_at_id")
+
+    # Ключ секционирования обязан входить в первичный ключ; (created_at, id)
+    # одновременно заменяет индекс для keyset-пагинации
+    op.create_table(
+        'addressquery',
+        sa.Column('address', sa.String(), nullable=False, comment='TRON-адрес, для которого был выполнен запрос'),
+        sa.Column('bandwidth', sa.BigInteger(), nullable=True, comment='Bandwidth адреса (в единицах TRON) на момент запроса'),
+        sa.Column('energy', sa.BigInteger(), nullable=True, comment='Energy адреса (в единицах TRON) на момент запроса'),
+        sa.Column('balance', sa.Numeric(38, 6), nullable=True, comment='Баланс адреса в TRX на момент запроса'),
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('created_at', 'id'),
+        postgresql_partition_by='RANGE (created_at)'
+    )
+
+    # Секции за весь период существующих данных и на несколько месяцев вперед
+    first_created_at = op.get_bind().execute(sa.text("SELECT MIN(created_at) FROM addressquery_legacy")).scalar()
+    today = datetime.utcnow().date()
+    month = (first_created_at or datetime.utcnow()).date().replace(day=1)
+    last_month = _add_months(today.replace(day=1), PARTITIONS_AHEAD)
+    while month <= last_month:
+        _create_month_partition(month)
+        month = _add_months(month, 1)
+
+    # Секция по умолчанию страхует вставки, если фоновая задача не успела создать секцию
+    op.execute("CREATE TABLE addressquery_default PARTITION OF addressquery DEFAULT")
+
+    op.execute(f"INSERT INTO addressquery ({COLUMNS}) SELECT {COLUMNS} FROM addressquery_legacy")
+    op.drop_table('addressquery_legacy')
+
+    op.create_index(op.f('ix_addressquery_address'), 'addressquery', ['address'], unique=False)
+    op.create_index('ix_addressquery_balance', 'addressquery', ['balance'], unique=False)
+
+
+def downgrade() -> None:
+    op.rename_table('addressquery', 'addressquery_partitioned')
+    op.execute("ALTER TABLE addressquery_partitioned RENAME CONSTRAINT addressquery_pkey TO addressquery_partitioned_pkey")
+    op.execute("ALTER INDEX ix_addressquery_address RENAME TO ix_addressquery_partitioned_address")
+    op.execute("ALTER INDEX ix_addressquery_balance RENAME TO ix_addressquery_partitioned_balance")
+
+    op.create_table(
+        'addressquery',
+        sa.Column('address', sa.String(), nullable=False, comment='TRON-адрес, для которого был выполнен запрос'),
+        sa.Column('bandwidth', sa.BigInteger(), nullable=True, comment='Bandwidth адреса (в единицах TRON) на момент запроса'),
+        sa.Column('energy', sa.BigInteger(), nullable=True, comment='Energy адреса (в единицах TRON) на момент запроса'),
+        sa.Column('balance', sa.Numeric(38, 6), nullable=True, comment='Баланс адреса в TRX на момент запроса'),
+        sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.execute(f"INSERT INTO addressquery ({COLUMNS}) SELECT {COLUMNS} FROM addressquery_partitioned")
+    # Секции удаляются вместе с родительской таблицей
+    op.drop_table('addressquery_partitioned')
+
+    op.create_index(op.f('ix_addressquery_address'), 'addressquery', ['address'], unique=False)
+    op.create_index('ix_addressquery_balance', 'addressquery', ['balance'], unique=False)
+    op.create_index('ix_addressquery_created_at_id', 'addressquery', ['created_at', 'id'], unique=False)